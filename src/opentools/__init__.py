@@ -1,14 +1,50 @@
 from __future__ import annotations
 
+import importlib
+from typing import TYPE_CHECKING, Any
+
 from . import trading
-from .adapters.models.anthropic.chat import run_with_tools as anthropic_chat
-from .adapters.models.gemini.chat import run_with_tools as gemini_chat
-from .adapters.models.ollama.chat import run_with_tools as ollama_chat
-from .adapters.models.openai.chat import run_with_tools as openai_chat
-from .adapters.models.openrouter.chat import run_with_tools as openrouter_chat
+from .core.session import AgentSession, HistoryPolicy
 from .trading import alpaca, coinbase
 
+if TYPE_CHECKING:
+    from .adapters.models.anthropic.chat import run_with_tools as anthropic_chat
+    from .adapters.models.gemini.chat import run_with_tools as gemini_chat
+    from .adapters.models.ollama.chat import run_with_tools as ollama_chat
+    from .adapters.models.openai.chat import run_with_tools as openai_chat
+    from .adapters.models.openrouter.chat import run_with_tools as openrouter_chat
+
+# chat adapters pull in their model SDK, so they are imported on first access
+_LAZY_EXPORTS: dict[str, tuple[str, str]] = {
+    "anthropic_chat": ("opentools.adapters.models.anthropic.chat", "run_with_tools"),
+    "gemini_chat": ("opentools.adapters.models.gemini.chat", "run_with_tools"),
+    "ollama_chat": ("opentools.adapters.models.ollama.chat", "run_with_tools"),
+    "openai_chat": ("opentools.adapters.models.openai.chat", "run_with_tools"),
+    "openrouter_chat": (
+        "opentools.adapters.models.openrouter.chat",
+        "run_with_tools",
+    ),
+}
+
+
+def __getattr__(name: str) -> Any:
+    target = _LAZY_EXPORTS.get(name)
+    if target is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    module_name, attr = target
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted({*globals(), *_LAZY_EXPORTS})
+
+
 __all__ = [
+    "AgentSession",
+    "HistoryPolicy",
     "trading",
     "alpaca",
     "coinbase",
@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import hashlib
+import json
 from typing import (
     Any,
     Dict,
@@ -49,10 +51,30 @@ def _resolve_fatal_kinds(
     )
 
 
+# generated args models, keyed by (model name, schema hash)
+_ARGS_MODEL_CACHE: Dict[Tuple[str, str], type[BaseModel]] = {}
+
+
+def _schema_hash(schema: Dict[str, Any]) -> str:
+    encoded = json.dumps(schema, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
 def _json_schema_to_model(name: str, schema: Dict[str, Any]) -> type[BaseModel]:
     if schema.get("type") != "object":
         return _EmptyArgs
 
+    key = (name, _schema_hash(schema))
+    cached = _ARGS_MODEL_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    model = _build_args_model(name, schema)
+    _ARGS_MODEL_CACHE[key] = model
+    return model
+
+
+def _build_args_model(name: str, schema: Dict[str, Any]) -> type[BaseModel]:
     props: Dict[str, Any] = schema.get("properties", {}) or {}
     required = set(schema.get("required", []))
 
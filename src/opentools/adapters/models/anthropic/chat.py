@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import json
-from typing import Any, List, Tuple, cast
+from typing import Any, AsyncIterator, List, Tuple, cast
 
 import anthropic
 from anthropic import AsyncAnthropic
@@ -15,12 +14,15 @@ from opentools.core.errors import (
     TransientError,
     ValidationError,
 )
-from opentools.core.tool_policy import raise_if_fatal_tool_error
-from opentools.core.tool_runner import ToolRunner
-
-
-def _dump(x: Any) -> str:
-    return json.dumps(x, indent=2, default=str)
+from opentools.core.memo import ToolMemo, with_tool_memo
+from opentools.core.results import DEFAULT_RESULT_ENCODER, ResultEncoder, RunSummary
+from opentools.core.tool_runner import (
+    DEFAULT_TOOL_CONCURRENCY,
+    ToolCall,
+    ToolDispatcher,
+    ToolRunner,
+    run_tool_calls,
+)
 
 
 def _tool_validation_error(
@@ -64,6 +66,62 @@ def _wrap_anthropic_error(exc: Exception) -> OpenToolsError:
     return ProviderError(**base_kwargs)
 
 
+_EPHEMERAL = {"type": "ephemeral"}
+
+
+def _cacheable_tools(tools: list[Any]) -> list[Any]:
+    """
+    Copy of the tool list with a cache breakpoint on the last tool, so the
+    whole tool block is cached as one prefix.
+    """
+    if not tools or not isinstance(tools[-1], dict):
+        return tools
+    return [*tools[:-1], {**tools[-1], "cache_control": _EPHEMERAL}]
+
+
+def _with_cache_breakpoint(messages: List[MessageParam]) -> List[MessageParam]:
+    """
+    Request-time copy of the conversation with a single breakpoint on the
+    last block, caching everything before it for the next round. Only one
+    breakpoint is kept, staying well under Anthropic's limit of four.
+    """
+    if not messages:
+        return messages
+
+    last = messages[-1]
+    content = last.get("content")
+    if isinstance(content, str):
+        blocks: list[Any] = [{"type": "text", "text": content}]
+    elif isinstance(content, list) and content and isinstance(content[-1], dict):
+        blocks = list(content)
+    else:
+        return messages
+
+    blocks[-1] = {**blocks[-1], "cache_control": _EPHEMERAL}
+    return [*messages[:-1], cast(MessageParam, {**last, "content": blocks})]
+
+
+def _record_usage(summary: RunSummary, usage: Any) -> None:
+    if usage is None:
+        return
+    summary.input_tokens += getattr(usage, "input_tokens", 0) or 0
+    summary.output_tokens += getattr(usage, "output_tokens", 0) or 0
+    summary.cache_read_tokens += getattr(usage, "cache_read_input_tokens", 0) or 0
+    summary.cache_write_tokens += getattr(usage, "cache_creation_input_tokens", 0) or 0
+
+
+def _tool_call(service: ToolRunner, name: str, tool_input: Any) -> ToolCall:
+    async def _call() -> Any:
+        if not isinstance(tool_input, dict):
+            return _tool_validation_error(
+                "Tool arguments must be a JSON object.",
+                details={"tool": name, "raw_args": repr(tool_input)},
+            )
+        return await service.call_tool(name, tool_input)
+
+    return _call
+
+
 async def run_with_tools(
     *,
     client: AsyncAnthropic,
@@ -73,7 +131,26 @@ async def run_with_tools(
     max_rounds: int = 8,
     max_tokens: int = 600,
     fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    prompt_caching: bool = False,
+    messages: List[MessageParam] | None = None,
 ) -> str:
+    """
+    messages continues an earlier conversation: the prompt, every round and
+    the final reply are appended to it in place.
+
+    prompt_caching=True marks the tool definitions and the conversation so
+    far as cacheable, so later rounds re-read them from Anthropic's prompt
+    cache instead of reprocessing them. Cache read/write token counts are
+    added to `summary`.
+
+    tool_memo=True answers repeated read-only tool calls with identical
+    arguments from a per-run memo (pass a ToolMemo to choose its TTL); hits
+    are counted in summary.memo_hits.
+    """
     if not user_prompt.strip():
         raise ValidationError(
             message="Anthropic user prompt must contain non-whitespace text.",
@@ -90,20 +167,34 @@ async def run_with_tools(
         )
     )
 
-    messages: List[MessageParam] = [{"role": "user", "content": user_prompt}]
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+    tools = _cacheable_tools(service.tools) if prompt_caching else service.tools
+
+    if messages is None:
+        messages = []
+    messages.append({"role": "user", "content": user_prompt})
     final_text_chunks: list[str] = []
 
     for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
         try:
             resp = await client.messages.create(
                 model=model,
                 max_tokens=max_tokens,
-                tools=service.tools,
-                messages=messages,
+                tools=tools,
+                messages=(
+                    _with_cache_breakpoint(messages) if prompt_caching else messages
+                ),
             )
         except Exception as exc:
             raise _wrap_anthropic_error(exc) from None
 
+        if summary is not None:
+            _record_usage(summary, getattr(resp, "usage", None))
+
         tool_uses: list[Any] = []
         text_chunks: list[str] = []
 
@@ -117,10 +208,16 @@ async def run_with_tools(
             final_text_chunks.extend([t for t in text_chunks if t])
 
         if not tool_uses:
+            if resp.content:
+                messages.append({"role": "assistant", "content": list(resp.content)})
             break
 
         messages.append({"role": "assistant", "content": list(resp.content)})
 
+        tool_use_ids: list[str] = []
+        tool_names: list[str] = []
+        calls: list[ToolCall] = []
+
         for block in tool_uses:
             name = getattr(block, "name", None)
             tool_use_id = getattr(block, "id", None)
@@ -131,16 +228,20 @@ async def run_with_tools(
             if not isinstance(tool_use_id, str) or not tool_use_id:
                 continue
 
-            if not isinstance(tool_input, dict):
-                result: Any = _tool_validation_error(
-                    "Tool arguments must be a JSON object.",
-                    details={"tool": name, "raw_args": repr(tool_input)},
-                )
-            else:
-                result = await service.call_tool(name, tool_input)
+            tool_use_ids.append(tool_use_id)
+            tool_names.append(name)
+            calls.append(_tool_call(service, name, tool_input))
+
+        results = await run_tool_calls(
+            calls,
+            fatal_kinds=resolved_fatal_kinds,
+            max_concurrency=max_tool_concurrency,
+        )
 
-            raise_if_fatal_tool_error(result, fatal_kinds=resolved_fatal_kinds)
+        if summary is not None:
+            summary.tool_calls += len(calls)
 
+        for tool_use_id, name, result in zip(tool_use_ids, tool_names, results):
             messages.append(
                 {
                     "role": "user",
@@ -148,10 +249,134 @@ async def run_with_tools(
                         {
                             "type": "tool_result",
                             "tool_use_id": tool_use_id,
-                            "content": _dump(result),
+                            "content": result_encoder.encode(
+                                result, tool_name=name, summary=summary
+                            ),
                         }
                     ],
                 }
             )
 
     return "\n".join([t for t in final_text_chunks if t]).strip()
+
+
+async def stream_with_tools(
+    *,
+    client: AsyncAnthropic,
+    model: str,
+    service: ToolRunner,
+    user_prompt: str,
+    max_rounds: int = 8,
+    max_tokens: int = 600,
+    fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    prompt_caching: bool = False,
+) -> AsyncIterator[str]:
+    """
+    Streaming run_with_tools: yields text deltas as they arrive, and starts
+    each tool call as soon as its tool_use block is complete rather than
+    when the whole response is.
+    """
+    if not user_prompt.strip():
+        raise ValidationError(
+            message="Anthropic user prompt must contain non-whitespace text.",
+            domain="llm",
+            provider="anthropic",
+        )
+
+    resolved_fatal_kinds: Tuple[str, ...] = (
+        fatal_kinds
+        if fatal_kinds is not None
+        else cast(
+            Tuple[str, ...],
+            getattr(service, "fatal_tool_error_kinds", ("auth", "config")),
+        )
+    )
+
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+    tools = _cacheable_tools(service.tools) if prompt_caching else service.tools
+
+    messages: List[MessageParam] = [{"role": "user", "content": user_prompt}]
+
+    for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
+        dispatcher = ToolDispatcher(
+            fatal_kinds=resolved_fatal_kinds, max_concurrency=max_tool_concurrency
+        )
+        tool_use_ids: list[str] = []
+        tool_names: list[str] = []
+
+        try:
+            try:
+                async with client.messages.stream(
+                    model=model,
+                    max_tokens=max_tokens,
+                    tools=tools,
+                    messages=(
+                        _with_cache_breakpoint(messages) if prompt_caching else messages
+                    ),
+                ) as stream:
+                    async for event in stream:
+                        etype = getattr(event, "type", None)
+                        if etype == "text":
+                            if event.text:
+                                yield event.text
+                        elif etype == "content_block_stop":
+                            block = getattr(event, "content_block", None)
+                            if getattr(block, "type", None) != "tool_use":
+                                continue
+
+                            name = getattr(block, "name", None)
+                            tool_use_id = getattr(block, "id", None)
+                            if not isinstance(name, str) or not name:
+                                continue
+                            if not isinstance(tool_use_id, str) or not tool_use_id:
+                                continue
+
+                            tool_use_ids.append(tool_use_id)
+                            tool_names.append(name)
+                            dispatcher.dispatch(
+                                _tool_call(service, name, getattr(block, "input", None))
+                            )
+
+                    final = await stream.get_final_message()
+            except OpenToolsError:
+                raise
+            except Exception as exc:
+                raise _wrap_anthropic_error(exc) from None
+
+            if summary is not None:
+                _record_usage(summary, getattr(final, "usage", None))
+
+            if not tool_use_ids:
+                break
+
+            messages.append({"role": "assistant", "content": list(final.content)})
+            results = await dispatcher.results()
+        finally:
+            dispatcher.cancel()
+
+        if summary is not None:
+            summary.tool_calls += len(results)
+
+        for tool_use_id, name, result in zip(tool_use_ids, tool_names, results):
+            messages.append(
+                {
+                    "role": "user",
+                    "content": [
+                        {
+                            "type": "tool_result",
+                            "tool_use_id": tool_use_id,
+                            "content": result_encoder.encode(
+                                result, tool_name=name, summary=summary
+                            ),
+                        }
+                    ],
+                }
+            )
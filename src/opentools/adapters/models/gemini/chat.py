@@ -1,7 +1,6 @@
 from __future__ import annotations
 
-import json
-from typing import Any, List, Tuple, cast
+from typing import Any, AsyncIterator, List, Tuple, cast
 
 import google.genai as genai
 from google.genai import errors as genai_errors
@@ -15,8 +14,15 @@ from opentools.core.errors import (
     RateLimitError,
     TransientError,
 )
-from opentools.core.tool_policy import raise_if_fatal_tool_error
-from opentools.core.tool_runner import ToolRunner
+from opentools.core.memo import ToolMemo, with_tool_memo
+from opentools.core.results import DEFAULT_RESULT_ENCODER, ResultEncoder, RunSummary
+from opentools.core.tool_runner import (
+    DEFAULT_TOOL_CONCURRENCY,
+    ToolCall,
+    ToolDispatcher,
+    ToolRunner,
+    run_tool_calls,
+)
 
 
 def _tool_validation_error(
@@ -31,13 +37,6 @@ def _tool_validation_error(
     return out
 
 
-def _jsonable(x: Any) -> Any:
-    try:
-        return json.loads(json.dumps(x, default=str))
-    except Exception:
-        return {"_unserializable": True, "repr": repr(x)}
-
-
 def _wrap_gemini_error(exc: genai_errors.APIError) -> OpenToolsError:
     code = getattr(exc, "code", None)
     message = getattr(exc, "message", str(exc))
@@ -61,6 +60,20 @@ def _wrap_gemini_error(exc: genai_errors.APIError) -> OpenToolsError:
     return ProviderError(**base_kwargs)
 
 
+def _tool_call(
+    service: ToolRunner, name: str, args: Any, raw_args_obj: Any
+) -> ToolCall:
+    async def _call() -> Any:
+        if not isinstance(args, dict):
+            return _tool_validation_error(
+                "Tool arguments must be a JSON object.",
+                details={"tool": name, "raw_args": repr(raw_args_obj)},
+            )
+        return await service.call_tool(name, args)
+
+    return _call
+
+
 async def run_with_tools(
     *,
     client: genai.Client,
@@ -70,8 +83,19 @@ async def run_with_tools(
     max_rounds: int = 8,
     max_output_tokens: int = 600,
     fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    messages: List[genai_types.Content] | None = None,
 ) -> str:
+    """
+    messages continues an earlier conversation (a list of Content): the
+    prompt, every round and the final reply are appended to it in place.
+    """
     aclient = client.aio
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
 
     resolved_fatal_kinds: Tuple[str, ...] = (
         fatal_kinds
@@ -82,16 +106,20 @@ async def run_with_tools(
         )
     )
 
-    contents: List[genai_types.Content] = [
+    contents: List[genai_types.Content] = [] if messages is None else messages
+    contents.append(
         genai_types.Content(
             role="user",
             parts=[genai_types.Part.from_text(text=user_prompt)],
         )
-    ]
+    )
 
     final_chunks: list[str] = []
 
     for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
         try:
             response = await aclient.models.generate_content(
                 model=model,
@@ -124,6 +152,9 @@ async def run_with_tools(
                 if cand_content is not None:
                     contents.append(cast(genai_types.Content, cand_content))
 
+            names: list[str] = []
+            calls: list[ToolCall] = []
+
             for fc_any in function_calls:
                 fc = cast(Any, fc_any)
 
@@ -144,19 +175,26 @@ async def run_with_tools(
                     except Exception:
                         args = {}
 
-                if not isinstance(args, dict):
-                    result = _tool_validation_error(
-                        "Tool arguments must be a JSON object.",
-                        details={"tool": name, "raw_args": repr(raw_args_obj)},
-                    )
-                else:
-                    result = await service.call_tool(name, args)
+                names.append(name)
+                calls.append(_tool_call(service, name, args, raw_args_obj))
+
+            results = await run_tool_calls(
+                calls,
+                fatal_kinds=resolved_fatal_kinds,
+                max_concurrency=max_tool_concurrency,
+            )
 
-                raise_if_fatal_tool_error(result, fatal_kinds=resolved_fatal_kinds)
+            if summary is not None:
+                summary.tool_calls += len(calls)
 
+            for name, result in zip(names, results):
                 function_response_part = genai_types.Part.from_function_response(
                     name=name,
-                    response={"result": _jsonable(result)},
+                    response={
+                        "result": result_encoder.to_jsonable(
+                            result, tool_name=name, summary=summary
+                        )
+                    },
                 )
 
                 contents.append(
@@ -171,6 +209,146 @@ async def run_with_tools(
         text = getattr(response, "text", None) or ""
         if text:
             final_chunks.append(text)
+
+        candidates = getattr(response, "candidates", None)
+        if isinstance(candidates, list) and len(candidates) > 0:
+            cand_content = getattr(candidates[0], "content", None)
+            if cand_content is not None:
+                contents.append(cast(genai_types.Content, cand_content))
         break
 
     return "\n".join(final_chunks) if final_chunks else ""
+
+
+def _function_call_args(func_call: Any) -> tuple[Any, Any]:
+    raw_args_obj = getattr(func_call, "args", None) or {}
+    if isinstance(raw_args_obj, dict):
+        return raw_args_obj, raw_args_obj
+    try:
+        return dict(raw_args_obj), raw_args_obj  # type: ignore[arg-type]
+    except Exception:
+        return {}, raw_args_obj
+
+
+async def stream_with_tools(
+    *,
+    client: genai.Client,
+    model: str,
+    service: ToolRunner,
+    user_prompt: str,
+    max_rounds: int = 8,
+    max_output_tokens: int = 600,
+    fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+) -> AsyncIterator[str]:
+    """
+    Streaming run_with_tools: yields text deltas as they arrive, and starts
+    each function call as soon as its chunk is received.
+    """
+    aclient = client.aio
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+
+    resolved_fatal_kinds: Tuple[str, ...] = (
+        fatal_kinds
+        if fatal_kinds is not None
+        else cast(
+            Tuple[str, ...],
+            getattr(service, "fatal_tool_error_kinds", ("auth", "config")),
+        )
+    )
+
+    contents: List[genai_types.Content] = [
+        genai_types.Content(
+            role="user",
+            parts=[genai_types.Part.from_text(text=user_prompt)],
+        )
+    ]
+
+    for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
+        dispatcher = ToolDispatcher(
+            fatal_kinds=resolved_fatal_kinds, max_concurrency=max_tool_concurrency
+        )
+        names: list[str] = []
+        parts: list[genai_types.Part] = []
+
+        try:
+            try:
+                stream = await aclient.models.generate_content_stream(
+                    model=model,
+                    contents=contents,
+                    config=genai_types.GenerateContentConfig(
+                        tools=service.tools,
+                        automatic_function_calling=genai_types.AutomaticFunctionCallingConfig(
+                            disable=True
+                        ),
+                        max_output_tokens=max_output_tokens,
+                    ),
+                )
+                async for chunk in stream:
+                    candidates = getattr(chunk, "candidates", None) or []
+                    content = (
+                        getattr(candidates[0], "content", None) if candidates else None
+                    )
+                    for part in getattr(content, "parts", None) or []:
+                        parts.append(part)
+
+                        func_call = getattr(part, "function_call", None)
+                        if func_call is not None:
+                            name = getattr(func_call, "name", None)
+                            if not isinstance(name, str) or not name:
+                                continue
+                            args, raw_args_obj = _function_call_args(func_call)
+                            names.append(name)
+                            dispatcher.dispatch(
+                                _tool_call(service, name, args, raw_args_obj)
+                            )
+                            continue
+
+                        text = getattr(part, "text", None)
+                        if text and not getattr(part, "thought", False):
+                            yield text
+            except genai_errors.APIError as exc:
+                raise _wrap_gemini_error(exc) from None
+            except OpenToolsError:
+                raise
+            except Exception as exc:
+                raise ProviderError(
+                    message=str(exc),
+                    domain="llm",
+                    provider="gemini",
+                ) from None
+
+            if not names:
+                break
+
+            contents.append(genai_types.Content(role="model", parts=parts))
+            results = await dispatcher.results()
+        finally:
+            dispatcher.cancel()
+
+        if summary is not None:
+            summary.tool_calls += len(results)
+
+        for name, result in zip(names, results):
+            function_response_part = genai_types.Part.from_function_response(
+                name=name,
+                response={
+                    "result": result_encoder.to_jsonable(
+                        result, tool_name=name, summary=summary
+                    )
+                },
+            )
+
+            contents.append(
+                genai_types.Content(
+                    role="tool",
+                    parts=[function_response_part],
+                )
+            )
@@ -1,16 +1,19 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, List, Tuple, cast
+from typing import Any, AsyncIterator, Dict, List, Tuple, cast
 
 from ollama import AsyncClient, ResponseError
 from opentools.core.errors import ProviderError, TransientError
-from opentools.core.tool_policy import raise_if_fatal_tool_error
-from opentools.core.tool_runner import ToolRunner
-
-
-def _dump(x: Any) -> str:
-    return json.dumps(x, indent=2, default=str)
+from opentools.core.memo import ToolMemo, with_tool_memo
+from opentools.core.results import DEFAULT_RESULT_ENCODER, ResultEncoder, RunSummary
+from opentools.core.tool_runner import (
+    DEFAULT_TOOL_CONCURRENCY,
+    ToolCall,
+    ToolDispatcher,
+    ToolRunner,
+    run_tool_calls,
+)
 
 
 def _tool_validation_error(
@@ -39,6 +42,30 @@ def _get(obj: Any, key: str, default: Any = None) -> Any:
     return getattr(obj, key, default)
 
 
+def _tool_call(service: ToolRunner, name: str, raw_args: Any) -> ToolCall:
+    async def _call() -> Any:
+        args: Any = {}
+        if isinstance(raw_args, dict):
+            args = raw_args
+        elif isinstance(raw_args, str):
+            try:
+                args = json.loads(raw_args)
+            except json.JSONDecodeError:
+                # the parse error is the tool's result; the tool is not called
+                return _tool_validation_error(
+                    "Invalid JSON in tool arguments.",
+                    details={"tool": name, "raw_args": raw_args},
+                )
+        if not isinstance(args, dict):
+            return _tool_validation_error(
+                "Tool arguments must be a JSON object.",
+                details={"tool": name, "raw_args": raw_args},
+            )
+        return await service.call_tool(name, args)
+
+    return _call
+
+
 async def run_with_tools(
     *,
     client: AsyncClient,
@@ -47,8 +74,21 @@ async def run_with_tools(
     user_prompt: str,
     max_rounds: int = 8,
     fatal_kinds: Tuple[str, ...] | None = None,  # service policy
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    messages: List[Dict[str, Any]] | None = None,
 ) -> str:
-    messages: List[Dict[str, Any]] = [{"role": "user", "content": user_prompt}]
+    """
+    messages continues an earlier conversation: the prompt, every round and
+    the final reply are appended to it in place.
+    """
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+    if messages is None:
+        messages = []
+    messages.append({"role": "user", "content": user_prompt})
     final_chunks: list[str] = []
 
     resolved_fatal_kinds: Tuple[str, ...] = (
@@ -61,6 +101,9 @@ async def run_with_tools(
     )
 
     for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
         try:
             resp: Any = await client.chat(
                 model=model,
@@ -110,6 +153,9 @@ async def run_with_tools(
         messages.append(assistant_msg)
 
         if tool_calls:
+            names: list[str] = []
+            calls: list[ToolCall] = []
+
             for tc in tool_calls:
                 func = _get(tc, "function")
                 if func is None:
@@ -119,35 +165,26 @@ async def run_with_tools(
                 if not name:
                     continue
 
-                raw_args = _get(func, "arguments")
-
-                if isinstance(raw_args, dict):
-                    args: Any = raw_args
-                elif isinstance(raw_args, str):
-                    try:
-                        args = json.loads(raw_args)
-                    except json.JSONDecodeError:
-                        args = _tool_validation_error(
-                            "Invalid JSON in tool arguments.",
-                            details={"tool": name, "raw_args": raw_args},
-                        )
-                else:
-                    args = {}
-
-                if isinstance(args, dict):
-                    result = await service.call_tool(name, args)
-                else:
-                    result = _tool_validation_error(
-                        "Tool arguments must be a JSON object.",
-                        details={"tool": name, "raw_args": raw_args},
-                    )
-
-                raise_if_fatal_tool_error(result, fatal_kinds=resolved_fatal_kinds)
+                names.append(name)
+                calls.append(_tool_call(service, name, _get(func, "arguments")))
+
+            results = await run_tool_calls(
+                calls,
+                fatal_kinds=resolved_fatal_kinds,
+                max_concurrency=max_tool_concurrency,
+            )
+
+            if summary is not None:
+                summary.tool_calls += len(calls)
+
+            for name, result in zip(names, results):
                 messages.append(
                     {
                         "role": "tool",
                         "name": name,
-                        "content": _dump(result),
+                        "content": result_encoder.encode(
+                            result, tool_name=name, summary=summary
+                        ),
                     }
                 )
 
@@ -158,3 +195,123 @@ async def run_with_tools(
         break
 
     return "\n".join(final_chunks) if final_chunks else ""
+
+
+async def stream_with_tools(
+    *,
+    client: AsyncClient,
+    model: str,
+    service: ToolRunner,
+    user_prompt: str,
+    max_rounds: int = 8,
+    fatal_kinds: Tuple[str, ...] | None = None,  # service policy
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+) -> AsyncIterator[str]:
+    """
+    Streaming run_with_tools: yields text deltas as they arrive, and starts
+    each tool call as soon as the chunk carrying it is received.
+    """
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+    messages: List[Dict[str, Any]] = [{"role": "user", "content": user_prompt}]
+
+    resolved_fatal_kinds: Tuple[str, ...] = (
+        fatal_kinds
+        if fatal_kinds is not None
+        else cast(
+            Tuple[str, ...],
+            getattr(service, "fatal_tool_error_kinds", ("auth", "config")),
+        )
+    )
+
+    for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
+        dispatcher = ToolDispatcher(
+            fatal_kinds=resolved_fatal_kinds, max_concurrency=max_tool_concurrency
+        )
+        text_parts: list[str] = []
+        tool_calls: list[Any] = []
+        names: list[str] = []
+
+        try:
+            try:
+                stream = await client.chat(
+                    model=model,
+                    messages=messages,
+                    tools=service.tools,
+                    stream=True,
+                )
+                async for chunk in stream:
+                    message = _get(chunk, "message")
+                    if message is None:
+                        continue
+
+                    content = _get(message, "content", "") or ""
+                    if content:
+                        text_parts.append(str(content))
+                        yield str(content)
+
+                    for tc in _get(message, "tool_calls", []) or []:
+                        tool_calls.append(tc)
+                        func = _get(tc, "function")
+                        name = _get(func, "name") if func is not None else None
+                        if not name:
+                            continue
+
+                        names.append(name)
+                        dispatcher.dispatch(
+                            _tool_call(service, name, _get(func, "arguments"))
+                        )
+            except ResponseError as e:
+                raise ProviderError(
+                    message=str(e),
+                    domain="llm",
+                    provider="ollama",
+                    status_code=getattr(e, "status_code", None),
+                    details=getattr(e, "error", None),
+                ) from None
+            except (ConnectionError, OSError) as e:
+                raise TransientError(
+                    message="Failed to reach Ollama host. Is the Ollama server running?",
+                    domain="llm",
+                    provider="ollama",
+                    details=str(e),
+                ) from None
+            except Exception as e:
+                raise ProviderError(
+                    message=str(e), domain="llm", provider="ollama"
+                ) from None
+
+            assistant_msg: Dict[str, Any] = {
+                "role": "assistant",
+                "content": "".join(text_parts),
+            }
+            if tool_calls:
+                assistant_msg["tool_calls"] = tool_calls
+            messages.append(assistant_msg)
+
+            if not names:
+                break
+
+            results = await dispatcher.results()
+        finally:
+            dispatcher.cancel()
+
+        if summary is not None:
+            summary.tool_calls += len(results)
+
+        for name, result in zip(names, results):
+            messages.append(
+                {
+                    "role": "tool",
+                    "name": name,
+                    "content": result_encoder.encode(
+                        result, tool_name=name, summary=summary
+                    ),
+                }
+            )
@@ -1,18 +1,21 @@
 from __future__ import annotations
 
 import json
-from typing import Any, Dict, Iterable, List, Mapping, Tuple, cast
+from typing import Any, AsyncIterator, Dict, Iterable, List, Mapping, Tuple, cast
 
 from openai import APIError, AsyncOpenAI
 from openai import RateLimitError as OpenAIRateLimitError
 from openai.types.chat import ChatCompletionMessageParam
-from opentools.core.errors import ProviderError, RateLimitError
-from opentools.core.tool_policy import raise_if_fatal_tool_error
-from opentools.core.tool_runner import ToolRunner
-
-
-def _dump(x: Any) -> str:
-    return json.dumps(x, indent=2, default=str)
+from opentools.core.errors import OpenToolsError, ProviderError, RateLimitError
+from opentools.core.memo import ToolMemo, with_tool_memo
+from opentools.core.results import DEFAULT_RESULT_ENCODER, ResultEncoder, RunSummary
+from opentools.core.tool_runner import (
+    DEFAULT_TOOL_CONCURRENCY,
+    ToolCall,
+    ToolDispatcher,
+    ToolRunner,
+    run_tool_calls,
+)
 
 
 def _tool_validation_error(
@@ -27,6 +30,41 @@ def _tool_validation_error(
     return out
 
 
+def _wrap_openai_error(e: Exception, provider: str) -> OpenToolsError:
+    if isinstance(e, APIError):
+        error_cls: type[OpenToolsError] = (
+            RateLimitError if isinstance(e, OpenAIRateLimitError) else ProviderError
+        )
+        return error_cls(
+            message=str(e),
+            domain="llm",
+            provider=provider,
+            status_code=getattr(e, "status_code", None),
+            request_id=getattr(e, "request_id", None),
+            details=getattr(e, "body", None),
+        )
+    return ProviderError(message=str(e), domain="llm", provider=provider)
+
+
+def _tool_call(service: ToolRunner, name: str, raw_args: str) -> ToolCall:
+    async def _call() -> Any:
+        try:
+            args = json.loads(raw_args)
+        except json.JSONDecodeError:
+            return _tool_validation_error(
+                "Invalid JSON in tool arguments.",
+                details={"tool": name, "raw_args": raw_args},
+            )
+        if not isinstance(args, dict):
+            return _tool_validation_error(
+                "Tool arguments must be a JSON object.",
+                details={"tool": name, "raw_args": raw_args},
+            )
+        return await service.call_tool(name, args)
+
+    return _call
+
+
 async def _run_with_tools_impl(
     *,
     client: AsyncOpenAI,
@@ -38,8 +76,17 @@ async def _run_with_tools_impl(
     max_tokens: int = 600,
     fatal_kinds: Tuple[str, ...] | None = None,  # None => use service policy
     extra_headers: Mapping[str, str] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    messages: List[Dict[str, Any]] | None = None,
 ) -> str:
-    messages: List[Dict[str, Any]] = [{"role": "user", "content": user_prompt}]
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+    if messages is None:
+        messages = []
+    messages.append({"role": "user", "content": user_prompt})
     final_chunks: list[str] = []
 
     resolved_fatal_kinds: Tuple[str, ...] = (
@@ -52,6 +99,9 @@ async def _run_with_tools_impl(
     )
 
     for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
         try:
             resp = await client.chat.completions.create(
                 model=model,
@@ -61,28 +111,8 @@ async def _run_with_tools_impl(
                 max_tokens=max_tokens,
                 extra_headers=dict(extra_headers) if extra_headers else None,
             )
-        except OpenAIRateLimitError as e:
-            raise RateLimitError(
-                message=str(e),
-                domain="llm",
-                provider=provider,
-                status_code=getattr(e, "status_code", None),
-                request_id=getattr(e, "request_id", None),
-                details=getattr(e, "body", None),
-            ) from None
-        except APIError as e:
-            raise ProviderError(
-                message=str(e),
-                domain="llm",
-                provider=provider,
-                status_code=getattr(e, "status_code", None),
-                request_id=getattr(e, "request_id", None),
-                details=getattr(e, "body", None),
-            ) from None
         except Exception as e:
-            raise ProviderError(
-                message=str(e), domain="llm", provider=provider
-            ) from None
+            raise _wrap_openai_error(e, provider) from None
 
         msg = resp.choices[0].message
         tool_calls = msg.tool_calls or []
@@ -96,33 +126,37 @@ async def _run_with_tools_impl(
                 }
             )
 
+            tool_call_ids: list[str] = []
+            tool_names: list[str] = []
+            calls: list[ToolCall] = []
+
             for tc in tool_calls:
                 func = getattr(tc, "function", None)
                 if func is None:
                     continue
 
-                name = func.name
-                raw_args = func.arguments or "{}"
-
-                try:
-                    args = json.loads(raw_args)
-                    if not isinstance(args, dict):
-                        result = _tool_validation_error(
-                            "Tool arguments must be a JSON object.",
-                            details={"tool": name, "raw_args": raw_args},
-                        )
-                    else:
-                        result = await service.call_tool(name, args)
-                except json.JSONDecodeError:
-                    result = _tool_validation_error(
-                        "Invalid JSON in tool arguments.",
-                        details={"tool": name, "raw_args": raw_args},
-                    )
-
-                raise_if_fatal_tool_error(result, fatal_kinds=resolved_fatal_kinds)
+                tool_call_ids.append(tc.id)
+                tool_names.append(func.name)
+                calls.append(_tool_call(service, func.name, func.arguments or "{}"))
+
+            results = await run_tool_calls(
+                calls,
+                fatal_kinds=resolved_fatal_kinds,
+                max_concurrency=max_tool_concurrency,
+            )
 
+            if summary is not None:
+                summary.tool_calls += len(calls)
+
+            for tool_call_id, name, result in zip(tool_call_ids, tool_names, results):
                 messages.append(
-                    {"role": "tool", "tool_call_id": tc.id, "content": _dump(result)}
+                    {
+                        "role": "tool",
+                        "tool_call_id": tool_call_id,
+                        "content": result_encoder.encode(
+                            result, tool_name=name, summary=summary
+                        ),
+                    }
                 )
 
             continue
@@ -135,11 +169,142 @@ async def _run_with_tools_impl(
         )
         if text:
             final_chunks.append(text)
+        messages.append({"role": "assistant", "content": text})
         break
 
     return "\n".join(final_chunks) if final_chunks else ""
 
 
+async def _stream_with_tools_impl(
+    *,
+    client: AsyncOpenAI,
+    model: str,
+    service: ToolRunner,
+    user_prompt: str,
+    provider: str,
+    max_rounds: int = 8,
+    max_tokens: int = 600,
+    fatal_kinds: Tuple[str, ...] | None = None,
+    extra_headers: Mapping[str, str] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+) -> AsyncIterator[str]:
+    service = with_tool_memo(service, tool_memo, summary=summary)
+    result_encoder = encoder or DEFAULT_RESULT_ENCODER
+    messages: List[Dict[str, Any]] = [{"role": "user", "content": user_prompt}]
+
+    resolved_fatal_kinds: Tuple[str, ...] = (
+        fatal_kinds
+        if fatal_kinds is not None
+        else cast(
+            Tuple[str, ...],
+            getattr(service, "fatal_tool_error_kinds", ("auth", "config")),
+        )
+    )
+
+    for _ in range(max_rounds):
+        if summary is not None:
+            summary.rounds += 1
+
+        dispatcher = ToolDispatcher(
+            fatal_kinds=resolved_fatal_kinds, max_concurrency=max_tool_concurrency
+        )
+        text_parts: list[str] = []
+        # index -> accumulated {"id", "name", "arguments"}
+        pending: dict[int, dict[str, str]] = {}
+        dispatched: list[dict[str, str]] = []
+
+        def _dispatch_ready(upto: int | None = None) -> None:
+            # a call's arguments are complete once a later call (or the end
+            # of the response) appears
+            for idx in sorted(pending):
+                if upto is not None and idx >= upto:
+                    break
+                entry = pending.pop(idx)
+                dispatched.append(entry)
+                dispatcher.dispatch(
+                    _tool_call(service, entry["name"], entry["arguments"] or "{}")
+                )
+
+        try:
+            try:
+                stream = await client.chat.completions.create(
+                    model=model,
+                    messages=cast(Iterable[ChatCompletionMessageParam], messages),
+                    tools=service.tools,
+                    tool_choice="auto",
+                    max_tokens=max_tokens,
+                    extra_headers=dict(extra_headers) if extra_headers else None,
+                    stream=True,
+                )
+                async for chunk in stream:
+                    if not chunk.choices:
+                        continue
+                    choice = chunk.choices[0]
+                    delta = choice.delta
+
+                    if delta.content:
+                        text_parts.append(delta.content)
+                        yield delta.content
+
+                    for tc in delta.tool_calls or []:
+                        if tc.index not in pending:
+                            _dispatch_ready(upto=tc.index)
+                            pending[tc.index] = {"id": "", "name": "", "arguments": ""}
+                        entry = pending[tc.index]
+                        if tc.id:
+                            entry["id"] = tc.id
+                        if tc.function is not None:
+                            entry["name"] += tc.function.name or ""
+                            entry["arguments"] += tc.function.arguments or ""
+
+                    if choice.finish_reason:
+                        _dispatch_ready()
+            except Exception as e:
+                raise _wrap_openai_error(e, provider) from None
+
+            _dispatch_ready()
+            if not dispatched:
+                break
+
+            messages.append(
+                {
+                    "role": "assistant",
+                    "content": "".join(text_parts),
+                    "tool_calls": [
+                        {
+                            "id": entry["id"],
+                            "type": "function",
+                            "function": {
+                                "name": entry["name"],
+                                "arguments": entry["arguments"],
+                            },
+                        }
+                        for entry in dispatched
+                    ],
+                }
+            )
+            results = await dispatcher.results()
+        finally:
+            dispatcher.cancel()
+
+        if summary is not None:
+            summary.tool_calls += len(results)
+
+        for entry, result in zip(dispatched, results):
+            messages.append(
+                {
+                    "role": "tool",
+                    "tool_call_id": entry["id"],
+                    "content": result_encoder.encode(
+                        result, tool_name=entry["name"], summary=summary
+                    ),
+                }
+            )
+
+
 async def run_with_tools(
     *,
     client: AsyncOpenAI,
@@ -149,7 +314,16 @@ async def run_with_tools(
     max_rounds: int = 8,
     max_tokens: int = 600,
     fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    messages: List[Dict[str, Any]] | None = None,
 ) -> str:
+    """
+    messages continues an earlier conversation: the prompt, every round and
+    the final reply are appended to it in place.
+    """
     return await _run_with_tools_impl(
         client=client,
         model=model,
@@ -160,4 +334,44 @@ async def run_with_tools(
         max_tokens=max_tokens,
         fatal_kinds=fatal_kinds,
         extra_headers=None,
+        max_tool_concurrency=max_tool_concurrency,
+        encoder=encoder,
+        summary=summary,
+        tool_memo=tool_memo,
+        messages=messages,
+    )
+
+
+def stream_with_tools(
+    *,
+    client: AsyncOpenAI,
+    model: str,
+    service: ToolRunner,
+    user_prompt: str,
+    max_rounds: int = 8,
+    max_tokens: int = 600,
+    fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+) -> AsyncIterator[str]:
+    """
+    Streaming run_with_tools: yields text deltas as they arrive, and starts
+    each tool call as soon as its arguments are complete.
+    """
+    return _stream_with_tools_impl(
+        client=client,
+        model=model,
+        service=service,
+        user_prompt=user_prompt,
+        provider="openai",
+        max_rounds=max_rounds,
+        max_tokens=max_tokens,
+        fatal_kinds=fatal_kinds,
+        extra_headers=None,
+        max_tool_concurrency=max_tool_concurrency,
+        encoder=encoder,
+        summary=summary,
+        tool_memo=tool_memo,
     )
@@ -1,11 +1,16 @@
 from __future__ import annotations
 
-from typing import Tuple
+from typing import Any, AsyncIterator, Dict, List, Tuple
 
 from openai import AsyncOpenAI
 
-from opentools.adapters.models.openai.chat import _run_with_tools_impl
-from opentools.core.tool_runner import ToolRunner
+from opentools.adapters.models.openai.chat import (
+    _run_with_tools_impl,
+    _stream_with_tools_impl,
+)
+from opentools.core.memo import ToolMemo
+from opentools.core.results import ResultEncoder, RunSummary
+from opentools.core.tool_runner import DEFAULT_TOOL_CONCURRENCY, ToolRunner
 
 
 async def run_with_tools(
@@ -17,6 +22,11 @@ async def run_with_tools(
     max_rounds: int = 8,
     max_tokens: int = 600,
     fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+    messages: List[Dict[str, Any]] | None = None,
 ) -> str:
     extra_headers = {}
 
@@ -30,4 +40,40 @@ async def run_with_tools(
         max_tokens=max_tokens,
         fatal_kinds=fatal_kinds,
         extra_headers=extra_headers or None,
+        max_tool_concurrency=max_tool_concurrency,
+        encoder=encoder,
+        summary=summary,
+        tool_memo=tool_memo,
+        messages=messages,
+    )
+
+
+def stream_with_tools(
+    *,
+    client: AsyncOpenAI,
+    model: str,
+    service: ToolRunner,
+    user_prompt: str,
+    max_rounds: int = 8,
+    max_tokens: int = 600,
+    fatal_kinds: Tuple[str, ...] | None = None,
+    max_tool_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    encoder: ResultEncoder | None = None,
+    summary: RunSummary | None = None,
+    tool_memo: ToolMemo | bool | None = None,
+) -> AsyncIterator[str]:
+    return _stream_with_tools_impl(
+        client=client,
+        model=model,
+        service=service,
+        user_prompt=user_prompt,
+        provider="openrouter",
+        max_rounds=max_rounds,
+        max_tokens=max_tokens,
+        fatal_kinds=fatal_kinds,
+        extra_headers=None,
+        max_tool_concurrency=max_tool_concurrency,
+        encoder=encoder,
+        summary=summary,
+        tool_memo=tool_memo,
     )
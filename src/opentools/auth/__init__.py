@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import hashlib
 from typing import Any
 
-from .impl import BearerTokenAuth, HeaderAuth
+from .impl import AlpacaAuth, BearerTokenAuth, CoinbaseAuth, HeaderAuth
 from .interface import Auth
 
 
@@ -14,3 +15,24 @@ def normalise_auth(auth: Any) -> Auth:
         return HeaderAuth(auth)
 
     return auth
+
+
+def _fingerprint(secret: str) -> str:
+    return hashlib.sha256(secret.encode("utf-8")).hexdigest()[:16]
+
+
+def auth_identity(auth: Any) -> str:
+    """
+    Stable, non-secret identity for a credential. Used to key shared state
+    (rate limiters, request coalescing) per API key.
+    """
+    if isinstance(auth, AlpacaAuth):
+        return f"alpaca:{auth.key_id}"
+    if isinstance(auth, CoinbaseAuth):
+        return f"coinbase:{auth.api_key}"
+    if isinstance(auth, BearerTokenAuth):
+        return f"bearer:{_fingerprint(auth.token)}"
+    if isinstance(auth, HeaderAuth):
+        items = "\n".join(f"{k}={v}" for k, v in sorted(auth.headers_dict.items()))
+        return f"headers:{_fingerprint(items)}"
+    return f"object:{id(auth)}"
@@ -2,28 +2,41 @@ from __future__ import annotations
 
 import secrets
 import time
-from typing import Any
+from functools import lru_cache
+from typing import Any, NamedTuple
 
 import jwt
 from cryptography.hazmat.primitives import serialization
 
 
-def build_coinbase_jwt(
-    *,
-    key_name: str,
-    key_secret: str,
-    method: str,
-    host: str,
-    path: str,
-    expires_in: int = 120,
-) -> str:
+def load_coinbase_private_key(key_secret: str) -> Any:
+    """
+    Parse a Coinbase CDP PEM secret (escaped newlines allowed) into a key object.
+    Raises ValueError if the secret is not a valid PEM private key.
+    """
     pem_str = key_secret.replace("\\n", "\n").strip()
 
-    private_key: Any = serialization.load_pem_private_key(
+    return serialization.load_pem_private_key(
         pem_str.encode("utf-8"),
         password=None,
     )
 
+
+class SignedJWT(NamedTuple):
+    token: str
+    nbf: int
+    exp: int
+
+
+def sign_coinbase_jwt(
+    *,
+    key_name: str,
+    private_key: Any,
+    method: str,
+    host: str,
+    path: str,
+    expires_in: int = 120,
+) -> SignedJWT:
     now = int(time.time())
     uri = f"{method.upper()} {host}{path}"
 
@@ -46,4 +59,57 @@ def build_coinbase_jwt(
         algorithm="ES256",
         headers=headers,
     )
-    return token
+    return SignedJWT(token=token, nbf=payload["nbf"], exp=payload["exp"])
+
+
+def build_coinbase_jwt(
+    *,
+    key_name: str,
+    key_secret: str | None = None,
+    method: str,
+    host: str,
+    path: str,
+    expires_in: int = 120,
+    private_key: Any | None = None,
+) -> str:
+    if private_key is None:
+        if key_secret is None:
+            raise ValueError("build_coinbase_jwt requires key_secret or private_key")
+        private_key = load_coinbase_private_key(key_secret)
+
+    return sign_coinbase_jwt(
+        key_name=key_name,
+        private_key=private_key,
+        method=method,
+        host=host,
+        path=path,
+        expires_in=expires_in,
+    ).token
+
+
+@lru_cache(maxsize=32)
+def _process_local_key(key_secret: str) -> Any:
+    return load_coinbase_private_key(key_secret)
+
+
+def sign_coinbase_jwt_from_secret(
+    *,
+    key_name: str,
+    key_secret: str,
+    method: str,
+    host: str,
+    path: str,
+    expires_in: int = 120,
+) -> SignedJWT:
+    """
+    Picklable signing entry point for process pools: key objects can't cross
+    process boundaries, so each worker parses the PEM once and caches it.
+    """
+    return sign_coinbase_jwt(
+        key_name=key_name,
+        private_key=_process_local_key(key_secret),
+        method=method,
+        host=host,
+        path=path,
+        expires_in=expires_in,
+    )
@@ -1,11 +1,24 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Mapping
+import asyncio
+import logging
+import time
+from collections import deque
+from concurrent.futures import Executor, ProcessPoolExecutor
+from dataclasses import dataclass, field
+from functools import cached_property, partial
+from typing import Any, Literal, Mapping
 
 from opentools.core.errors import AuthError
 
-from .coinbase_jwt import build_coinbase_jwt
+from .coinbase_jwt import (
+    SignedJWT,
+    load_coinbase_private_key,
+    sign_coinbase_jwt,
+    sign_coinbase_jwt_from_secret,
+)
+
+_log = logging.getLogger(__name__)
 
 
 @dataclass(frozen=True)
@@ -54,13 +67,134 @@ class AlpacaAuth:
         }
 
 
+# presigned tokens are dropped with less than this much validity left;
+# short-lived tokens use a quarter of expires_in instead
+_PRESIGN_MIN_TTL_S = 30
+
+
 @dataclass(frozen=True)
 class CoinbaseAuth:
+    """
+    ES256 JWT auth for Coinbase CDP keys.
+
+    - signing="inline" signs on the event loop (default)
+    - signing="thread" signs off-loop in `executor` (default thread pool);
+      a ProcessPoolExecutor is also accepted
+    - presign: hot (METHOD, path) pairs to keep a small pool of single-use,
+      pre-signed tokens for; tokens are discarded once fewer than 30s
+      (or a quarter of expires_in, if smaller) of their validity window
+      remain and are never handed out twice
+
+    `signing` governs every signature a request waits on, hot paths
+    included. Pool refills always sign in `executor`: they run in the
+    background, and signing there inline would stall unrelated requests
+    on the loop for no latency gain.
+    """
+
     api_key: str
     api_secret: str
     host: str
     expires_in: int = 120
 
+    signing: Literal["inline", "thread"] = "inline"
+    executor: Executor | None = field(default=None, compare=False, repr=False)
+    presign: tuple[tuple[str, str], ...] = ()
+    presign_depth: int = 2
+
+    _presigned: dict[tuple[str, str], deque[SignedJWT]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # key -> loop its refill task runs on
+    _refilling: dict[tuple[str, str], asyncio.AbstractEventLoop] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _tasks: set[asyncio.Task[None]] = field(
+        default_factory=set, init=False, repr=False, compare=False
+    )
+
+    @cached_property
+    def private_key(self) -> Any:
+        """
+        Parsed PEM key, loaded once on first use (EC key loading is far more
+        expensive than signing). Raises ValueError for an invalid secret.
+        """
+        return load_coinbase_private_key(self.api_secret)
+
+    @cached_property
+    def _hot_paths(self) -> frozenset[tuple[str, str]]:
+        return frozenset((m.upper(), p) for m, p in self.presign)
+
+    def _sign_inline(self, method: str, path: str) -> SignedJWT:
+        return sign_coinbase_jwt(
+            key_name=self.api_key,
+            private_key=self.private_key,
+            method=method,
+            host=self.host,
+            path=path,
+            expires_in=self.expires_in,
+        )
+
+    async def _sign_off_loop(self, method: str, path: str) -> SignedJWT:
+        loop = asyncio.get_running_loop()
+
+        if isinstance(self.executor, ProcessPoolExecutor):
+            fn = partial(
+                sign_coinbase_jwt_from_secret,
+                key_name=self.api_key,
+                key_secret=self.api_secret,
+                method=method,
+                host=self.host,
+                path=path,
+                expires_in=self.expires_in,
+            )
+            return await loop.run_in_executor(self.executor, fn)
+
+        # parse the key before leaving the loop so errors surface here once
+        _ = self.private_key
+        return await loop.run_in_executor(
+            self.executor, self._sign_inline, method, path
+        )
+
+    async def _sign(self, method: str, path: str) -> SignedJWT:
+        if self.signing == "thread":
+            return await self._sign_off_loop(method, path)
+        return self._sign_inline(method, path)
+
+    def _take_presigned(self, key: tuple[str, str]) -> SignedJWT | None:
+        pool = self._presigned.get(key)
+        now = time.time()
+        min_ttl = min(_PRESIGN_MIN_TTL_S, self.expires_in / 4)
+
+        while pool:
+            signed = pool.popleft()
+            if signed.nbf <= now and now + min_ttl < signed.exp:
+                return signed
+
+        return None
+
+    async def _refill(self, key: tuple[str, str]) -> None:
+        try:
+            pool = self._presigned.setdefault(key, deque())
+            while len(pool) < self.presign_depth:
+                pool.append(await self._sign_off_loop(*key))
+        except Exception:
+            # the foreground path re-signs and reports errors itself
+            _log.warning("presign refill failed for %s %s", *key, exc_info=True)
+        finally:
+            self._refilling.pop(key, None)
+
+    def _schedule_refill(self, key: tuple[str, str]) -> None:
+        loop = asyncio.get_running_loop()
+        # a refill left pending when its loop closed never reaches its
+        # finally, so only one running on this loop counts
+        if self._refilling.get(key) is loop:
+            return
+
+        self._refilling[key] = loop
+        task = loop.create_task(self._refill(key))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
     async def headers(
         self,
         *,
@@ -70,15 +204,13 @@ class CoinbaseAuth:
         if method is None or path is None:
             raise ValueError("CoinbaseAuth.headers requires method and path")
 
+        key = (method.upper(), path)
+        hot = key in self._hot_paths
+
         try:
-            token = build_coinbase_jwt(
-                key_name=self.api_key,
-                key_secret=self.api_secret,
-                method=method,
-                host=self.host,
-                path=path,
-                expires_in=self.expires_in,
-            )
+            signed = self._take_presigned(key) if hot else None
+            if signed is None:
+                signed = await self._sign(key[0], path)
 
         except ValueError as e:
             raise AuthError(
@@ -94,4 +226,7 @@ class CoinbaseAuth:
                 details=str(e),
             ) from e
 
-        return {"Authorization": f"Bearer {token}"}
+        if hot:
+            self._schedule_refill(key)
+
+        return {"Authorization": f"Bearer {signed.token}"}
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Hashable, Mapping
+
+Fetch = Callable[[], Awaitable[Any]]
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass
+class _Entry:
+    value: Any
+    size: int
+    fresh_until: float
+    stale_until: float
+
+
+def _approx_size(value: Any) -> int:
+    try:
+        return len(json.dumps(value, default=str))
+    except (TypeError, ValueError):
+        return len(repr(value))
+
+
+class ResponseCache:
+    """
+    In-process TTL cache for read-only provider responses.
+
+    - ttls: per-endpoint freshness in seconds; endpoints without a TTL bypass
+      the cache entirely
+    - stale_s: stale-while-revalidate window; a stale hit is served
+      immediately while one background refresh runs
+    - max_entries / max_bytes: LRU eviction bounds (size is the approximate
+      JSON-encoded size of the cached value)
+    """
+
+    def __init__(
+        self,
+        ttls: Mapping[str, float] | None = None,
+        *,
+        stale_s: float = 30.0,
+        max_entries: int = 512,
+        max_bytes: int = 8 * 1024 * 1024,
+    ) -> None:
+        self.ttls = dict(ttls or {})
+        self.stale_s = stale_s
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+
+        self._entries: OrderedDict[Hashable, _Entry] = OrderedDict()
+        self._bytes = 0
+        self._refreshing: dict[Hashable, asyncio.Task[None]] = {}
+
+        self.hits = 0
+        self.stale_hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        return self._bytes
+
+    def ttl_for(self, endpoint: str) -> float | None:
+        return self.ttls.get(endpoint)
+
+    def _drop(self, key: Hashable) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= entry.size
+
+    def _store(self, key: Hashable, endpoint: str, value: Any) -> None:
+        ttl = self.ttls[endpoint]
+        size = _approx_size(value)
+
+        self._drop(key)
+        if size > self.max_bytes:
+            return
+
+        now = time.monotonic()
+        self._entries[key] = _Entry(
+            value=value,
+            size=size,
+            fresh_until=now + ttl,
+            stale_until=now + ttl + self.stale_s,
+        )
+        self._bytes += size
+
+        while self._entries and (
+            len(self._entries) > self.max_entries or self._bytes > self.max_bytes
+        ):
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+
+    async def _refresh(self, key: Hashable, endpoint: str, fetch: Fetch) -> None:
+        try:
+            self._store(key, endpoint, await fetch())
+        except Exception:
+            # keep serving the stale value until it ages out
+            _log.warning("background refresh of %r failed", key, exc_info=True)
+        finally:
+            self._refreshing.pop(key, None)
+
+    def _schedule_refresh(self, key: Hashable, endpoint: str, fetch: Fetch) -> None:
+        if key in self._refreshing:
+            return
+        task = asyncio.get_running_loop().create_task(
+            self._refresh(key, endpoint, fetch)
+        )
+        self._refreshing[key] = task
+
+    async def get_or_fetch(
+        self,
+        key: tuple[Hashable, ...],
+        *,
+        endpoint: str,
+        fetch: Fetch,
+    ) -> Any:
+        if endpoint not in self.ttls:
+            return await fetch()
+
+        full_key = (endpoint, *key)
+        entry = self._entries.get(full_key)
+        now = time.monotonic()
+
+        if entry is not None:
+            if now < entry.fresh_until:
+                self.hits += 1
+                self._entries.move_to_end(full_key)
+                return entry.value
+
+            if now < entry.stale_until:
+                self.stale_hits += 1
+                self._entries.move_to_end(full_key)
+                self._schedule_refresh(full_key, endpoint, fetch)
+                return entry.value
+
+            # past its hard TTL: never served, even if the refetch fails
+            self._drop(full_key)
+
+        self.misses += 1
+        value = await fetch()
+        self._store(full_key, endpoint, value)
+        return value
+
+    def invalidate(
+        self,
+        endpoint: str | None = None,
+        *,
+        namespace: Hashable | None = None,
+    ) -> int:
+        """
+        Drop cached entries, optionally only for one endpoint and/or one
+        namespace (the first element of the caller's key). Returns the
+        number of entries removed.
+        """
+        doomed = [
+            k
+            for k in self._entries
+            if (endpoint is None or k[0] == endpoint)
+            and (namespace is None or (len(k) > 1 and k[1] == namespace))
+        ]
+        for k in doomed:
+            self._drop(k)
+        return len(doomed)
+
+
+def resolve_response_cache(
+    cache: ResponseCache | bool | None,
+    *,
+    default_ttls: Mapping[str, float],
+) -> ResponseCache | None:
+    """
+    Factory helper: True builds a cache with the domain's default TTLs,
+    False/None disables caching, an explicit ResponseCache is used as-is.
+    """
+    if cache is None or cache is False:
+        return None
+    if cache is True:
+        return ResponseCache(default_ttls)
+    return cache
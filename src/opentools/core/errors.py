@@ -81,6 +81,8 @@ class AuthError(OpenToolsError):
 class RateLimitError(OpenToolsError):
     kind: ErrorKind = field(default="rate_limit", init=False)
     retry_after_s: Optional[float] = None
+    # raised by our own RateLimiter (queue wait over max_wait_s), not the provider
+    client_side: bool = False
 
 
 @dataclass
@@ -0,0 +1,81 @@
+from __future__ import annotations
+
+import json
+from typing import Any, Iterator
+
+_WS = " \t\n\r"
+
+
+class JsonArrayStream:
+    """
+    Incremental parser for a top-level JSON array.
+
+    feed() text chunks as they arrive and iterate the returned items; only
+    the current partial element is buffered, so memory scales with the
+    largest element rather than the whole document.
+    """
+
+    def __init__(self) -> None:
+        self._decoder = json.JSONDecoder()
+        self._buf = ""
+        self._started = False
+        self._done = False
+
+    @property
+    def done(self) -> bool:
+        return self._done
+
+    def feed(self, chunk: str) -> Iterator[Any]:
+        self._buf += chunk
+        return self._drain(final=False)
+
+    def close(self) -> Iterator[Any]:
+        """
+        Signal end of input; raises ValueError if the array is incomplete.
+        """
+        yield from self._drain(final=True)
+        if not self._done:
+            raise ValueError("Truncated JSON array")
+
+    def _drain(self, *, final: bool) -> Iterator[Any]:
+        buf = self._buf
+        pos = 0
+        n = len(buf)
+
+        while not self._done:
+            while pos < n and buf[pos] in _WS:
+                pos += 1
+            if pos >= n:
+                break
+
+            if not self._started:
+                if buf[pos] != "[":
+                    raise ValueError("Expected a JSON array")
+                self._started = True
+                pos += 1
+                continue
+
+            ch = buf[pos]
+            if ch == "]":
+                self._done = True
+                pos += 1
+                break
+            if ch == ",":
+                pos += 1
+                continue
+
+            try:
+                item, end = self._decoder.raw_decode(buf, pos)
+            except json.JSONDecodeError:
+                if final:
+                    raise ValueError("Invalid JSON array element") from None
+                break
+
+            # a scalar ending exactly at the buffer edge may be cut short
+            if end >= n and not final:
+                break
+
+            pos = end
+            yield item
+
+        self._buf = buf[pos:]
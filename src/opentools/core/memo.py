@@ -0,0 +1,172 @@
+from __future__ import annotations
+
+import asyncio
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Hashable
+
+from .results import RunSummary
+from .tool_runner import ToolRunner
+from .tools import ToolInput
+
+Fetch = Callable[[], Awaitable[Any]]
+
+
+def canonical_args(tool_input: ToolInput) -> str:
+    """
+    Key form of a tool's arguments: key order and whitespace do not matter.
+    """
+    return json.dumps(tool_input, sort_keys=True, separators=(",", ":"), default=str)
+
+
+def _is_error(result: Any) -> bool:
+    return isinstance(result, dict) and result.get("ok") is False
+
+
+class ToolMemo:
+    """
+    Memo of tool results keyed by tool name and canonical arguments.
+
+    - ttl_s: how long a result is reused; None keeps it for the memo's lifetime
+    - max_entries: LRU bound on stored results
+
+    Error results are never stored, and concurrent identical calls share one
+    in-flight call.
+    """
+
+    def __init__(self, ttl_s: float | None = 30.0, *, max_entries: int = 256) -> None:
+        self.ttl_s = ttl_s
+        self.max_entries = max_entries
+
+        # key -> (expires_at, result)
+        self._entries: OrderedDict[Hashable, tuple[float | None, Any]] = OrderedDict()
+        self._inflight: dict[Hashable, asyncio.Future[Any]] = {}
+
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _store(self, key: Hashable, result: Any) -> None:
+        expires = None if self.ttl_s is None else time.monotonic() + self.ttl_s
+        self._entries[key] = (expires, result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def _settle(self, key: Hashable, task: asyncio.Future[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if not _is_error(task.result()):
+            self._store(key, task.result())
+
+    def _hit(self, summary: RunSummary | None) -> None:
+        self.hits += 1
+        if summary is not None:
+            summary.memo_hits += 1
+
+    async def call(
+        self,
+        tool_name: str,
+        tool_input: ToolInput,
+        fetch: Fetch,
+        *,
+        summary: RunSummary | None = None,
+    ) -> Any:
+        key = (tool_name, canonical_args(tool_input))
+
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, result = entry
+            if expires is None or time.monotonic() < expires:
+                self._hit(summary)
+                self._entries.move_to_end(key)
+                return result
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self._hit(summary)
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(fetch())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._settle(key, t))
+
+        return await asyncio.shield(task)
+
+    def invalidate(self, tool_name: str | None = None) -> int:
+        """
+        Drop stored results, optionally only for one tool. Returns the number
+        of entries removed.
+        """
+        doomed = [k for k in self._entries if tool_name is None or k[0] == tool_name]
+        for k in doomed:
+            del self._entries[k]
+        return len(doomed)
+
+
+class MemoizedRunner:
+    """
+    ToolRunner that answers repeated read-only tool calls from a ToolMemo.
+
+    Tools are read-only when the wrapped service lists them in
+    `read_only_tools` (ToolSpec.read_only); every other call goes straight
+    through to the service.
+    """
+
+    def __init__(
+        self,
+        service: ToolRunner,
+        memo: ToolMemo,
+        *,
+        summary: RunSummary | None = None,
+    ) -> None:
+        self.service = service
+        self.memo = memo
+        self.summary = summary
+
+    @property
+    def tools(self) -> list[Any]:
+        return self.service.tools
+
+    @property
+    def read_only_tools(self) -> frozenset[str]:
+        return getattr(self.service, "read_only_tools", frozenset())
+
+    @property
+    def fatal_tool_error_kinds(self) -> tuple[str, ...]:
+        return getattr(self.service, "fatal_tool_error_kinds", ("auth", "config"))
+
+    async def call_tool(self, tool_name: str, tool_input: ToolInput) -> Any:
+        if tool_name not in self.read_only_tools:
+            return await self.service.call_tool(tool_name, tool_input)
+        return await self.memo.call(
+            tool_name,
+            tool_input,
+            lambda: self.service.call_tool(tool_name, tool_input),
+            summary=self.summary,
+        )
+
+
+def with_tool_memo(
+    service: ToolRunner,
+    memo: ToolMemo | bool | None,
+    *,
+    summary: RunSummary | None = None,
+) -> ToolRunner:
+    """
+    Adapter helper: True puts a fresh per-run ToolMemo in front of the
+    service, False/None leaves it as is, an explicit ToolMemo (e.g. one
+    with a custom ttl_s, or a session's) is used as-is. Hits are counted
+    in summary.memo_hits.
+    """
+    if memo is None or memo is False:
+        return service
+    if memo is True:
+        memo = ToolMemo()
+    return MemoizedRunner(service, memo, summary=summary)
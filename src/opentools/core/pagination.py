@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable
+from typing import Any, TypeVar
+
+T = TypeVar("T")
+
+PageFetch = Callable[[Any], Awaitable[Any]]
+PageSplit = Callable[[Any, Any], tuple[list[T], Any]]
+
+
+def cursor_page(key: str) -> PageSplit[dict[str, Any]]:
+    """
+    Splitter for cursor-paginated bodies: {key: [...], "has_next": bool,
+    "cursor": str}.
+    """
+
+    def split(page: Any, _token: Any) -> tuple[list[dict[str, Any]], Any]:
+        items = page.get(key) if isinstance(page, dict) else None
+        cursor = page.get("cursor") if items and page.get("has_next") else None
+        return [i for i in items or () if isinstance(i, dict)], cursor or None
+
+    return split
+
+
+async def paginate(
+    fetch_page: PageFetch,
+    split: PageSplit[T],
+    *,
+    first: Any = None,
+    prefetch: bool = True,
+) -> AsyncIterator[T]:
+    """
+    Yield items page by page.
+
+    fetch_page(token) returns a raw page; split(page, token) returns the
+    page's items and the token for the next page (None when done). With
+    prefetch, the next page is requested as soon as the current one
+    arrives, so network time overlaps with the caller consuming items.
+    Closing the iterator early cancels an outstanding prefetch and waits
+    for it; anything but the cancellation itself propagates.
+    """
+    loop = asyncio.get_running_loop()
+    pending: asyncio.Future[Any] | None = loop.create_task(fetch_page(first))
+    token = first
+
+    try:
+        while pending is not None:
+            page = await pending
+            pending = None
+
+            items, next_token = split(page, token)
+            if next_token is not None and items:
+                token = next_token
+                if prefetch:
+                    pending = loop.create_task(fetch_page(token))
+
+            for item in items:
+                yield item
+
+            if not prefetch and next_token is not None and items:
+                pending = loop.create_task(fetch_page(token))
+    finally:
+        if pending is not None and not pending.done():
+            pending.cancel()
+            try:
+                await pending
+            except asyncio.CancelledError:
+                pass
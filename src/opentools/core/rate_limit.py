@@ -0,0 +1,171 @@
+from __future__ import annotations
+
+import asyncio
+import time
+import warnings
+from dataclasses import dataclass
+
+from .errors import RateLimitError
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """
+    Client-side request budget.
+
+    - requests / per_s: sustained rate (e.g. 200 requests per 60s)
+    - burst: bucket capacity (defaults to `requests`)
+    - max_wait_s: how long a request may queue for a token before failing
+    - min_rate_fraction: floor for the adaptive rate after repeated 429s
+    """
+
+    requests: float
+    per_s: float = 1.0
+    burst: float | None = None
+    max_wait_s: float = 10.0
+    min_rate_fraction: float = 0.1
+
+    @property
+    def rate(self) -> float:
+        return self.requests / self.per_s
+
+    @property
+    def capacity(self) -> float:
+        return float(self.burst if self.burst is not None else self.requests)
+
+
+class RateLimiter:
+    """
+    Async token bucket with a bounded wait and 429/Retry-After adaptation.
+
+    Tokens are reserved synchronously (the balance may go negative, which
+    queues callers in arrival order) and the caller sleeps outside of any
+    lock, so one limiter can be shared by every transport using the same
+    credentials, across event loops.
+    """
+
+    def __init__(
+        self,
+        limit: RateLimit,
+        *,
+        provider: str = "unknown",
+        domain: str = "trading",
+    ) -> None:
+        self.limit = limit
+        self.provider = provider
+        self.domain = domain
+
+        self._rate = limit.rate
+        self._tokens = limit.capacity
+        self._updated = time.monotonic()
+        self._paused_until = 0.0
+
+        self.throttled = 0
+
+    @property
+    def current_rate(self) -> float:
+        return self._rate
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated
+        if elapsed > 0:
+            self._tokens = min(self.limit.capacity, self._tokens + elapsed * self._rate)
+            self._updated = now
+
+    def _reserve(self) -> float:
+        """
+        Reserve one token and return how long the caller must wait for it.
+        """
+        now = time.monotonic()
+        self._refill(now)
+
+        wait = max(0.0, self._paused_until - now)
+        if self._tokens < 1.0:
+            wait = max(wait, (1.0 - self._tokens) / self._rate)
+
+        if wait > self.limit.max_wait_s:
+            raise RateLimitError(
+                message="Client-side rate limit exceeded (request would queue too long)",
+                domain=self.domain,
+                provider=self.provider,
+                retry_after_s=wait,
+                client_side=True,
+                details={
+                    "max_wait_s": self.limit.max_wait_s,
+                    "rate_per_s": self._rate,
+                },
+            )
+
+        self._tokens -= 1.0
+        return wait
+
+    async def acquire(self) -> None:
+        wait = self._reserve()
+        if wait > 0:
+            self.throttled += 1
+            await asyncio.sleep(wait)
+
+    def observe(self, *, status_code: int, retry_after_s: float | None) -> None:
+        """
+        Adapt to provider feedback: back off on 429, recover slowly otherwise.
+        """
+        base = self.limit.rate
+
+        if status_code == 429:
+            now = time.monotonic()
+            self._refill(now)
+            self._rate = max(base * self.limit.min_rate_fraction, self._rate / 2.0)
+            self._tokens = min(self._tokens, 0.0)
+            if retry_after_s is not None:
+                self._paused_until = max(self._paused_until, now + retry_after_s)
+            return
+
+        if self._rate < base:
+            self._rate = min(base, self._rate + base * 0.05)
+
+
+# one limiter per (provider, credential identity)
+_SHARED_LIMITERS: dict[tuple[str, str], RateLimiter] = {}
+
+
+def shared_rate_limiter(
+    limit: RateLimit,
+    *,
+    provider: str,
+    identity: str,
+    domain: str = "trading",
+) -> RateLimiter:
+    """
+    Return the limiter for (provider, identity), creating it on first use.
+    The first configuration registered for a credential wins; asking again
+    with a different RateLimit warns and returns the existing limiter (pass
+    a RateLimiter instance for a separate budget).
+    """
+    key = (provider, identity)
+    limiter = _SHARED_LIMITERS.get(key)
+    if limiter is None:
+        limiter = RateLimiter(limit, provider=provider, domain=domain)
+        _SHARED_LIMITERS[key] = limiter
+    elif limiter.limit != limit:
+        warnings.warn(
+            f"A {provider} rate limiter for these credentials already exists with "
+            f"{limiter.limit!r}; ignoring {limit!r}. Pass a RateLimiter instance "
+            "to use a separate budget.",
+            category=UserWarning,
+            stacklevel=4,
+        )
+    return limiter
+
+
+def resolve_rate_limiter(
+    rate_limit: RateLimit | RateLimiter | None,
+    *,
+    provider: str,
+    identity: str,
+    domain: str = "trading",
+) -> RateLimiter | None:
+    if rate_limit is None or isinstance(rate_limit, RateLimiter):
+        return rate_limit
+    return shared_rate_limiter(
+        rate_limit, provider=provider, identity=identity, domain=domain
+    )
@@ -0,0 +1,202 @@
+from __future__ import annotations
+
+import importlib
+import json
+from dataclasses import dataclass, field
+from typing import Any, Callable, Literal, Mapping
+
+# rough chars-per-token ratio for JSON payloads across model tokenizers
+CHARS_PER_TOKEN = 4
+
+
+@dataclass
+class RunSummary:
+    """
+    Counters for one run_with_tools call; pass summary=RunSummary() to an
+    adapter and read it afterwards.
+    """
+
+    rounds: int = 0
+    tool_calls: int = 0
+
+    # model usage, where the adapter reports it
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cache_read_tokens: int = 0
+    cache_write_tokens: int = 0
+
+    # encoded tool-result size vs. the indent=2 JSON previously sent; only
+    # adapters that send encoded strings count here
+    result_bytes: int = 0
+    truncated_results: int = 0
+
+    # read-only tool calls answered from the tool memo
+    memo_hits: int = 0
+
+    # raw results whose indent=2 size is measured when baseline_bytes is read
+    _baseline: int = field(default=0, init=False, repr=False)
+    _unmeasured: list[Any] = field(
+        default_factory=list, init=False, repr=False, compare=False
+    )
+
+    def add_baseline(self, result: Any) -> None:
+        self._unmeasured.append(result)
+
+    @property
+    def baseline_bytes(self) -> int:
+        for result in self._unmeasured:
+            self._baseline += len(json.dumps(result, indent=2, default=str).encode())
+        self._unmeasured.clear()
+        return self._baseline
+
+    @property
+    def bytes_saved(self) -> int:
+        return max(0, self.baseline_bytes - self.result_bytes)
+
+    @property
+    def tokens_saved_estimate(self) -> int:
+        return self.bytes_saved // CHARS_PER_TOKEN
+
+
+@dataclass(frozen=True)
+class ResultLimit:
+    """
+    Size policy for one tool's results. Lists (top level, or under the
+    tool envelope's "data") are cut to max_items, then shrunk further until
+    the encoded result fits in max_bytes.
+    """
+
+    max_items: int | None = None
+    max_bytes: int | None = None
+
+
+def _load_orjson() -> Any | None:
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+@dataclass
+class ResultEncoder:
+    """
+    Serialises tool results for the model.
+
+    Compact separators by default; backend="auto" uses orjson when it is
+    installed. Truncated lists end with a {"_truncated": True, "omitted": n}
+    marker so the model knows more data exists.
+    """
+
+    compact: bool = True
+    backend: Literal["auto", "json", "orjson"] = "auto"
+
+    default_limit: ResultLimit = field(default_factory=ResultLimit)
+    limits: Mapping[str, ResultLimit] = field(default_factory=dict)
+
+    _dumps: Callable[[Any], str] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.backend == "json":
+            orjson = None
+        elif self.backend == "orjson":
+            # explicitly requested: let a missing install raise
+            orjson = importlib.import_module("orjson")
+        else:
+            orjson = _load_orjson()
+
+        if orjson is not None:
+            option = orjson.OPT_NON_STR_KEYS
+            if not self.compact:
+                option |= orjson.OPT_INDENT_2
+            self._dumps = lambda x: orjson.dumps(x, default=str, option=option).decode()
+        elif self.compact:
+            self._dumps = lambda x: json.dumps(x, separators=(",", ":"), default=str)
+        else:
+            self._dumps = lambda x: json.dumps(x, indent=2, default=str)
+
+    def _dump(self, x: Any) -> str:
+        try:
+            return self._dumps(x)
+        except Exception:
+            # e.g. integers orjson cannot represent
+            return json.dumps(x, default=str)
+
+    def encode(
+        self,
+        result: Any,
+        *,
+        tool_name: str | None = None,
+        summary: RunSummary | None = None,
+    ) -> str:
+        text, truncated = self._encode(result, tool_name)
+        if summary is not None:
+            summary.result_bytes += len(text.encode())
+            summary.add_baseline(result)
+            if truncated:
+                summary.truncated_results += 1
+        return text
+
+    def _encode(self, result: Any, tool_name: str | None) -> tuple[str, bool]:
+        limit = self.limits.get(tool_name or "", self.default_limit)
+
+        payload = result
+        items = _list_of(result)
+        keep = len(items) if items is not None else 0
+        if items is not None and limit.max_items is not None:
+            keep = min(keep, limit.max_items)
+            if keep < len(items):
+                payload = _truncate(result, keep)
+
+        text = self._dump(payload)
+
+        if items is not None and limit.max_bytes is not None:
+            size = len(text.encode())
+            while keep > 0 and size > limit.max_bytes:
+                keep = min(keep - 1, int(keep * limit.max_bytes / size))
+                payload = _truncate(result, keep)
+                text = self._dump(payload)
+                size = len(text.encode())
+
+        return text, payload is not result
+
+    def to_jsonable(
+        self,
+        result: Any,
+        *,
+        tool_name: str | None = None,
+        summary: RunSummary | None = None,
+    ) -> Any:
+        """
+        Same policy as encode(), for adapters that send structured results.
+        The provider serialises these itself, so only truncations are
+        counted in `summary`.
+        """
+        try:
+            text, truncated = self._encode(result, tool_name)
+            jsonable = json.loads(text)
+        except Exception:
+            return {"_unserializable": True, "repr": repr(result)}
+        if summary is not None and truncated:
+            summary.truncated_results += 1
+        return jsonable
+
+
+DEFAULT_RESULT_ENCODER = ResultEncoder()
+
+
+def _list_of(result: Any) -> list[Any] | None:
+    if isinstance(result, list):
+        return result
+    if isinstance(result, dict) and isinstance(result.get("data"), list):
+        return result["data"]
+    return None
+
+
+def _truncate(result: Any, keep: int) -> Any:
+    items = _list_of(result) or []
+    cut = list(items[:keep])
+    cut.append({"_truncated": True, "omitted": len(items) - keep})
+    if isinstance(result, list):
+        return cut
+    return {**result, "data": cut}
@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import random
+from dataclasses import dataclass
+
+from .errors import OpenToolsError
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """
+    Retry/backoff policy used by Transport.
+
+    - max_attempts: total attempts including the first one
+    - base_delay_s / max_delay_s: exponential backoff bounds
+    - jitter: use "full jitter" (random delay in [0, backoff])
+    - deadline_s: total time budget across all attempts and sleeps
+    - retry_kinds: OpenToolsError kinds that are worth retrying
+    - retry_methods: HTTP methods considered idempotent (GET only by default)
+    - respect_retry_after: wait at least retry_after_s when the provider sends it
+
+    Client-side throttling (RateLimitError.client_side) is never retried:
+    the limiter already bounded the wait by max_wait_s.
+    """
+
+    max_attempts: int = 3
+    base_delay_s: float = 0.25
+    max_delay_s: float = 8.0
+    jitter: bool = True
+    deadline_s: float | None = 30.0
+
+    retry_kinds: tuple[str, ...] = ("rate_limit", "transient")
+    retry_methods: tuple[str, ...] = ("GET",)
+    respect_retry_after: bool = True
+
+    def should_retry(self, *, method: str, error: OpenToolsError, attempt: int) -> bool:
+        """
+        attempt is 1-based: the attempt that just failed.
+        """
+        if attempt >= self.max_attempts:
+            return False
+        if method.upper() not in self.retry_methods:
+            return False
+        if getattr(error, "client_side", False):
+            return False
+        return error.kind in self.retry_kinds
+
+    def backoff_s(self, attempt: int) -> float:
+        delay = min(self.max_delay_s, self.base_delay_s * (2 ** (attempt - 1)))
+        if self.jitter:
+            delay = random.uniform(0.0, delay)
+        return delay
+
+    def delay_s(self, *, attempt: int, error: OpenToolsError) -> float:
+        delay = self.backoff_s(attempt)
+
+        retry_after_s = getattr(error, "retry_after_s", None)
+        if self.respect_retry_after and retry_after_s is not None:
+            delay = max(delay, float(retry_after_s))
+
+        return delay
+
+
+# factories do not retry unless asked to, e.g. trading.alpaca(retry=DEFAULT_RETRY_POLICY)
+DEFAULT_RETRY_POLICY = RetryPolicy()
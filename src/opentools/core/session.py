@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable
+
+from .memo import ToolMemo
+from .results import CHARS_PER_TOKEN, RunSummary
+from .tool_runner import ToolRunner
+from .tools import ToolInput
+
+# an adapter's run_with_tools, e.g. opentools.anthropic_chat
+ChatFn = Callable[..., Awaitable[str]]
+
+_COMPACTED: dict[str, Any] = {
+    "_compacted": True,
+    "hint": "Older tool result removed from history; call the tool again if needed.",
+}
+_COMPACTED_TEXT = json.dumps(_COMPACTED, separators=(",", ":"))
+
+
+@dataclass(frozen=True)
+class HistoryPolicy:
+    """
+    How a session keeps its history within budget before each turn.
+
+    Once the estimated history size exceeds max_tokens, tool-result payloads
+    are replaced with a short placeholder, oldest turn first; if that is not
+    enough, whole turns are dropped, oldest first. The newest keep_turns
+    turns are never compacted or dropped.
+    """
+
+    max_tokens: int = 8_000
+    keep_turns: int = 1
+
+
+def _jsonable(x: Any) -> Any:
+    # SDK message objects (Gemini Content, Anthropic blocks) are pydantic
+    dump = getattr(x, "model_dump", None)
+    if callable(dump):
+        return dump(mode="json", exclude_none=True)
+    return str(x)
+
+
+def estimate_tokens(messages: list[Any]) -> int:
+    return len(json.dumps(messages, default=_jsonable)) // CHARS_PER_TOKEN
+
+
+def _compact_message(message: Any) -> None:
+    """
+    Replace the tool-result payloads in one provider-shaped message with the
+    placeholder, in place.
+    """
+    if isinstance(message, dict):
+        # OpenAI / OpenRouter / Ollama
+        if message.get("role") == "tool":
+            message["content"] = _COMPACTED_TEXT
+            return
+
+        # Anthropic
+        content = message.get("content")
+        if isinstance(content, list):
+            for block in content:
+                if isinstance(block, dict) and block.get("type") == "tool_result":
+                    block["content"] = _COMPACTED_TEXT
+        return
+
+    # Gemini
+    for part in getattr(message, "parts", None) or []:
+        response = getattr(part, "function_response", None)
+        if response is not None:
+            response.response = {"result": dict(_COMPACTED)}
+
+
+class _ResolvedRunner:
+    """
+    The service's tool list and read-only set, resolved once per session.
+    """
+
+    def __init__(self, service: ToolRunner) -> None:
+        self.service = service
+        self.tools: list[Any] = service.tools
+        self.read_only_tools: frozenset[str] = getattr(
+            service, "read_only_tools", frozenset()
+        )
+        self.fatal_tool_error_kinds: tuple[str, ...] = getattr(
+            service, "fatal_tool_error_kinds", ("auth", "config")
+        )
+
+    async def call_tool(self, tool_name: str, tool_input: ToolInput) -> Any:
+        return await self.service.call_tool(tool_name, tool_input)
+
+
+@dataclass
+class AgentSession:
+    """
+    Multi-turn conversation over one chat adapter.
+
+    Holds the provider-shaped message history, a ToolMemo shared by every
+    turn and the service's resolved tool list, so a follow-up prompt builds
+    on earlier context instead of starting over. `options` are extra
+    keyword arguments for the adapter (max_rounds, encoder, ...), and
+    `summary` accumulates across turns, including memo hits.
+
+        session = AgentSession(opentools.anthropic_chat, client, model, service)
+        await session.ask("What's in my portfolio?")
+        await session.ask("Which of those positions are down today?")
+
+    A turn that raises is not recorded, so the history stays well formed.
+    """
+
+    chat: ChatFn
+    client: Any
+    model: str
+    service: ToolRunner
+    history: HistoryPolicy = field(default_factory=HistoryPolicy)
+    memo: ToolMemo | None = field(default_factory=ToolMemo)
+    options: dict[str, Any] = field(default_factory=dict)
+    summary: RunSummary = field(default_factory=RunSummary)
+
+    _runner: ToolRunner = field(init=False, repr=False)
+    # one list of messages per completed turn, with its estimated token size
+    _turns: list[list[Any]] = field(default_factory=list, init=False, repr=False)
+    _turn_tokens: list[int] = field(default_factory=list, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._runner = _ResolvedRunner(self.service)
+
+    @property
+    def messages(self) -> list[Any]:
+        return [m for turn in self._turns for m in turn]
+
+    @property
+    def turns(self) -> int:
+        return len(self._turns)
+
+    async def ask(self, prompt: str) -> str:
+        self.compact()
+
+        messages = self.messages
+        start = len(messages)
+        reply = await self.chat(
+            client=self.client,
+            model=self.model,
+            service=self._runner,
+            user_prompt=prompt,
+            messages=messages,
+            summary=self.summary,
+            tool_memo=self.memo,
+            **self.options,
+        )
+
+        turn = messages[start:]
+        self._turns.append(turn)
+        self._turn_tokens.append(estimate_tokens(turn))
+        return reply
+
+    def compact(self) -> None:
+        """
+        Apply the history policy now; ask() does this before every turn.
+        """
+        budget = self.history.max_tokens
+        keep = self.history.keep_turns
+        if sum(self._turn_tokens) <= budget:
+            return
+
+        for i in range(max(0, len(self._turns) - keep)):
+            for message in self._turns[i]:
+                _compact_message(message)
+            self._turn_tokens[i] = estimate_tokens(self._turns[i])
+            if sum(self._turn_tokens) <= budget:
+                return
+
+        while len(self._turns) > keep and sum(self._turn_tokens) > budget:
+            del self._turns[0]
+            del self._turn_tokens[0]
+
+    def reset(self) -> None:
+        """
+        Forget the conversation and every memoized tool result.
+        """
+        self._turns.clear()
+        self._turn_tokens.clear()
+        if self.memo is not None:
+            self.memo.invalidate()
@@ -0,0 +1,61 @@
+from __future__ import annotations
+
+import asyncio
+import copy
+from typing import Any, Awaitable, Callable, Hashable
+
+
+class _Flight:
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Task[Any]) -> None:
+        self.task = task
+        self.waiters = 0
+
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls: while a call for `key` is in flight,
+    later callers await the same task instead of starting their own.
+
+    The shared task is shielded, so one caller being cancelled never cancels
+    the request for everyone else. When a call was shared, every caller gets
+    its own deep copy of the result, so one caller mutating it cannot affect
+    the others; an unshared call returns the result as is.
+    """
+
+    def __init__(self) -> None:
+        self._inflight: dict[Hashable, _Flight] = {}
+        self.calls = 0
+        self.hits = 0
+
+    def _forget(self, key: Hashable, task: asyncio.Task[Any]) -> None:
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        loop = asyncio.get_running_loop()
+        self.calls += 1
+
+        flight = self._inflight.get(key)
+        if (
+            flight is not None
+            and not flight.task.done()
+            and flight.task.get_loop() is loop
+        ):
+            self.hits += 1
+        else:
+            task = loop.create_task(fn())
+            flight = _Flight(task)
+            self._inflight[key] = flight
+            task.add_done_callback(lambda t: self._forget(key, t))
+
+        flight.waiters += 1
+        result = await asyncio.shield(flight.task)
+        # nobody can join once the task is done, so the count is final here
+        return result if flight.waiters == 1 else copy.deepcopy(result)
+
+
+# process-wide group so services sharing credentials also share in-flight GETs
+DEFAULT_SINGLEFLIGHT = SingleFlight()
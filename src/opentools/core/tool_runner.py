@@ -1,7 +1,9 @@
 from __future__ import annotations
 
-from typing import Any, Protocol
+import asyncio
+from typing import Any, Awaitable, Callable, Protocol, Sequence, cast
 
+from .tool_policy import raise_if_fatal_tool_error
 from .tools import ToolInput
 
 
@@ -16,3 +18,114 @@ class ToolRunner(Protocol):
     @property
     def tools(self) -> list[Any]: ...
     async def call_tool(self, tool_name: str, tool_input: ToolInput) -> Any: ...
+
+
+ToolCall = Callable[[], Awaitable[Any]]
+
+DEFAULT_TOOL_CONCURRENCY = 8
+
+
+class ToolDispatcher:
+    """
+    Starts tool calls as soon as they are known (e.g. while a model response
+    is still streaming) and collects their results in call order with the
+    same fatal semantics as run_tool_calls().
+    """
+
+    def __init__(
+        self,
+        *,
+        fatal_kinds: Sequence[str],
+        max_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+    ) -> None:
+        self._fatal_kinds = fatal_kinds
+        self._sem = asyncio.Semaphore(max_concurrency) if max_concurrency else None
+        self._tasks: list[asyncio.Future[Any]] = []
+
+    def __len__(self) -> int:
+        return len(self._tasks)
+
+    def dispatch(self, call: ToolCall) -> None:
+        self._tasks.append(asyncio.ensure_future(self._run(call)))
+
+    async def _run(self, call: ToolCall) -> Any:
+        if self._sem is None:
+            result = await call()
+        else:
+            async with self._sem:
+                result = await call()
+        raise_if_fatal_tool_error(result, fatal_kinds=self._fatal_kinds)
+        return result
+
+    async def results(self) -> list[Any]:
+        """
+        Wait for every dispatched call. The lowest-index fatal result (or
+        exception) is raised and calls after it are cancelled.
+        """
+        tasks = self._tasks
+        self._tasks = []
+        try:
+            pending: set[asyncio.Future[Any]] = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_EXCEPTION
+                )
+                failed = [
+                    i
+                    for i, t in enumerate(tasks)
+                    if t in done and not t.cancelled() and t.exception() is not None
+                ]
+                if not failed:
+                    continue
+
+                # later calls would never have run sequentially; earlier ones
+                # still get to finish (and may fail first)
+                first = min(failed)
+                for t in tasks[first + 1 :]:
+                    t.cancel()
+                await asyncio.gather(*tasks, return_exceptions=True)
+
+                for t in tasks[: first + 1]:
+                    if not t.cancelled() and t.exception() is not None:
+                        raise cast(BaseException, t.exception())
+
+            return [t.result() for t in tasks]
+        finally:
+            for t in tasks:
+                if not t.done():
+                    t.cancel()
+
+    def cancel(self) -> None:
+        for t in self._tasks:
+            if not t.done():
+                t.cancel()
+        self._tasks = []
+
+
+async def run_tool_calls(
+    calls: Sequence[ToolCall],
+    *,
+    fatal_kinds: Sequence[str],
+    max_concurrency: int | None = DEFAULT_TOOL_CONCURRENCY,
+) -> list[Any]:
+    """
+    Run one round of tool calls concurrently and return results in call order.
+
+    Fatal semantics match sequential execution: the lowest-index fatal result
+    (or exception) is raised, and calls after it are cancelled.
+    max_concurrency=None means unbounded; 1 runs the calls one at a time.
+    """
+    if len(calls) <= 1 or max_concurrency == 1:
+        out: list[Any] = []
+        for call in calls:
+            result = await call()
+            raise_if_fatal_tool_error(result, fatal_kinds=fatal_kinds)
+            out.append(result)
+        return out
+
+    dispatcher = ToolDispatcher(
+        fatal_kinds=fatal_kinds, max_concurrency=max_concurrency
+    )
+    for call in calls:
+        dispatcher.dispatch(call)
+    return await dispatcher.results()
@@ -17,12 +17,15 @@ class ToolSpec:
     - name: internal canonical name
     - description: brief context of the tool
     - input_schema: dictionary
+    - read_only: the tool only reads state, so repeating a call with the
+      same arguments is safe to answer from a memo
     """
 
     name: str
     description: str
     input_schema: dict[str, Any]
     handler: ToolHandler
+    read_only: bool = False
 
 
 @dataclass
@@ -36,6 +39,13 @@ class ToolBundle:
     tools: list[Any]
     dispatch: dict[str, ToolSpec]
 
+    @property
+    def read_only_tools(self) -> frozenset[str]:
+        """
+        Sanitised names of the tools whose specs are marked read_only.
+        """
+        return frozenset(name for name, spec in self.dispatch.items() if spec.read_only)
+
     async def call(self, tool_name: str, tool_input: ToolInput) -> Any:
         """
         Run a tool by its sanitised name (the one the model sees).
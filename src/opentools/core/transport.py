@@ -1,12 +1,60 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Callable, Mapping
+import asyncio
+import logging
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator, Callable, Mapping
 
 import httpx
 
+from opentools.auth import auth_identity
 from opentools.auth.interface import Auth
-from opentools.core.errors import AuthError, ProviderError, TransientError
+from opentools.core.errors import (
+    AuthError,
+    OpenToolsError,
+    ProviderError,
+    TransientError,
+)
+from opentools.core.json_stream import JsonArrayStream
+from opentools.core.rate_limit import RateLimiter
+from opentools.core.retry import RetryPolicy
+from opentools.core.singleflight import DEFAULT_SINGLEFLIGHT, SingleFlight
+
+_log = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PoolLimits:
+    """
+    Connection pool limits for the pooled httpx.AsyncClient.
+
+    - max_connections: hard cap on open connections
+    - max_keepalive_connections: idle connections kept around for reuse
+    - keepalive_expiry: seconds an idle connection is kept before closing
+    """
+
+    max_connections: int = 100
+    max_keepalive_connections: int = 20
+    keepalive_expiry: float = 30.0
+
+    def to_httpx(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+
+@dataclass
+class _PoolEntry:
+    client: httpx.AsyncClient
+    loop: asyncio.AbstractEventLoop
+    refs: int = 0
+
+
+# shared pools keyed by (base_url, timeout, limits)
+_SHARED_POOLS: dict[tuple[str, float, PoolLimits], _PoolEntry] = {}
 
 
 @dataclass
@@ -19,6 +67,124 @@ class Transport:
 
     request_id_header_candidates: tuple[str, ...] = ("x-request-id",)
 
+    # connection pooling
+    limits: PoolLimits = field(default_factory=PoolLimits)
+    share_pool: bool = True
+
+    # retries (None disables)
+    retry: RetryPolicy | None = None
+
+    # client-side rate limiting, usually shared per credential (None disables)
+    rate_limiter: RateLimiter | None = None
+
+    # coalescing of identical in-flight GETs (None disables)
+    singleflight: SingleFlight | None = field(
+        default_factory=lambda: DEFAULT_SINGLEFLIGHT
+    )
+
+    _pool_entry: _PoolEntry | None = field(default=None, init=False, repr=False)
+    _client: httpx.AsyncClient | None = field(default=None, init=False, repr=False)
+    _client_loop: asyncio.AbstractEventLoop | None = field(
+        default=None, init=False, repr=False
+    )
+    # closes of pools left behind by a previous event loop
+    _closing: set[asyncio.Task[None]] = field(
+        default_factory=set, init=False, repr=False
+    )
+
+    def _new_client(self) -> httpx.AsyncClient:
+        return httpx.AsyncClient(timeout=self.timeout, limits=self.limits.to_httpx())
+
+    def _release_pool_entry(self) -> httpx.AsyncClient | None:
+        """
+        Drop this transport's reference to its shared pool entry.
+        Returns the client if this was the last reference and it should be closed.
+        """
+        entry = self._pool_entry
+        self._pool_entry = None
+        if entry is None:
+            return None
+
+        entry.refs -= 1
+        if entry.refs > 0:
+            return None
+
+        key = (self.base_url, self.timeout, self.limits)
+        if _SHARED_POOLS.get(key) is entry:
+            del _SHARED_POOLS[key]
+        return entry.client
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """
+        Lazily create (or join) the connection pool for the running event loop.
+
+        httpx clients are bound to the loop they were first used on, so a
+        transport reused across asyncio.run() calls gets a fresh pool.
+        """
+        loop = asyncio.get_running_loop()
+
+        client = self._client
+        if client is not None and not client.is_closed and self._client_loop is loop:
+            return client
+
+        # the previous pool belongs to another (likely closed) loop: let go of
+        # it, closing it if nobody else uses it
+        stale = self._release_pool_entry() if self.share_pool else client
+        if stale is not None and not stale.is_closed:
+            task = loop.create_task(self._close_stale(stale))
+            self._closing.add(task)
+            task.add_done_callback(self._closing.discard)
+
+        if not self.share_pool:
+            client = self._new_client()
+        else:
+            key = (self.base_url, self.timeout, self.limits)
+            entry = _SHARED_POOLS.get(key)
+            if entry is None or entry.client.is_closed or entry.loop is not loop:
+                entry = _PoolEntry(client=self._new_client(), loop=loop)
+                _SHARED_POOLS[key] = entry
+
+            entry.refs += 1
+            self._pool_entry = entry
+            client = entry.client
+
+        self._client = client
+        self._client_loop = loop
+        return client
+
+    @staticmethod
+    async def _close_stale(client: httpx.AsyncClient) -> None:
+        try:
+            await client.aclose()
+        except Exception:
+            # connections of a closed loop cannot be shut down cleanly; the
+            # client is marked closed and its sockets go with it
+            _log.debug("closing a previous loop's HTTP pool failed", exc_info=True)
+
+    async def aclose(self) -> None:
+        """
+        Release the connection pool. Shared pools are closed once the last
+        transport using them is closed.
+        """
+        client = self._client
+        self._client = None
+        self._client_loop = None
+
+        if self.share_pool:
+            client = self._release_pool_entry()
+
+        if client is not None and not client.is_closed:
+            await client.aclose()
+
+        loop = asyncio.get_running_loop()
+        await asyncio.gather(*(t for t in self._closing if t.get_loop() is loop))
+
+    async def __aenter__(self) -> "Transport":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     async def _headers(self, *, method: str, path: str) -> dict[str, str]:
         try:
             h: Mapping[str, str] = await self.auth.headers(method=method, path=path)
@@ -34,6 +200,15 @@ class Transport:
         headers.setdefault("Accept", "application/json")
         return headers
 
+    def _retry_after_s(self, r: httpx.Response) -> float | None:
+        ra = r.headers.get("retry-after")
+        if not ra:
+            return None
+        try:
+            return float(ra)
+        except ValueError:
+            return None
+
     def _extract_request_id(self, r: httpx.Response) -> str | None:
         for key in self.request_id_header_candidates:
             val = r.headers.get(key)
@@ -50,18 +225,64 @@ class Transport:
         json_body: Any | None = None,
         raise_for_status: Callable | None = None,
     ) -> Any:
-        url = f"{self.base_url}{path}"
-        headers = await self._headers(method=method, path=path)
+        policy = self.retry
+        if policy is None:
+            return await self._request_once(
+                method,
+                path,
+                params=params,
+                json_body=json_body,
+                raise_for_status=raise_for_status,
+            )
 
-        try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                r = await client.request(
+        started = time.monotonic()
+        attempt = 0
+
+        while True:
+            attempt += 1
+            try:
+                return await self._request_once(
                     method,
-                    url,
-                    headers=headers,
+                    path,
                     params=params,
-                    json=json_body,
+                    json_body=json_body,
+                    raise_for_status=raise_for_status,
                 )
+            except OpenToolsError as e:
+                if not policy.should_retry(method=method, error=e, attempt=attempt):
+                    raise
+
+                delay = policy.delay_s(attempt=attempt, error=e)
+                if policy.deadline_s is not None:
+                    elapsed = time.monotonic() - started
+                    if elapsed + delay >= policy.deadline_s:
+                        raise
+
+                await asyncio.sleep(delay)
+
+    async def _request_once(
+        self,
+        method: str,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        json_body: Any | None = None,
+        raise_for_status: Callable | None = None,
+    ) -> Any:
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        url = f"{self.base_url}{path}"
+        headers = await self._headers(method=method, path=path)
+
+        try:
+            r = await self._http_client().request(
+                method,
+                url,
+                headers=headers,
+                params=params,
+                json=json_body,
+            )
         except httpx.TimeoutException as e:
             raise TransientError(
                 message="Request timed out",
@@ -78,14 +299,12 @@ class Transport:
             )
 
         request_id = self._extract_request_id(r)
+        retry_after_s = self._retry_after_s(r)
 
-        retry_after_s: float | None = None
-        ra = r.headers.get("retry-after")
-        if ra:
-            try:
-                retry_after_s = float(ra)
-            except ValueError:
-                retry_after_s = None
+        if self.rate_limiter is not None:
+            self.rate_limiter.observe(
+                status_code=r.status_code, retry_after_s=retry_after_s
+            )
 
         if r.status_code >= 400 and raise_for_status is not None:
             raise_for_status(
@@ -116,11 +335,28 @@ class Transport:
         params: dict[str, Any] | None = None,
         raise_for_status: Callable | None = None,
     ) -> Any:
-        return await self._request(
+        if self.singleflight is None:
+            return await self._request(
+                "GET",
+                path,
+                params=params,
+                raise_for_status=raise_for_status,
+            )
+
+        key = (
             "GET",
-            path,
-            params=params,
-            raise_for_status=raise_for_status,
+            f"{self.base_url}{path}",
+            tuple(sorted((k, repr(v)) for k, v in (params or {}).items())),
+            auth_identity(self.auth),
+        )
+        return await self.singleflight.do(
+            key,
+            lambda: self._request(
+                "GET",
+                path,
+                params=params,
+                raise_for_status=raise_for_status,
+            ),
         )
 
     async def post_json(
@@ -137,6 +373,79 @@ class Transport:
             raise_for_status=raise_for_status,
         )
 
+    async def stream_json_array(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        raise_for_status: Callable | None = None,
+    ) -> AsyncIterator[Any]:
+        """
+        GET a JSON array and yield its elements as they are parsed off the
+        wire. Closing the iterator early drops the rest of the response.
+        Not retried and not coalesced: the response is consumed incrementally.
+        """
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+
+        url = f"{self.base_url}{path}"
+        headers = await self._headers(method="GET", path=path)
+
+        try:
+            async with self._http_client().stream(
+                "GET", url, headers=headers, params=params
+            ) as r:
+                request_id = self._extract_request_id(r)
+                retry_after_s = self._retry_after_s(r)
+                if self.rate_limiter is not None:
+                    self.rate_limiter.observe(
+                        status_code=r.status_code, retry_after_s=retry_after_s
+                    )
+
+                if r.status_code >= 400 and raise_for_status is not None:
+                    await r.aread()
+                    raise_for_status(
+                        status_code=r.status_code,
+                        text=r.text,
+                        domain=self.domain,
+                        provider=self.provider,
+                        request_id=request_id,
+                        retry_after_s=retry_after_s,
+                    )
+
+                parser = JsonArrayStream()
+                try:
+                    async for chunk in r.aiter_text():
+                        for item in parser.feed(chunk):
+                            yield item
+                        if parser.done:
+                            return
+                    for item in parser.close():
+                        yield item
+                except ValueError as e:
+                    raise ProviderError(
+                        message="Provider returned invalid JSON",
+                        domain=self.domain,
+                        provider=self.provider,
+                        status_code=r.status_code,
+                        request_id=request_id,
+                        details={"error": repr(e)},
+                    )
+        except httpx.TimeoutException as e:
+            raise TransientError(
+                message="Request timed out",
+                domain=self.domain,
+                provider=self.provider,
+                details=repr(e),
+            )
+        except httpx.RequestError as e:
+            raise TransientError(
+                message="Network error",
+                domain=self.domain,
+                provider=self.provider,
+                details=repr(e),
+            )
+
     async def get_dict_json(
         self,
         path: str,
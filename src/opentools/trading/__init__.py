@@ -1,10 +1,15 @@
 from __future__ import annotations
 
-from typing import Any, Iterable, Mapping
+from typing import Any, Iterable, Literal, Mapping
 from urllib.parse import urlparse
 
+from opentools.auth import auth_identity
 from opentools.auth.impl import AlpacaAuth, BearerTokenAuth, CoinbaseAuth, HeaderAuth
+from opentools.core.cache import ResponseCache, resolve_response_cache
 from opentools.core.errors import AuthError
+from opentools.core.rate_limit import RateLimit, RateLimiter, resolve_rate_limiter
+from opentools.core.retry import RetryPolicy
+from opentools.core.transport import PoolLimits
 from opentools.core.types import FrameworkName, ModelName
 from opentools.trading.providers.alpaca._endpoints import (
     ALPACA_LIVE_URL,
@@ -19,10 +24,14 @@ from opentools.trading.providers.alpaca.mappers import (
     portfolio_history_from_alpaca,
     position_from_alpaca,
 )
-from opentools.trading.providers.alpaca.transport import AlpacaTransport
+from opentools.trading.providers.alpaca.transport import (
+    ALPACA_DEFAULT_RATE_LIMIT,
+    AlpacaTransport,
+)
 from opentools.trading.providers.coinbase._endpoints import (
     COINBASE_LIVE_URL,
     COINBASE_SANDBOX_URL,
+    PRESIGN_PATHS,
 )
 from opentools.trading.providers.coinbase.client import CoinbaseClient
 from opentools.trading.providers.coinbase.mappers import (
@@ -34,8 +43,14 @@ from opentools.trading.providers.coinbase.mappers import (
     portfolio_from_coinbase,
     position_from_coinbase,
 )
-from opentools.trading.providers.coinbase.transport import CoinbaseTransport
+from opentools.trading.providers.coinbase.transport import (
+    COINBASE_DEFAULT_RATE_LIMIT,
+    CoinbaseTransport,
+)
 from opentools.trading.services import TradingService
+from opentools.trading.services.catalog import AssetCatalog, resolve_asset_catalog
+from opentools.trading.services.clock import ClockCache
+from opentools.trading.services.core import TRADING_READ_TTLS
 
 
 # alpaca
@@ -70,6 +85,13 @@ def alpaca(
     auth: Any | None = None,
     paper: bool = True,
     timeout: float = 30.0,
+    pool_limits: PoolLimits | None = None,
+    share_pool: bool = True,
+    retry: RetryPolicy | None = None,
+    rate_limit: RateLimit | RateLimiter | None = ALPACA_DEFAULT_RATE_LIMIT,
+    cache: ResponseCache | bool | None = None,
+    clock_cache: bool = False,
+    asset_catalog: AssetCatalog | bool = False,
     model: ModelName,
     framework: FrameworkName | None = None,
     include: Iterable[str] | None = None,
@@ -88,6 +110,12 @@ def alpaca(
         base_url=base_url,
         timeout=timeout,
         environment=env,
+        limits=pool_limits or PoolLimits(),
+        share_pool=share_pool,
+        retry=retry,
+        rate_limiter=resolve_rate_limiter(
+            rate_limit, provider="alpaca", identity=auth_identity(alpaca_auth)
+        ),
     )
     client = AlpacaClient(transport=transport)
 
@@ -102,11 +130,14 @@ def alpaca(
         asset_mapper=asset_from_alpaca,
         order_mapper=order_from_alpaca,
         portfolio_history_mapper=portfolio_history_from_alpaca,
+        clock_cache=ClockCache() if clock_cache else None,
+        asset_catalog=resolve_asset_catalog(asset_catalog),
         model=model,
         framework=framework,
         include=inc_tools,
         exclude=exc_tools,
         minimal=minimal,
+        cache=resolve_response_cache(cache, default_ttls=TRADING_READ_TTLS),
     )
 
 
@@ -118,6 +149,8 @@ def _resolve_coinbase_auth(
     api_secret: str | None,
     bearer_token: str | None,
     host: str,
+    jwt_signing: Literal["inline", "thread"] = "inline",
+    presign: tuple[tuple[str, str], ...] = (),
 ) -> Any:
     explicit_api_creds = bool(api_key or api_secret)
     explicit_bearer = bool(bearer_token)
@@ -153,7 +186,13 @@ def _resolve_coinbase_auth(
                 },
             )
 
-        return CoinbaseAuth(api_key=api_key, api_secret=api_secret, host=host)
+        return CoinbaseAuth(
+            api_key=api_key,
+            api_secret=api_secret,
+            host=host,
+            signing=jwt_signing,
+            presign=presign,
+        )
 
     if explicit_bearer:
         return BearerTokenAuth(token=bearer_token)
@@ -164,12 +203,16 @@ def _resolve_coinbase_auth(
                 api_key=str(auth["key_name"]),
                 api_secret=str(auth["private_key"]),
                 host=host,
+                signing=jwt_signing,
+                presign=presign,
             )
         if "api_key" in auth and "api_secret" in auth:
             return CoinbaseAuth(
                 api_key=str(auth["api_key"]),
                 api_secret=str(auth["api_secret"]),
                 host=host,
+                signing=jwt_signing,
+                presign=presign,
             )
         if "Authorization" in auth:
             return HeaderAuth(headers_dict=dict(auth))
@@ -215,8 +258,16 @@ def coinbase(
     api_key: str | None = None,
     api_secret: str | None = None,
     bearer_token: str | None = None,
+    jwt_signing: Literal["inline", "thread"] = "inline",
+    presign_jwts: bool = False,
     paper: bool = False,
     timeout: float = 30.0,
+    pool_limits: PoolLimits | None = None,
+    share_pool: bool = True,
+    retry: RetryPolicy | None = None,
+    rate_limit: RateLimit | RateLimiter | None = COINBASE_DEFAULT_RATE_LIMIT,
+    cache: ResponseCache | bool | None = None,
+    asset_catalog: AssetCatalog | bool = False,
     model: ModelName,
     framework: FrameworkName | None = None,
     include: Iterable[str] | None = None,
@@ -233,6 +284,8 @@ def coinbase(
         api_secret=api_secret,
         bearer_token=bearer_token,
         host=host,
+        jwt_signing=jwt_signing,
+        presign=PRESIGN_PATHS if presign_jwts else (),
     )
 
     transport = CoinbaseTransport(
@@ -240,6 +293,12 @@ def coinbase(
         base_url=base_url,
         timeout=timeout,
         environment=env,
+        limits=pool_limits or PoolLimits(),
+        share_pool=share_pool,
+        retry=retry,
+        rate_limiter=resolve_rate_limiter(
+            rate_limit, provider="coinbase", identity=auth_identity(cb_auth)
+        ),
     )
     client = CoinbaseClient(transport=transport)
 
@@ -255,9 +314,11 @@ def coinbase(
         order_mapper=order_from_coinbase,
         portfolio_mapper=portfolio_from_coinbase,
         portfolio_breakdown_mapper=portfolio_breakdown_from_coinbase,
+        asset_catalog=resolve_asset_catalog(asset_catalog),
         model=model,
         framework=framework,
         include=inc_tools,
         exclude=exc_tools,
         minimal=minimal,
+        cache=resolve_response_cache(cache, default_ttls=TRADING_READ_TTLS),
     )
@@ -1,7 +1,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from datetime import timedelta
+from typing import Any, AsyncIterator, ClassVar, Literal
 
 from .clients import (
     get_account,
@@ -10,8 +11,10 @@ from .clients import (
     list_positions,
 )
 from .clients.assets import get_asset as _get_asset
+from .clients.assets import iter_assets as _iter_assets
 from .clients.assets import list_assets as _list_assets
 from .clients.orders import get_order as _get_order
+from .clients.orders import iter_orders as _iter_orders
 from .clients.orders import list_orders as _list_orders
 from .clients.portfolio import (
     get_portfolio_history as _get_portfolio_history,
@@ -24,6 +27,13 @@ class AlpacaClient:
     transport: AlpacaTransport
     provider: str = "alpaca"
 
+    # iter_orders extras the trading service may pass through
+    supports_order_windows: ClassVar[bool] = True
+    supports_order_cursors: ClassVar[bool] = True
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
     # account
     async def get_account(self, account_uuid: str | None = None) -> dict[str, Any]:
         return await get_account(self.transport)
@@ -45,6 +55,24 @@ class AlpacaClient:
     async def get_position(self, symbol_or_asset_id: str) -> dict[str, Any]:
         return await get_position(self.transport, symbol_or_asset_id)
 
+    async def get_positions(
+        self, symbols_or_asset_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Batch lookup answered from one /v2/positions call. Keys are the
+        requested identifiers; missing positions map to {}.
+        """
+        index: dict[str, dict[str, Any]] = {}
+        for p in await self.list_positions():
+            for key in ("symbol", "asset_id"):
+                v = p.get(key)
+                if isinstance(v, str) and v:
+                    index.setdefault(v.upper(), p)
+
+        return {
+            s: dict(index.get(s.strip().upper()) or {}) for s in symbols_or_asset_ids
+        }
+
     # clock
     async def get_clock(self) -> dict[str, Any]:
         return await get_clock(self.transport)
@@ -66,6 +94,23 @@ class AlpacaClient:
             attributes=attributes,
         )
 
+    def iter_assets(
+        self,
+        *,
+        status: str | None = None,
+        asset_class: str | None = None,
+        exchange: str | None = None,
+        attributes: list[str] | None = None,
+        limit: int | None = None,  # unused: one streamed response
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _iter_assets(
+            self.transport,
+            status=status,
+            asset_class=asset_class,
+            exchange=exchange,
+            attributes=attributes,
+        )
+
     async def get_asset(self, symbol_or_asset_id: str) -> dict[str, Any]:
         return await _get_asset(self.transport, symbol_or_asset_id)
 
@@ -100,6 +145,40 @@ class AlpacaClient:
             after_order_id=after_order_id,
         )
 
+    def iter_orders(
+        self,
+        *,
+        status: str | None = None,
+        after: str | None = None,
+        until: str | None = None,
+        direction: str | None = None,
+        nested: bool | None = None,
+        symbols: list[str] | None = None,
+        side: str | None = None,
+        asset_class: list[str] | None = None,
+        before_order_id: str | None = None,
+        after_order_id: str | None = None,
+        cursor: Literal["time", "order_id"] = "time",
+        window: timedelta | None = None,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _iter_orders(
+            self.transport,
+            status=status,
+            after=after,
+            until=until,
+            direction=direction,
+            nested=nested,
+            symbols=symbols,
+            side=side,
+            asset_class=asset_class,
+            before_order_id=before_order_id,
+            after_order_id=after_order_id,
+            cursor=cursor,
+            window=window,
+            max_concurrency=max_concurrency,
+        )
+
     async def get_order(
         self,
         order_id: str,
@@ -1,20 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+from contextlib import aclosing
+from typing import Any, AsyncIterator
 from urllib.parse import urlencode
 
 from .._endpoints import ASSET_PATH, ASSETS_PATH
 from ..transport import AlpacaTransport
 
 
-async def list_assets(
-    transport: AlpacaTransport,
+def _assets_query(
     *,
-    status: str | None = None,
-    asset_class: str | None = None,
-    exchange: str | None = None,
-    attributes: list[str] | None = None,
-) -> list[dict[str, Any]]:
+    status: str | None,
+    asset_class: str | None,
+    exchange: str | None,
+    attributes: list[str] | None,
+) -> str:
     params: dict[str, str] = {}
 
     if status is not None:
@@ -26,11 +26,51 @@ async def list_assets(
     if attributes:
         params["attributes"] = ",".join(attributes)
 
-    query = f"?{urlencode(params)}" if params else ""
+    return f"?{urlencode(params)}" if params else ""
+
 
+async def list_assets(
+    transport: AlpacaTransport,
+    *,
+    status: str | None = None,
+    asset_class: str | None = None,
+    exchange: str | None = None,
+    attributes: list[str] | None = None,
+) -> list[dict[str, Any]]:
+    query = _assets_query(
+        status=status,
+        asset_class=asset_class,
+        exchange=exchange,
+        attributes=attributes,
+    )
     return await transport.get_list_json(ASSETS_PATH + query)
 
 
+async def iter_assets(
+    transport: AlpacaTransport,
+    *,
+    status: str | None = None,
+    asset_class: str | None = None,
+    exchange: str | None = None,
+    attributes: list[str] | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream /v2/assets element by element instead of decoding the whole
+    catalog (tens of thousands of entries) up front.
+    """
+    query = _assets_query(
+        status=status,
+        asset_class=asset_class,
+        exchange=exchange,
+        attributes=attributes,
+    )
+    # closing this iterator early must release the HTTP response too
+    async with aclosing(transport.stream_json_array(ASSETS_PATH + query)) as items:
+        async for item in items:
+            if isinstance(item, dict):
+                yield item
+
+
 async def get_asset(
     transport: AlpacaTransport,
     symbol_or_asset_id: str,
@@ -1,11 +1,20 @@
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+from collections import deque
+from contextlib import aclosing
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Literal
 from urllib.parse import urlencode
 
 from .._endpoints import ORDER_PATH, ORDERS_PATH
 from ..transport import AlpacaTransport
 
+# /v2/orders returns at most this many orders per request
+ORDERS_PAGE_LIMIT = 500
+
+_EDGE = timedelta(microseconds=1)
+
 
 async def list_orders(
     transport: AlpacaTransport,
@@ -67,3 +76,194 @@ async def get_order(
     query = f"?{urlencode(params)}" if params else ""
 
     return await transport.get_dict_json(path + query)
+
+
+def _to_dt(value: str | datetime) -> datetime:
+    if isinstance(value, datetime):
+        dt = value
+    else:
+        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+def _to_param(dt: datetime) -> str:
+    return dt.astimezone(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+async def _walk_orders(
+    transport: AlpacaTransport,
+    *,
+    after: str | None,
+    until: str | None,
+    direction: str,
+    cursor: Literal["time", "order_id"],
+    page_size: int,
+    after_order_id: str | None,
+    before_order_id: str | None,
+    filters: dict[str, Any],
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Page through one [after, until] range. Each request restarts at the
+    last order seen: by its submitted_at (widened by 1µs so orders sharing
+    that instant are not skipped) or by its id.
+    """
+    page_after, page_until = after, until
+    after_id, before_id = after_order_id, before_order_id
+    previous: set[str] = set()
+
+    while True:
+        page = await list_orders(
+            transport,
+            limit=page_size,
+            after=page_after,
+            until=page_until,
+            direction=direction,
+            after_order_id=after_id,
+            before_order_id=before_id,
+            **filters,
+        )
+
+        fresh = [o for o in page if o.get("id") not in previous]
+        for order in fresh:
+            yield order
+
+        if len(page) < page_size or not fresh:
+            return
+
+        last = page[-1]
+        if cursor == "order_id":
+            if direction == "asc":
+                after_id = last.get("id")
+            else:
+                before_id = last.get("id")
+        else:
+            edge = last.get("submitted_at")
+            if not edge:
+                return
+            if direction == "asc":
+                page_after = _to_param(_to_dt(edge) - _EDGE)
+            else:
+                page_until = _to_param(_to_dt(edge) + _EDGE)
+
+        # only the previous page can overlap the next one
+        previous = {o.get("id") for o in page}
+
+
+async def iter_orders(
+    transport: AlpacaTransport,
+    *,
+    status: str | None = None,
+    after: str | None = None,
+    until: str | None = None,
+    direction: str | None = None,
+    nested: bool | None = None,
+    symbols: list[str] | None = None,
+    side: str | None = None,
+    asset_class: list[str] | None = None,
+    before_order_id: str | None = None,
+    after_order_id: str | None = None,
+    cursor: Literal["time", "order_id"] = "time",
+    window: timedelta | None = None,
+    max_concurrency: int = 1,
+    page_size: int = ORDERS_PAGE_LIMIT,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Stream every matching order, past the 500-per-request cap.
+
+    Without `window` the [after, until] range is walked page by page. With
+    `window`, the range is split into consecutive windows (after is
+    required; until defaults to now) and up to `max_concurrency` windows
+    are fetched at once, each buffering at most `page_size` orders ahead of
+    the reader; orders still come out in `direction` order and duplicates
+    on window edges are dropped.
+    """
+    order_dir = direction or "desc"
+    filters: dict[str, Any] = {
+        "status": status,
+        "nested": nested,
+        "symbols": symbols,
+        "side": side,
+        "asset_class": asset_class,
+    }
+
+    def walk(a: str | None, b: str | None) -> AsyncIterator[dict[str, Any]]:
+        return _walk_orders(
+            transport,
+            after=a,
+            until=b,
+            direction=order_dir,
+            cursor=cursor,
+            page_size=page_size,
+            after_order_id=after_order_id,
+            before_order_id=before_order_id,
+            filters=filters,
+        )
+
+    if window is None:
+        async with aclosing(walk(after, until)) as orders:
+            async for order in orders:
+                yield order
+        return
+
+    if after is None:
+        raise ValueError("iter_orders(window=...) needs an `after` bound")
+    if window <= timedelta(0):
+        raise ValueError("window must be positive")
+
+    start = _to_dt(after)
+    end = _to_dt(until) if until is not None else datetime.now(timezone.utc)
+
+    # Alpaca's after/until are both exclusive, so each inner window reaches
+    # 1µs past its edge to take in orders submitted exactly on it; the next
+    # window starts after that edge
+    bounds: list[tuple[str, str]] = []
+    lo = start
+    while lo < end:
+        hi = min(lo + window, end)
+        bounds.append((_to_param(lo), _to_param(hi + _EDGE if hi < end else hi)))
+        lo = hi
+    if order_dir != "asc":
+        bounds.reverse()
+
+    # each window streams into its own bounded queue, ended by None or the
+    # exception that stopped it; windows ahead of the one being read block
+    # once their queue is full
+    async def pump(a: str, b: str, queue: asyncio.Queue[Any]) -> None:
+        try:
+            async with aclosing(walk(a, b)) as orders:
+                async for order in orders:
+                    await queue.put(order)
+        except Exception as exc:
+            await queue.put(exc)
+            return
+        await queue.put(None)
+
+    loop = asyncio.get_running_loop()
+    remaining = deque(bounds)
+    in_flight: deque[tuple[asyncio.Task[None], asyncio.Queue[Any]]] = deque()
+    previous: set[str] = set()
+
+    try:
+        while remaining or in_flight:
+            while remaining and len(in_flight) < max(1, max_concurrency):
+                queue: asyncio.Queue[Any] = asyncio.Queue(maxsize=page_size)
+                task = loop.create_task(pump(*remaining.popleft(), queue))
+                in_flight.append((task, queue))
+
+            task, queue = in_flight[0]
+            # only adjacent windows can overlap
+            current: set[str] = set()
+            while (item := await queue.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                if item.get("id") not in previous:
+                    yield item
+                current.add(item.get("id"))
+            in_flight.popleft()
+            await task
+            previous = current
+    finally:
+        for task, _ in in_flight:
+            task.cancel()
+        if in_flight:
+            await asyncio.gather(*(t for t, _ in in_flight), return_exceptions=True)
@@ -17,7 +17,11 @@ from ...schemas import (
 def _parse_dt(s: str | None) -> datetime | None:
     if not s:
         return None
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    # normalise once here so mapper-built models can skip validation
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 def _parse_ts(value: Any) -> datetime | None:
@@ -65,7 +69,7 @@ def account_from_alpaca(data: dict[str, Any]) -> Account:
         "provider_fields",
     }
 
-    return Account(
+    return Account.trusted(
         provider="alpaca",
         id=data.get("id"),
         status=data.get("status"),
@@ -97,7 +101,7 @@ def position_from_alpaca(data: dict[str, Any]) -> Position | None:
         "provider_fields",
     }
 
-    return Position(
+    return Position.trusted(
         provider="alpaca",
         symbol=symbol,
         qty=data.get("qty"),
@@ -121,7 +125,7 @@ def clock_from_alpaca(data: dict[str, Any]) -> Clock:
         "provider_fields",
     }
 
-    return Clock(
+    return Clock.trusted(
         provider="alpaca",
         timestamp=_parse_dt(data.get("timestamp")),
         is_open=data.get("is_open"),
@@ -152,7 +156,7 @@ def asset_from_alpaca(data: dict[str, Any]) -> Asset | None:
         "provider_fields",
     }
 
-    return Asset(
+    return Asset.trusted(
         provider="alpaca",
         id=data.get("id"),
         symbol=symbol,
@@ -196,7 +200,7 @@ def order_from_alpaca(data: dict[str, Any]) -> Order | None:
         "provider_fields",
     }
 
-    return Order(
+    return Order.trusted(
         provider="alpaca",
         id=order_id,
         client_order_id=data.get("client_order_id"),
@@ -246,7 +250,7 @@ def portfolio_history_from_alpaca(data: dict[str, Any]) -> PortfolioHistory:
             pl_pct_val = float(pl_pcts[i])
 
         points.append(
-            PortfolioHistoryPoint(
+            PortfolioHistoryPoint.trusted(
                 timestamp=ts,
                 equity=float(equity_raw),
                 profit_loss=pl_val,
@@ -266,7 +270,7 @@ def portfolio_history_from_alpaca(data: dict[str, Any]) -> PortfolioHistory:
         "provider_fields",
     }
 
-    return PortfolioHistory(
+    return PortfolioHistory.trusted(
         provider="alpaca",
         timeframe=data.get("timeframe"),
         base_value=float(data["base_value"])
@@ -59,6 +59,20 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
             return None
         return minimal(asset, minimal=service.minimal)
 
+    async def _search_assets_tool(
+        query: str,
+        limit: int = 10,
+        asset_class: str | None = None,
+        tradable: bool | None = None,
+    ) -> List[Dict[str, Any]]:
+        assets: List[Asset] = await service.search_assets(
+            query,
+            limit=limit,
+            asset_class=asset_class,
+            tradable=tradable,
+        )
+        return minimal(assets, minimal=service.minimal)
+
     async def _list_orders_tool(
         status: str | None = None,
         limit: int | None = None,
@@ -131,6 +145,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_account_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_positions",
@@ -144,6 +159,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_positions_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_position",
@@ -165,6 +181,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_position_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_clock",
@@ -179,6 +196,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_clock_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_assets",
@@ -221,6 +239,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_assets_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_asset",
@@ -242,6 +261,44 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_asset_tool),
+            read_only=True,
+        ),
+        ToolSpec(
+            name=f"{prefix}_search_assets",
+            description=(
+                "Search Alpaca assets by symbol, symbol prefix or name, with a "
+                "fuzzy fallback for near-miss spellings. Answered from a local "
+                "asset catalog (loaded once, refreshed periodically). Returns "
+                "canonical Asset models, best matches first."
+            ),
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Ticker symbol, symbol prefix or part of the company name (e.g. 'AAP', 'apple').",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 50,
+                        "default": 10,
+                        "description": "Maximum number of matches to return.",
+                    },
+                    "asset_class": {
+                        "type": "string",
+                        "description": "Asset class filter, e.g. 'us_equity' or 'crypto'.",
+                    },
+                    "tradable": {
+                        "type": "boolean",
+                        "description": "Only return assets with this tradable flag.",
+                    },
+                },
+                "required": ["query"],
+                "additionalProperties": False,
+            },
+            handler=tool_handler(_search_assets_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_orders",
@@ -311,6 +368,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_orders_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_order",
@@ -334,6 +392,7 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_order_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_portfolio_history",
@@ -383,5 +442,6 @@ def alpaca_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_portfolio_history_tool),
+            read_only=True,
         ),
     ]
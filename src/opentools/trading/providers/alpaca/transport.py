@@ -1,14 +1,18 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Callable
+from typing import Any, AsyncIterator, Callable
 
 from opentools.core.errors import AuthError
+from opentools.core.rate_limit import RateLimit
 from opentools.core.transport import Transport
 
 from ._endpoints import ALPACA_PAPER_URL
 from .errors import raise_for_status as alpaca_raise_for_status
 
+# Alpaca trading API: ~200 requests per minute per API key
+ALPACA_DEFAULT_RATE_LIMIT = RateLimit(requests=200, per_s=60.0)
+
 
 @dataclass
 class AlpacaTransport(Transport):
@@ -48,6 +52,19 @@ class AlpacaTransport(Transport):
             raise_for_status=raise_for_status or alpaca_raise_for_status,
         )
 
+    def stream_json_array(
+        self,
+        path: str,
+        *,
+        params: dict[str, Any] | None = None,
+        raise_for_status: Callable | None = None,
+    ) -> AsyncIterator[Any]:
+        return super().stream_json_array(
+            path,
+            params=params,
+            raise_for_status=raise_for_status or alpaca_raise_for_status,
+        )
+
     async def get_dict_json(
         self,
         path: str,
@@ -23,3 +23,10 @@ PRODUCT_PATH = f"{_API_PREFIX}/products/{{product_id}}"
 
 # portfolios
 PORTFOLIOS_PATH = "/api/v3/brokerage/portfolios"
+
+# hot (method, path) pairs worth pre-signing JWTs for
+PRESIGN_PATHS: tuple[tuple[str, str], ...] = (
+    ("GET", ACCOUNTS_PATH),
+    ("GET", PORTFOLIOS_PATH),
+    ("GET", PRODUCTS_PATH),
+)
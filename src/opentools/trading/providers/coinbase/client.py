@@ -1,13 +1,17 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any
+import time
+from dataclasses import dataclass, field
+from typing import Any, AsyncIterator
 
 from .clients import get_account as _get_account
 from .clients import list_accounts as _list_accounts
+from .clients.account import iter_accounts as _iter_accounts
 from .clients.assets import get_asset as _get_asset
+from .clients.assets import iter_assets as _iter_assets
 from .clients.assets import list_assets as _list_assets
 from .clients.orders import get_order as _get_order
+from .clients.orders import iter_orders as _iter_orders
 from .clients.orders import list_orders as _list_orders
 from .clients.portfolio import (
     get_portfolio_breakdown as _get_portfolio_breakdown,
@@ -17,11 +21,28 @@ from .clients.position import list_positions as _list_positions
 from .transport import CoinbaseTransport
 
 
+_POSITION_KEYS = ("product_id", "symbol", "asset", "instrument_id", "product_uuid")
+
+
+def _norm_symbol(x: Any) -> str:
+    s = str(x or "").strip().upper()
+    return s.replace("/", "-")
+
+
 @dataclass
 class CoinbaseClient:
     transport: CoinbaseTransport
     provider: str = "coinbase"
 
+    # normalized symbol -> position, rebuilt from one breakdown fetch
+    position_index_ttl_s: float = 5.0
+    _position_cache: tuple[float, dict[str, dict[str, Any]]] | None = field(
+        default=None, init=False, repr=False
+    )
+
+    async def aclose(self) -> None:
+        await self.transport.aclose()
+
     # accounts
     async def list_accounts(
         self,
@@ -37,6 +58,13 @@ class CoinbaseClient:
             retail_portfolio_id=retail_portfolio_id,
         )
 
+    def iter_accounts(
+        self,
+        *,
+        retail_portfolio_id: str | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _iter_accounts(self.transport, retail_portfolio_id=retail_portfolio_id)
+
     async def get_account(self, account_uuid: str | None = None) -> dict[str, Any]:
         if account_uuid:
             data = await _get_account(self.transport, account_uuid)
@@ -95,34 +123,41 @@ class CoinbaseClient:
             currency=currency,
         )
 
-    async def get_position(self, symbol_or_asset_id: str) -> dict[str, Any]:
-        def _norm(x: Any) -> str:
-            s = str(x or "").strip().upper()
-            return s.replace("/", "-")
-
-        target = _norm(symbol_or_asset_id)
-        if not target:
-            return {}
-
-        positions = await self.list_positions()
+    async def _position_index(self) -> dict[str, dict[str, Any]]:
+        cached = self._position_cache
+        if cached is not None and time.monotonic() < cached[0]:
+            return cached[1]
 
-        for p in positions:
+        index: dict[str, dict[str, Any]] = {}
+        for p in await self.list_positions():
             if not isinstance(p, dict):
                 continue
+            for key in _POSITION_KEYS:
+                c = _norm_symbol(p.get(key))
+                if c:
+                    # first position listed wins, as with a linear scan
+                    index.setdefault(c, p)
 
-            candidates = [
-                p.get("product_id"),
-                p.get("symbol"),
-                p.get("asset"),
-                p.get("instrument_id"),
-                p.get("product_uuid"),
-            ]
+        self._position_cache = (time.monotonic() + self.position_index_ttl_s, index)
+        return index
 
-            for c in candidates:
-                if c and _norm(c) == target:
-                    return dict(p)
+    async def get_position(self, symbol_or_asset_id: str) -> dict[str, Any]:
+        target = _norm_symbol(symbol_or_asset_id)
+        if not target:
+            return {}
 
-        return {}
+        index = await self._position_index()
+        return dict(index.get(target) or {})
+
+    async def get_positions(
+        self, symbols_or_asset_ids: list[str]
+    ) -> dict[str, dict[str, Any]]:
+        """
+        Batch lookup answered from a single breakdown fetch. Keys are the
+        requested identifiers; missing positions map to {}.
+        """
+        index = await self._position_index()
+        return {s: dict(index.get(_norm_symbol(s)) or {}) for s in symbols_or_asset_ids}
 
     # orders
     async def list_orders(
@@ -153,6 +188,29 @@ class CoinbaseClient:
         orders = data.get("orders") or []
         return orders
 
+    def iter_orders(
+        self,
+        *,
+        status: str | None = None,
+        after: str | None = None,
+        until: str | None = None,
+        direction: str | None = None,  # unused
+        nested: bool | None = None,  # unused
+        symbols: list[str] | None = None,
+        side: str | None = None,
+        asset_class: list[str] | None = None,  # unused
+        before_order_id: str | None = None,  # unused
+        after_order_id: str | None = None,  # unused
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _iter_orders(
+            self.transport,
+            product_ids=symbols,
+            order_status=status,
+            order_side=side,
+            start_date=after,
+            end_date=until,
+        )
+
     async def get_order(
         self,
         order_id: str,
@@ -184,6 +242,24 @@ class CoinbaseClient:
             cursor=cursor,
         )
 
+    def iter_assets(
+        self,
+        *,
+        status: str | None = None,
+        asset_class: str | None = None,
+        exchange: str | None = None,
+        attributes: list[str] | None = None,
+        limit: int | None = None,
+    ) -> AsyncIterator[dict[str, Any]]:
+        return _iter_assets(
+            self.transport,
+            status=status,
+            asset_class=asset_class,
+            exchange=exchange,
+            attributes=attributes,
+            limit=limit,
+        )
+
     async def get_asset(self, symbol_or_asset_id: str) -> dict[str, Any]:
         data = await _get_asset(self.transport, product_id=symbol_or_asset_id)
         return data
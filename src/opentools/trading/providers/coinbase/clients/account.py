@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator
+
+from opentools.core.pagination import cursor_page, paginate
 
 from .._endpoints import ACCOUNT_PATH, ACCOUNTS_PATH
 from ..transport import CoinbaseTransport
 
+ACCOUNTS_PAGE_SIZE = 250
+
 
 async def list_accounts(
     transport: CoinbaseTransport,
@@ -30,3 +34,24 @@ async def get_account(
 ) -> dict[str, Any]:
     path = ACCOUNT_PATH.format(account_uuid=account_uuid)
     return await transport.get_dict_json(path)
+
+
+def iter_accounts(
+    transport: CoinbaseTransport,
+    *,
+    page_size: int = ACCOUNTS_PAGE_SIZE,
+    retail_portfolio_id: str | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Follow the accounts cursor, prefetching the next page.
+    """
+
+    async def fetch(cursor: str | None) -> dict[str, Any]:
+        return await list_accounts(
+            transport,
+            limit=page_size,
+            cursor=cursor,
+            retail_portfolio_id=retail_portfolio_id,
+        )
+
+    return paginate(fetch, cursor_page("accounts"))
@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator
+
+from opentools.core.pagination import paginate
 
 from .._endpoints import PRODUCT_PATH, PRODUCTS_PATH
 from ..transport import CoinbaseTransport
 
+PRODUCTS_PAGE_SIZE = 250
+
 
 async def list_assets(
     transport: CoinbaseTransport,
@@ -15,12 +19,16 @@ async def list_assets(
     attributes: list[str] | None = None,
     limit: int | None = None,
     cursor: str | None = None,
+    offset: int | None = None,
 ) -> list[dict[str, Any]]:
     params: dict[str, Any] = {}
 
     if limit is not None:
         params["limit"] = limit
 
+    if offset:
+        params["offset"] = offset
+
     if cursor is not None:
         params["cursor"] = cursor
 
@@ -44,6 +52,43 @@ async def list_assets(
     return products
 
 
+def iter_assets(
+    transport: CoinbaseTransport,
+    *,
+    status: str | None = None,
+    asset_class: str | None = None,
+    exchange: str | None = None,
+    attributes: list[str] | None = None,
+    limit: int | None = None,
+    page_size: int = PRODUCTS_PAGE_SIZE,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Walk /products by offset; a short page ends the listing. With `limit`
+    (how many products the caller expects to need), pages shrink to fit it
+    and the next page is only prefetched when one page cannot cover it.
+    """
+    if limit:
+        page_size = min(limit, page_size)
+    prefetch = not limit or limit > page_size
+
+    async def fetch(offset: int) -> list[dict[str, Any]]:
+        return await list_assets(
+            transport,
+            status=status,
+            asset_class=asset_class,
+            exchange=exchange,
+            attributes=attributes,
+            limit=page_size,
+            offset=offset,
+        )
+
+    def split(page: list[dict[str, Any]], offset: int) -> tuple[list[Any], int | None]:
+        items = [p for p in page if isinstance(p, dict)]
+        return items, offset + len(page) if len(page) >= page_size else None
+
+    return paginate(fetch, split, first=0, prefetch=prefetch)
+
+
 async def get_asset(
     transport: CoinbaseTransport,
     product_id: str,
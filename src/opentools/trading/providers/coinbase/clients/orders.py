@@ -1,10 +1,14 @@
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, AsyncIterator
+
+from opentools.core.pagination import cursor_page, paginate
 
 from .._endpoints import ORDER_HISTORICAL_PATH, ORDERS_HISTORICAL_PATH
 from ..transport import CoinbaseTransport
 
+ORDERS_PAGE_SIZE = 250
+
 
 async def list_orders(
     transport: CoinbaseTransport,
@@ -49,3 +53,32 @@ async def get_order(
 ) -> dict[str, Any]:
     path = ORDER_HISTORICAL_PATH.format(order_id=order_id)
     return await transport.get_dict_json(path)
+
+
+def iter_orders(
+    transport: CoinbaseTransport,
+    *,
+    page_size: int = ORDERS_PAGE_SIZE,
+    product_ids: list[str] | None = None,
+    order_status: str | None = None,
+    order_side: str | None = None,
+    start_date: str | None = None,
+    end_date: str | None = None,
+) -> AsyncIterator[dict[str, Any]]:
+    """
+    Follow the historical orders cursor, prefetching the next page.
+    """
+
+    async def fetch(cursor: str | None) -> dict[str, Any]:
+        return await list_orders(
+            transport,
+            limit=page_size,
+            cursor=cursor,
+            product_ids=product_ids,
+            order_status=order_status,
+            order_side=order_side,
+            start_date=start_date,
+            end_date=end_date,
+        )
+
+    return paginate(fetch, cursor_page("orders"))
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import asyncio
 from typing import Any
 
 from ..transport import CoinbaseTransport
@@ -11,38 +12,56 @@ from .portfolio import (
 )
 
 
+def _first_uuid(resp: Any) -> str | None:
+    portfolios = resp.get("portfolios") if isinstance(resp, dict) else None
+    if not isinstance(portfolios, list) or not portfolios:
+        return None
+
+    first = portfolios[0] or {}
+    uuid = first.get("uuid")
+    return uuid if isinstance(uuid, str) else None
+
+
 async def _resolve_default_portfolio_uuid(
     transport: CoinbaseTransport,
     *,
     portfolio_type: str | None = None,
 ) -> str | None:
-    portfolios: list[dict[str, Any]] = []
+    cached = transport.cached_portfolio_uuid(portfolio_type)
+    if cached is not None:
+        return cached
 
     if portfolio_type:
         # explicit type (DEFAULT / CONSUMER / INTX / UNDEFINED)
-        resp = await _list_portfolios(
-            transport,
-            portfolio_type=portfolio_type,
+        uuid = _first_uuid(
+            await _list_portfolios(transport, portfolio_type=portfolio_type)
         )
-        portfolios = resp.get("portfolios") or []
     else:
-        for pt in ("DEFAULT", "UNDEFINED"):
-            resp = await _list_portfolios(
-                transport,
-                portfolio_type=pt,
-            )
-            portfolios = resp.get("portfolios") or []
-            if portfolios:
+        # DEFAULT wins over UNDEFINED; ask for both at once, and let either
+        # answer stand in for the other if that lookup fails
+        results = await asyncio.gather(
+            _list_portfolios(transport, portfolio_type="DEFAULT"),
+            _list_portfolios(transport, portfolio_type="UNDEFINED"),
+            return_exceptions=True,
+        )
+        uuid = None
+        for result in results:
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                continue
+            uuid = _first_uuid(result)
+            if uuid is not None:
                 break
-
-    if not isinstance(portfolios, list) or not portfolios:
-        return None
-
-    first = portfolios[0] or {}
-    uuid = first.get("uuid")
-    if not isinstance(uuid, str):
-        return None
-
+        if uuid is None:
+            # nothing resolved: report the first failure, as the sequential
+            # lookup did
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
+
+    if uuid is not None:
+        transport.cache_portfolio_uuid(portfolio_type, uuid)
     return uuid
 
 
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from datetime import datetime
+from datetime import datetime, timezone
 from typing import Any, Literal, cast
 
 from ...schemas import (
@@ -21,7 +21,11 @@ _OPENTOOLS_INTERNAL_PREFIXES: tuple[str, ...] = ("_opentools_",)
 def _parse_dt(s: str | None) -> datetime | None:
     if not s:
         return None
-    return datetime.fromisoformat(s.replace("Z", "+00:00"))
+    dt = datetime.fromisoformat(s.replace("Z", "+00:00"))
+    # normalise once here so mapper-built models can skip validation
+    if dt.tzinfo is None:
+        return dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc)
 
 
 def _to_str(v: Any) -> str | None:
@@ -53,7 +57,7 @@ def _extras(raw: dict[str, Any], used_keys: set[str]) -> dict[str, Any]:
 def _money(x: Any) -> MoneyAmount | None:
     if not isinstance(x, dict):
         return None
-    return MoneyAmount(
+    return MoneyAmount.trusted(
         value=_to_str(x.get("value")),
         currency=_to_str(x.get("currency")),
     )
@@ -80,7 +84,7 @@ def account_from_coinbase(data: dict[str, Any]) -> Account:
     used = {"uuid", "active", "currency", "available_balance", "created_at"}
     provider_fields = _extras(data, used)
 
-    return Account(
+    return Account.trusted(
         provider="coinbase",
         id=data.get("uuid"),
         status="active" if data.get("active") else "inactive",
@@ -129,7 +133,7 @@ def order_from_coinbase(data: dict[str, Any]) -> Order | None:
     }
     provider_fields = _extras(data, used)
 
-    return Order(
+    return Order.trusted(
         provider="coinbase",
         id=order_id,
         client_order_id=_to_str(data.get("client_order_id")),
@@ -197,7 +201,7 @@ def asset_from_coinbase(data: dict[str, Any]) -> Asset | None:
     }
     provider_fields = _extras(data, used)
 
-    return Asset(
+    return Asset.trusted(
         provider="coinbase",
         id=product_id,
         symbol=product_id,
@@ -223,7 +227,7 @@ def portfolio_from_coinbase(data: dict[str, Any]) -> Portfolio | None:
     used = {"uuid", "name", "type", "deleted"}
     provider_fields = _extras(data, used)
 
-    return Portfolio(
+    return Portfolio.trusted(
         provider="coinbase",
         id=uuid,
         name=data.get("name"),
@@ -248,7 +252,7 @@ def portfolio_breakdown_from_coinbase(bd: dict[str, Any]) -> PortfolioBreakdown:
             "perp_unrealized_pnl",
         }
 
-        balances = PortfolioBalances(
+        balances = PortfolioBalances.trusted(
             total_balance=_money(balances_raw.get("total_balance")),
             total_futures_balance=_money(balances_raw.get("total_futures_balance")),
             total_cash_equivalent_balance=_money(
@@ -273,7 +277,7 @@ def portfolio_breakdown_from_coinbase(bd: dict[str, Any]) -> PortfolioBreakdown:
     }
     provider_fields = _extras(bd, used_bd)
 
-    return PortfolioBreakdown(
+    return PortfolioBreakdown.trusted(
         provider="coinbase",
         portfolio=portfolio,
         balances=balances,
@@ -332,7 +336,7 @@ def spot_position_from_coinbase(data: dict[str, Any]) -> Position | None:
     }
     provider_fields = _extras(data, used)
 
-    return Position(
+    return Position.trusted(
         provider="coinbase",
         symbol=str(asset),
         qty=_to_str(qty),
@@ -377,7 +381,7 @@ def perp_position_from_coinbase(data: dict[str, Any]) -> Position | None:
     }
     provider_fields = _extras(data, used)
 
-    return Position(
+    return Position.trusted(
         provider="coinbase",
         symbol=_to_str(symbol) or str(symbol),
         qty=_to_str(qty),
@@ -420,7 +424,7 @@ def futures_position_from_coinbase(data: dict[str, Any]) -> Position | None:
     }
     provider_fields = _extras(data, used)
 
-    return Position(
+    return Position.trusted(
         provider="coinbase",
         symbol=_to_str(symbol) or str(symbol),
         qty=_to_str(data.get("amount")),
@@ -437,7 +441,7 @@ def futures_position_from_coinbase(data: dict[str, Any]) -> Position | None:
 # stub
 def clock_from_coinbase(data: dict[str, Any]) -> Clock:
     provider_fields = _extras(data, used_keys=set())
-    return Clock(
+    return Clock.trusted(
         provider="coinbase",
         timestamp=None,
         is_open=None,
@@ -94,6 +94,20 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
             return None
         return minimal(asset, minimal=service.minimal)
 
+    async def _search_assets_tool(
+        query: str,
+        limit: int = 10,
+        asset_class: str | None = None,
+        tradable: bool | None = None,
+    ) -> List[Dict[str, Any]]:
+        assets: List[Asset] = await service.search_assets(
+            query,
+            limit=limit,
+            asset_class=asset_class,
+            tradable=tradable,
+        )
+        return minimal(assets, minimal=service.minimal)
+
     # orders
     async def _list_orders_tool(
         status: str | None = None,
@@ -144,6 +158,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_account_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_accounts",
@@ -170,6 +185,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_accounts_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_portfolios",
@@ -191,6 +207,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_portfolios_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_portfolio_breakdown",
@@ -214,6 +231,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_portfolio_breakdown_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_positions",
@@ -241,6 +259,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_positions_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_assets",
@@ -277,6 +296,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_assets_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_asset",
@@ -297,6 +317,44 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_asset_tool),
+            read_only=True,
+        ),
+        ToolSpec(
+            name=f"{prefix}_search_assets",
+            description=(
+                "Search Coinbase assets by symbol, symbol prefix or name, with a "
+                "fuzzy fallback for near-miss spellings. Answered from a local "
+                "asset catalog (loaded once, refreshed periodically). Returns "
+                "canonical Asset models, best matches first."
+            ),
+            input_schema={
+                "type": "object",
+                "properties": {
+                    "query": {
+                        "type": "string",
+                        "description": "Product id, product id prefix or part of the product name (e.g. 'BTC', 'bitcoin').",
+                    },
+                    "limit": {
+                        "type": "integer",
+                        "minimum": 1,
+                        "maximum": 50,
+                        "default": 10,
+                        "description": "Maximum number of matches to return.",
+                    },
+                    "asset_class": {
+                        "type": "string",
+                        "description": "Asset class filter: 'crypto' (spot) or 'future'.",
+                    },
+                    "tradable": {
+                        "type": "boolean",
+                        "description": "Only return assets with this tradable flag.",
+                    },
+                },
+                "required": ["query"],
+                "additionalProperties": False,
+            },
+            handler=tool_handler(_search_assets_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_list_orders",
@@ -339,6 +397,7 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_list_orders_tool),
+            read_only=True,
         ),
         ToolSpec(
             name=f"{prefix}_get_order",
@@ -364,5 +423,6 @@ def coinbase_tools(service: TradingService) -> list[ToolSpec]:
                 "additionalProperties": False,
             },
             handler=tool_handler(_get_order_tool),
+            read_only=True,
         ),
     ]
@@ -1,14 +1,19 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+import time
+from dataclasses import dataclass, field
 from typing import Any, Callable
 
 from opentools.core.errors import AuthError
+from opentools.core.rate_limit import RateLimit
 from opentools.core.transport import Transport
 
 from ._endpoints import COINBASE_LIVE_URL
 from .errors import raise_for_status as coinbase_raise_for_status
 
+# Coinbase Advanced Trade private endpoints: ~30 requests per second per key
+COINBASE_DEFAULT_RATE_LIMIT = RateLimit(requests=30, per_s=1.0)
+
 
 @dataclass
 class CoinbaseTransport(Transport):
@@ -22,6 +27,27 @@ class CoinbaseTransport(Transport):
     # explicit
     request_id_header_candidates: tuple[str, ...] = ("x-request-id",)
 
+    # resolved portfolio UUIDs, keyed by requested portfolio_type
+    portfolio_uuid_ttl_s: float = 300.0
+    _portfolio_uuids: dict[str | None, tuple[float, str]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
+    def cached_portfolio_uuid(self, portfolio_type: str | None) -> str | None:
+        """
+        The portfolio UUID resolved for `portfolio_type`, if still fresh.
+        """
+        entry = self._portfolio_uuids.get(portfolio_type)
+        if entry is None or time.monotonic() >= entry[0]:
+            return None
+        return entry[1]
+
+    def cache_portfolio_uuid(self, portfolio_type: str | None, uuid: str) -> None:
+        self._portfolio_uuids[portfolio_type] = (
+            time.monotonic() + self.portfolio_uuid_ttl_s,
+            uuid,
+        )
+
     async def get_json(
         self,
         path: str,
@@ -1,19 +1,67 @@
 from __future__ import annotations
 
+import os
 from datetime import datetime, timezone
-from typing import Any, Dict, List, Literal
+from typing import Any, Dict, List, Literal, TypeVar
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from .utils import serializer_for
+
+_M = TypeVar("_M", bound="TradingModel")
+
+# mappers build models via TradingModel.trusted(); strict mode validates them
+_STRICT_MODELS = os.environ.get("OPENTOOLS_STRICT_MODELS", "") not in ("", "0")
+
+
+def set_strict_models(enabled: bool) -> bool:
+    """
+    Toggle full pydantic validation for mapper-built models (useful in
+    tests). Returns the previous setting.
+    """
+    global _STRICT_MODELS
+    previous = _STRICT_MODELS
+    _STRICT_MODELS = enabled
+    return previous
+
+
+def strict_models_enabled() -> bool:
+    return _STRICT_MODELS
+
+
+_DATETIME_FIELDS: dict[type, tuple[str, ...]] = {}
+
 
 class TradingModel(BaseModel):
     model_config = ConfigDict(extra="forbid")
 
+    @classmethod
+    def trusted(cls: type[_M], **values: Any) -> _M:
+        """
+        Build from mapper output with model_construct(), skipping
+        validation. Values must already be canonical (datetimes UTC-aware,
+        nested models built). Falls back to full validation when strict
+        models are enabled.
+        """
+        if _STRICT_MODELS:
+            return cls(**values)
+        return cls.model_construct(**values)
+
+    @classmethod
+    def _datetime_field_names(cls) -> tuple[str, ...]:
+        names = _DATETIME_FIELDS.get(cls)
+        if names is None:
+            names = tuple(
+                name
+                for name, info in cls.model_fields.items()
+                if "datetime" in str(info.annotation)
+            )
+            _DATETIME_FIELDS[cls] = names
+        return names
+
     @model_validator(mode="after")
     def _normalise_datetimes_to_utc(self) -> "TradingModel":
-        fields = getattr(self.__class__, "model_fields", {}) or {}
-
-        for name in fields:
+        for name in type(self)._datetime_field_names():
             v = getattr(self, name, None)
             if isinstance(v, datetime):
                 if v.tzinfo is None:
@@ -30,49 +78,15 @@ class TradingModel(BaseModel):
         include_provider: bool = True,
         include_provider_fields: bool = True,
     ) -> dict[str, Any]:
-        INTERNAL_PREFIXES: tuple[str, ...] = ("_opentools_",)
-
-        seen_ids: set[int] = set()
-
-        def walk(value: Any) -> Any:
-            if isinstance(value, TradingModel):
-                vid = id(value)
-                if vid in seen_ids:
-                    return "<recursion>"
-                seen_ids.add(vid)
-
-                out_obj: dict[str, Any] = {}
-                for field_name in type(value).model_fields:
-                    if not include_provider and field_name == "provider":
-                        continue
-                    if not include_provider_fields and field_name == "provider_fields":
-                        continue
-                    out_obj[field_name] = walk(getattr(value, field_name))
-
-                seen_ids.remove(vid)
-                return out_obj
-
-            if isinstance(value, BaseModel):
-                return value.model_dump()
-
-            if isinstance(value, dict):
-                out_map: dict[str, Any] = {}
-                for k, v in value.items():
-                    if isinstance(k, str) and k.startswith(INTERNAL_PREFIXES):
-                        continue
-                    if (not include_provider and k == "provider") or (
-                        not include_provider_fields and k == "provider_fields"
-                    ):
-                        continue
-                    out_map[k] = walk(v)
-                return out_map
-
-            if isinstance(value, (list, tuple)):
-                return [walk(v) for v in value]
-
-            return value
-
-        return walk(self)
+        drop = frozenset(
+            name
+            for name, keep in (
+                ("provider", include_provider),
+                ("provider_fields", include_provider_fields),
+            )
+            if not keep
+        )
+        return serializer_for(type(self), drop)(self)
 
 
 # account
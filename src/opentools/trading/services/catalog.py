@@ -0,0 +1,281 @@
+from __future__ import annotations
+
+import asyncio
+import bisect
+import difflib
+import logging
+import time
+from typing import Any, Awaitable, Callable, Iterable
+
+from ..schemas import Asset
+
+AssetLoader = Callable[[], Awaitable[list[Asset]]]
+
+# secondary indexes: Asset field -> normalised value -> symbol keys
+_INDEXED_FIELDS: tuple[str, ...] = (
+    "exchange",
+    "asset_class",
+    "status",
+    "tradable",
+    "fractionable",
+    "shortable",
+)
+
+_ASSET_CLASS_ALIASES = {"spot": "crypto", "futures": "future"}
+
+# upper bound on symbols scored by difflib per fuzzy query
+_FUZZY_MAX_CANDIDATES = 2_000
+
+_log = logging.getLogger(__name__)
+
+
+def _norm_symbol(value: Any) -> str:
+    return str(value or "").strip().upper().replace("/", "-")
+
+
+def _norm_value(field: str, value: Any) -> Any:
+    if isinstance(value, str):
+        v = value.strip().lower()
+        if field == "asset_class":
+            v = _ASSET_CLASS_ALIASES.get(v, v)
+        return v
+    return value
+
+
+class AssetCatalog:
+    """
+    In-process asset index loaded from the provider's full asset listing.
+
+    - hash indexes by symbol and id (symbols normalised: upper case, '/' -> '-')
+    - secondary indexes by exchange, asset_class, status, tradable,
+      fractionable, shortable
+    - prefix search over sorted symbols, fuzzy fallback via difflib
+
+    The first lookup loads the catalog; after ttl_s a refresh runs in the
+    background and is applied as a diff, so callers keep getting answers.
+    """
+
+    def __init__(self, *, ttl_s: float = 3600.0) -> None:
+        self.ttl_s = ttl_s
+
+        self._by_symbol: dict[str, Asset] = {}
+        self._by_id: dict[str, str] = {}
+        self._secondary: dict[str, dict[Any, set[str]]] = {
+            f: {} for f in _INDEXED_FIELDS
+        }
+        self._sorted_symbols: list[str] = []
+
+        self._loaded_at: float | None = None
+        self._loading: asyncio.Task[None] | None = None
+
+    def __len__(self) -> int:
+        return len(self._by_symbol)
+
+    @property
+    def loaded(self) -> bool:
+        return self._loaded_at is not None
+
+    def _stale(self) -> bool:
+        return (
+            self._loaded_at is None or time.monotonic() - self._loaded_at > self.ttl_s
+        )
+
+    # loading
+    async def ensure(self, load: AssetLoader) -> None:
+        if not self._stale():
+            return
+
+        task = self._loading
+        if (
+            task is None
+            or task.done()
+            or task.get_loop() is not asyncio.get_running_loop()
+        ):
+            task = asyncio.get_running_loop().create_task(self._load(load))
+            self._loading = task
+
+        # the first load is awaited; later refreshes run in the background
+        if self._loaded_at is None:
+            await asyncio.shield(task)
+
+    async def _load(self, load: AssetLoader) -> None:
+        try:
+            assets = await load()
+        except Exception:
+            if self._loaded_at is None:
+                raise
+            # keep serving the previous snapshot; try again next time
+            _log.warning("asset catalog refresh failed", exc_info=True)
+            self._loaded_at = time.monotonic() - self.ttl_s + min(60.0, self.ttl_s)
+            return
+        self.apply(assets)
+
+    def apply(self, assets: Iterable[Asset]) -> None:
+        """
+        Bring the indexes in line with a full listing, touching only the
+        entries that were added, removed or changed.
+        """
+        incoming: dict[str, Asset] = {}
+        for a in assets:
+            key = _norm_symbol(a.symbol)
+            if key:
+                incoming.setdefault(key, a)
+
+        for key in [k for k in self._by_symbol if k not in incoming]:
+            self._unindex(key)
+
+        added = False
+        for key, asset in incoming.items():
+            current = self._by_symbol.get(key)
+            if current is not None:
+                if current == asset:
+                    continue
+                self._unindex(key)
+            else:
+                added = True
+            self._index(key, asset)
+
+        if added or len(self._sorted_symbols) != len(self._by_symbol):
+            self._sorted_symbols = sorted(self._by_symbol)
+
+        self._loaded_at = time.monotonic()
+
+    def _index(self, key: str, asset: Asset) -> None:
+        self._by_symbol[key] = asset
+        if asset.id:
+            self._by_id[str(asset.id).lower()] = key
+        for f in _INDEXED_FIELDS:
+            v = _norm_value(f, getattr(asset, f, None))
+            if v is not None:
+                self._secondary[f].setdefault(v, set()).add(key)
+
+    def _unindex(self, key: str) -> None:
+        asset = self._by_symbol.pop(key, None)
+        if asset is None:
+            return
+        if asset.id:
+            self._by_id.pop(str(asset.id).lower(), None)
+        for f in _INDEXED_FIELDS:
+            v = _norm_value(f, getattr(asset, f, None))
+            bucket = self._secondary[f].get(v)
+            if bucket is not None:
+                bucket.discard(key)
+                if not bucket:
+                    del self._secondary[f][v]
+
+    # lookups
+    def get(self, symbol_or_id: str) -> Asset | None:
+        key = _norm_symbol(symbol_or_id)
+        asset = self._by_symbol.get(key)
+        if asset is not None:
+            return asset
+        by_id = self._by_id.get(str(symbol_or_id).strip().lower())
+        return self._by_symbol.get(by_id) if by_id else None
+
+    def _matching_keys(self, criteria: dict[str, Any]) -> set[str] | None:
+        # None means "no constraint"; an empty set means nothing matches
+        keys: set[str] | None = None
+        for f, value in criteria.items():
+            if value is None:
+                continue
+            if f not in self._secondary:
+                raise ValueError(f"AssetCatalog cannot filter on {f!r}")
+            bucket = self._secondary[f].get(_norm_value(f, value), set())
+            keys = set(bucket) if keys is None else keys & bucket
+            if not keys:
+                return set()
+        return keys
+
+    def filter(self, *, limit: int | None = None, **criteria: Any) -> list[Asset]:
+        """
+        Assets matching every non-None criterion (any indexed field),
+        in symbol order.
+        """
+        keys = self._matching_keys(criteria)
+        symbols = (
+            self._sorted_symbols
+            if keys is None
+            else [s for s in self._sorted_symbols if s in keys]
+        )
+        if limit:
+            symbols = symbols[:limit]
+        return [self._by_symbol[s] for s in symbols]
+
+    def search(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        fuzzy: bool = True,
+        **criteria: Any,
+    ) -> list[Asset]:
+        """
+        Exact symbol/id match first, then symbol prefix matches, then
+        name substring matches, then (optionally) close fuzzy matches.
+        Results are restricted to assets matching the indexed criteria.
+        """
+        q = _norm_symbol(query)
+        allowed = self._matching_keys(criteria)
+        if not q or allowed == set():
+            return []
+
+        found: list[str] = []
+        seen: set[str] = set()
+
+        def add(key: str) -> bool:
+            if key not in seen and (allowed is None or key in allowed):
+                seen.add(key)
+                found.append(key)
+            return len(found) >= limit
+
+        exact = self.get(query)
+        if exact is not None and add(_norm_symbol(exact.symbol)):
+            return self._resolve(found)
+
+        symbols = self._sorted_symbols
+        i = bisect.bisect_left(symbols, q)
+        while i < len(symbols) and symbols[i].startswith(q):
+            if add(symbols[i]):
+                return self._resolve(found)
+            i += 1
+
+        candidates = symbols if allowed is None else sorted(allowed)
+        needle = query.strip().lower()
+        for key in candidates:
+            name = self._by_symbol[key].name
+            if name and needle in name.lower() and add(key):
+                return self._resolve(found)
+
+        if fuzzy:
+            remaining = limit - len(found)
+            unseen = [k for k in self._fuzzy_candidates(q, allowed) if k not in seen]
+            for key in difflib.get_close_matches(q, unseen, n=remaining, cutoff=0.6):
+                add(key)
+
+        return self._resolve(found)
+
+    def _fuzzy_candidates(self, q: str, allowed: set[str] | None) -> list[str]:
+        """
+        Symbols worth scoring for a fuzzy match: same first character as the
+        query (typos rarely hit it), within the criteria, capped.
+        """
+        symbols = self._sorted_symbols
+        lo = bisect.bisect_left(symbols, q[0])
+        hi = bisect.bisect_left(symbols, chr(ord(q[0]) + 1))
+        out = [k for k in symbols[lo:hi] if allowed is None or k in allowed]
+        return out[:_FUZZY_MAX_CANDIDATES]
+
+    def _resolve(self, keys: list[str]) -> list[Asset]:
+        return [self._by_symbol[k] for k in keys]
+
+
+def resolve_asset_catalog(catalog: AssetCatalog | bool | None) -> AssetCatalog | None:
+    """
+    Factory helper: True builds a catalog with the default refresh interval,
+    False/None leaves it off, an explicit AssetCatalog is used as-is.
+    """
+    if catalog is None or catalog is False:
+        return None
+    if catalog is True:
+        return AssetCatalog()
+    return catalog
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import time
+from datetime import datetime, timezone
+
+from ..schemas import Clock
+
+
+def _aware(dt: datetime) -> datetime:
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=timezone.utc)
+
+
+class ClockCache:
+    """
+    Market clock derived from the last fetched /clock response.
+
+    The market state only changes at next_open / next_close, so between those
+    boundaries the clock can be answered locally. A refetch is needed once the
+    earliest boundary has passed or the snapshot is older than max_age_s
+    (holidays and early closes are only visible to the provider).
+    """
+
+    def __init__(self, max_age_s: float = 900.0) -> None:
+        self.max_age_s = max_age_s
+        self._clock: Clock | None = None
+        self._fetched_at = 0.0
+
+        self.hits = 0
+        self.misses = 0
+
+    def store(self, clock: Clock) -> None:
+        self._clock = clock
+        self._fetched_at = time.monotonic()
+
+    def clear(self) -> None:
+        self._clock = None
+
+    def get(self, now: datetime | None = None) -> Clock | None:
+        clock = self._clock
+        if clock is None or time.monotonic() - self._fetched_at > self.max_age_s:
+            self.misses += 1
+            return None
+
+        boundaries = [
+            _aware(dt) for dt in (clock.next_open, clock.next_close) if dt is not None
+        ]
+        now = now or datetime.now(timezone.utc)
+        if not boundaries or now >= min(boundaries):
+            self.misses += 1
+            return None
+
+        # market is open iff the next event is a close
+        is_open = clock.is_open
+        if clock.next_open is not None and clock.next_close is not None:
+            is_open = _aware(clock.next_close) < _aware(clock.next_open)
+
+        self.hits += 1
+        return clock.model_copy(update={"timestamp": now, "is_open": is_open})
@@ -1,11 +1,15 @@
 from __future__ import annotations
 
 import warnings
-from collections.abc import Iterable, Iterator, Sequence
+from collections.abc import AsyncIterator, Iterable, Iterator, Sequence
+from contextlib import aclosing
 from dataclasses import dataclass, field, replace
-from typing import TYPE_CHECKING, Any, Awaitable, Callable, cast
+from datetime import timedelta
+from typing import TYPE_CHECKING, Any, Awaitable, Callable, Literal, cast
 
+from opentools.auth import auth_identity
 from opentools.core.bundles import cached_bundle_for
+from opentools.core.cache import ResponseCache
 from opentools.core.errors import ProviderError, ValidationError
 from opentools.core.tools import ToolBundle, ToolInput, ToolSpec
 from opentools.core.types import FrameworkName, ModelName
@@ -20,11 +24,29 @@ from ..schemas import (
     PortfolioHistory,
     Position,
 )
+from .catalog import AssetCatalog
+from .clock import ClockCache
 from .provider import TradingProviderClient
 
 if TYPE_CHECKING:
     from .multi import MultiTradingService
 
+# freshness (seconds) for read endpoints when caching is enabled; order
+# endpoints are deliberately absent so they always hit the provider
+TRADING_READ_TTLS: dict[str, float] = {
+    "get_account": 10.0,
+    "list_accounts": 10.0,
+    "list_positions": 10.0,
+    "get_position": 10.0,
+    "get_positions": 10.0,
+    "get_clock": 30.0,
+    "list_assets": 300.0,
+    "get_asset": 300.0,
+    "get_portfolio_history": 60.0,
+    "list_portfolios": 60.0,
+    "get_portfolio_breakdown": 10.0,
+}
+
 
 @dataclass
 class TradingService(Sequence[Any]):
@@ -56,17 +78,101 @@ class TradingService(Sequence[Any]):
     # tool error handling policy (LLM adapters can read this)
     fatal_tool_error_kinds: tuple[str, ...] = ("auth", "config")
 
+    # optional read-through cache for raw provider responses
+    cache: ResponseCache | None = None
+
+    # answers get_clock() locally between market open/close boundaries
+    clock_cache: ClockCache | None = None
+
+    # local asset index; when set, get_asset/list_assets are answered from it
+    asset_catalog: AssetCatalog | None = None
+
+    # search_assets' own index when asset_catalog is off; never consulted by
+    # get_asset/list_assets
+    _search_catalog: AssetCatalog | None = field(default=None, init=False, repr=False)
+
     _bundle_cache: dict[
         tuple[ModelName, tuple[str, ...], tuple[str, ...]], ToolBundle
     ] = field(default_factory=dict, init=False, repr=False)
 
+    # provider tool specs are built once; their handlers read the service
+    # (minimal, cache, ...) at call time
+    _provider_specs: list[ToolSpec] | None = field(default=None, init=False, repr=False)
+    _spec_cache: dict[tuple[Any, ...], list[ToolSpec]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+    _default_bundle: tuple[tuple[Any, ...], ToolBundle] | None = field(
+        default=None, init=False, repr=False
+    )
+    _framework_tools_cache: dict[tuple[Any, ...], list[Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
+
     @property
     def provider(self) -> str:
         return getattr(self.client, "provider", "unknown")
 
+    # lifecycle
+    async def aclose(self) -> None:
+        """
+        Release the provider client's connection pool.
+        """
+        client_fn = getattr(self.client, "aclose", None)
+        if client_fn is None or not callable(client_fn):
+            return
+
+        typed_client_fn = cast(Callable[[], Awaitable[None]], client_fn)
+        await typed_client_fn()
+
+    async def __aenter__(self) -> "TradingService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    # response cache
+    def _cache_namespace(self) -> str:
+        transport = getattr(self.client, "transport", None)
+        auth = getattr(transport, "auth", None)
+        base_url = getattr(transport, "base_url", "")
+        identity = (
+            auth_identity(auth) if auth is not None else f"object:{id(self.client)}"
+        )
+        return f"{self.provider}:{identity}@{base_url}"
+
+    async def _cached(
+        self,
+        endpoint: str,
+        fetch: Callable[[], Awaitable[Any]],
+        **params: Any,
+    ) -> Any:
+        if self.cache is None:
+            return await fetch()
+
+        key = (
+            self._cache_namespace(),
+            tuple(sorted((k, repr(v)) for k, v in params.items())),
+        )
+        return await self.cache.get_or_fetch(key, endpoint=endpoint, fetch=fetch)
+
+    def invalidate_cache(self, endpoint: str | None = None) -> int:
+        """
+        Drop cached responses for this service's credentials (optionally one
+        endpoint only). Returns the number of entries removed.
+        """
+        if self.clock_cache is not None and endpoint in (None, "get_clock"):
+            self.clock_cache.clear()
+        if self.cache is None:
+            return 0
+        return self.cache.invalidate(endpoint, namespace=self._cache_namespace())
+
     # core api
     async def get_account(self, account_uuid: str | None = None) -> Account:
-        raw = await self.client.get_account(account_uuid)
+        raw = await self._cached(
+            "get_account",
+            lambda: self.client.get_account(account_uuid),
+            account_uuid=account_uuid,
+        )
         return self.account_mapper(raw)
 
     def strict(self) -> "TradingService":
@@ -102,7 +208,13 @@ class TradingService(Sequence[Any]):
 
         typed_client_fn = cast(Callable[..., Awaitable[Any]], client_fn)
 
-        raw = await typed_client_fn(
+        raw = await self._cached(
+            "list_accounts",
+            lambda: typed_client_fn(
+                limit=limit,
+                cursor=cursor,
+                retail_portfolio_id=retail_portfolio_id,
+            ),
             limit=limit,
             cursor=cursor,
             retail_portfolio_id=retail_portfolio_id,
@@ -153,12 +265,17 @@ class TradingService(Sequence[Any]):
 
         # Coinbase supports these params; Alpaca doesn't.
         if self.provider == "coinbase":
-            raw_list = await typed_client_fn(
+            raw_list = await self._cached(
+                "list_positions",
+                lambda: typed_client_fn(
+                    portfolio_type=portfolio_type,
+                    currency=currency,
+                ),
                 portfolio_type=portfolio_type,
                 currency=currency,
             )
         else:
-            raw_list = await typed_client_fn()
+            raw_list = await self._cached("list_positions", typed_client_fn)
 
         out: list[Position] = []
         for item in raw_list:
@@ -168,9 +285,43 @@ class TradingService(Sequence[Any]):
         return out
 
     async def get_position(self, symbol_or_asset_id: str) -> Position | None:
-        raw = await self.client.get_position(symbol_or_asset_id)
+        raw = await self._cached(
+            "get_position",
+            lambda: self.client.get_position(symbol_or_asset_id),
+            symbol_or_asset_id=symbol_or_asset_id,
+        )
         return self.position_mapper(raw)
 
+    async def get_positions(
+        self, symbols_or_asset_ids: list[str]
+    ) -> dict[str, Position | None]:
+        """
+        Look up several positions at once. Keys are the requested
+        identifiers; positions that are not held map to None.
+        """
+        client_fn = getattr(self.client, "get_positions", None)
+        if client_fn is None or not callable(client_fn):
+            raise ProviderError(
+                message=f"{self.provider!r} client does not support get_positions().",
+                domain="trading",
+                provider=self.provider,
+                status_code=None,
+            )
+
+        typed_client_fn = cast(
+            Callable[[list[str]], Awaitable[dict[str, dict[str, Any]]]], client_fn
+        )
+        raw = await self._cached(
+            "get_positions",
+            lambda: typed_client_fn(list(symbols_or_asset_ids)),
+            symbols_or_asset_ids=tuple(symbols_or_asset_ids),
+        )
+
+        return {
+            key: (self.position_mapper(item) if item else None)
+            for key, item in raw.items()
+        }
+
     # clock
     async def get_clock(self) -> Clock:
         if self.provider == "coinbase":
@@ -195,8 +346,18 @@ class TradingService(Sequence[Any]):
             )
 
         typed_client_fn = cast(Callable[[], Awaitable[dict[str, Any]]], client_fn)
-        raw = await typed_client_fn()
-        return self.clock_mapper(raw)
+        if self.clock_cache is None:
+            return self.clock_mapper(await self._cached("get_clock", typed_client_fn))
+
+        cached = self.clock_cache.get()
+        if cached is not None:
+            return cached
+
+        # a clock cache miss means a boundary passed (or the snapshot aged
+        # out): only a fresh /clock will do, never a response cached earlier
+        clock = self.clock_mapper(await typed_client_fn())
+        self.clock_cache.store(clock)
+        return clock
 
     # assets
     async def list_assets(
@@ -215,11 +376,47 @@ class TradingService(Sequence[Any]):
                 provider=self.provider,
             )
 
-        raw_list = await self.client.list_assets(
-            status=status,
-            asset_class=asset_class,
-            exchange=exchange,
-            attributes=attributes,
+        if self.asset_catalog is not None and not attributes:
+            catalog = await self._loaded_catalog()
+            criteria: dict[str, Any] = {"asset_class": asset_class}
+            if self.provider != "coinbase":
+                # Coinbase /products ignores these filters
+                criteria.update(status=status, exchange=exchange)
+            return catalog.filter(limit=limit, **criteria)
+
+        filters = {
+            "status": status,
+            "asset_class": asset_class,
+            "exchange": exchange,
+            "attributes": attributes,
+        }
+
+        iter_fn = getattr(self.client, "iter_assets", None)
+        if limit and iter_fn is not None and callable(iter_fn):
+            # stream and stop once `limit` assets map, instead of decoding
+            # the whole catalog
+            typed_iter_fn = cast(Callable[..., AsyncIterator[dict[str, Any]]], iter_fn)
+            mapper = self.asset_mapper
+
+            async def _fetch_prefix() -> list[Asset]:
+                # each item is mapped exactly once; the mapped prefix is cached
+                kept: list[Asset] = []
+                async with aclosing(typed_iter_fn(limit=limit, **filters)) as stream:
+                    async for item in stream:
+                        asset = mapper(item)
+                        if asset is not None:
+                            kept.append(asset)
+                            if len(kept) >= limit:
+                                break
+                return kept
+
+            assets = await self._cached(
+                "list_assets", _fetch_prefix, limit=limit, **filters
+            )
+            return list(assets)
+
+        raw_list = await self._cached(
+            "list_assets", lambda: self.client.list_assets(**filters), **filters
         )
 
         out: list[Asset] = []
@@ -240,9 +437,67 @@ class TradingService(Sequence[Any]):
                 provider=self.provider,
             )
 
-        raw = await self.client.get_asset(symbol_or_asset_id)
+        if self.asset_catalog is not None:
+            catalog = await self._loaded_catalog()
+            hit = catalog.get(symbol_or_asset_id)
+            if hit is not None:
+                return hit
+
+        raw = await self._cached(
+            "get_asset",
+            lambda: self.client.get_asset(symbol_or_asset_id),
+            symbol_or_asset_id=symbol_or_asset_id,
+        )
         return self.asset_mapper(raw)
 
+    async def search_assets(
+        self,
+        query: str,
+        *,
+        limit: int = 10,
+        asset_class: str | None = None,
+        tradable: bool | None = None,
+        fuzzy: bool = True,
+    ) -> list[Asset]:
+        """
+        Find assets by symbol, symbol prefix or name (with a fuzzy fallback)
+        using the local asset catalog. Searching needs the full listing, so
+        without asset_catalog a private index is built on first use; it
+        serves searches only, and get_asset/list_assets keep going to the
+        provider.
+        """
+        if self.asset_mapper is None:
+            raise ProviderError(
+                message=f"Assets not supported for provider {self.provider!r}",
+                domain="trading",
+                provider=self.provider,
+            )
+        catalog = self.asset_catalog
+        if catalog is None:
+            if self._search_catalog is None:
+                self._search_catalog = AssetCatalog()
+            catalog = self._search_catalog
+
+        await self._load_catalog(catalog)
+        return catalog.search(
+            query,
+            limit=limit,
+            fuzzy=fuzzy,
+            asset_class=asset_class,
+            tradable=tradable,
+        )
+
+    async def _loaded_catalog(self) -> AssetCatalog:
+        catalog = cast(AssetCatalog, self.asset_catalog)
+        await self._load_catalog(catalog)
+        return catalog
+
+    async def _load_catalog(self, catalog: AssetCatalog) -> None:
+        async def _load() -> list[Asset]:
+            return [a async for a in self.iter_assets(limit=None)]
+
+        await catalog.ensure(_load)
+
     # orders
     async def list_orders(
         self,
@@ -366,7 +621,12 @@ class TradingService(Sequence[Any]):
             )
 
         typed = cast(Callable[..., Awaitable[dict[str, Any]]], client_fn)
-        raw = await typed(portfolio_uuid=portfolio_uuid, currency=currency)
+        raw = await self._cached(
+            "get_portfolio_breakdown",
+            lambda: typed(portfolio_uuid=portfolio_uuid, currency=currency),
+            portfolio_uuid=portfolio_uuid,
+            currency=currency,
+        )
         return self.portfolio_breakdown_mapper(raw)
 
     # portfolio history
@@ -388,14 +648,19 @@ class TradingService(Sequence[Any]):
                 provider=self.provider,
             )
 
-        raw = await self.client.get_portfolio_history(
-            period=period,
-            timeframe=timeframe,
-            intraday_reporting=intraday_reporting,
-            start=start,
-            end=end,
-            pnl_reset=pnl_reset,
-            cashflow_types=cashflow_types,
+        params = {
+            "period": period,
+            "timeframe": timeframe,
+            "intraday_reporting": intraday_reporting,
+            "start": start,
+            "end": end,
+            "pnl_reset": pnl_reset,
+            "cashflow_types": cashflow_types,
+        }
+        raw = await self._cached(
+            "get_portfolio_history",
+            lambda: self.client.get_portfolio_history(**params),
+            **params,
         )
         return self.portfolio_history_mapper(raw)
 
@@ -422,7 +687,11 @@ class TradingService(Sequence[Any]):
             )
 
         typed = cast(Callable[..., Awaitable[Any]], client_fn)
-        raw = await typed(portfolio_type=portfolio_type)
+        raw = await self._cached(
+            "list_portfolios",
+            lambda: typed(portfolio_type=portfolio_type),
+            portfolio_type=portfolio_type,
+        )
 
         items: list[dict[str, Any]] = []
         if isinstance(raw, list):
@@ -448,6 +717,195 @@ class TradingService(Sequence[Any]):
                 out.append(p)
         return out
 
+    # streaming
+    async def _stream(
+        self,
+        raw: AsyncIterator[dict[str, Any]],
+        mapper: Callable[[dict], Any],
+        limit: int | None,
+    ) -> AsyncIterator[Any]:
+        count = 0
+        # stop any page prefetch or open response the provider iterator holds
+        async with aclosing(cast(Any, raw)) as items:
+            async for item in items:
+                model = mapper(item)
+                if model is None:
+                    continue
+                yield model
+                count += 1
+                if limit and count >= limit:
+                    break
+
+    async def iter_accounts(
+        self,
+        *,
+        limit: int | None = None,
+        retail_portfolio_id: str | None = None,
+    ) -> AsyncIterator[Account]:
+        """
+        Stream accounts page by page, stopping after `limit` accounts.
+        """
+        iter_fn = getattr(self.client, "iter_accounts", None)
+        if iter_fn is None or not callable(iter_fn):
+            accounts = await self.list_accounts(
+                limit=limit, retail_portfolio_id=retail_portfolio_id
+            )
+            for acct in accounts[:limit] if limit else accounts:
+                yield acct
+            return
+
+        typed_iter_fn = cast(Callable[..., AsyncIterator[dict[str, Any]]], iter_fn)
+        raw = typed_iter_fn(retail_portfolio_id=retail_portfolio_id)
+        async with aclosing(self._stream(raw, self.account_mapper, limit)) as accts:
+            async for acct in accts:
+                yield acct
+
+    async def iter_orders(
+        self,
+        *,
+        limit: int | None = None,
+        status: str | None = None,
+        after: str | None = None,
+        until: str | None = None,
+        direction: str | None = None,
+        nested: bool | None = None,
+        symbols: list[str] | None = None,
+        side: str | None = None,
+        asset_class: list[str] | None = None,
+        before_order_id: str | None = None,
+        after_order_id: str | None = None,
+        cursor: Literal["time", "order_id"] | None = None,
+        window: timedelta | None = None,
+        max_concurrency: int = 1,
+    ) -> AsyncIterator[Order]:
+        """
+        Stream the full order history, stopping after `limit` orders.
+
+        Coinbase follows its cursor, prefetching the next page; Alpaca walks
+        past its 500-per-request cap by time, or by order id with
+        `cursor="order_id"` (Alpaca only). With `window` (Alpaca only, needs
+        `after`), the range is split into windows of that size and up to
+        `max_concurrency` windows are fetched at once.
+        """
+        if self.order_mapper is None:
+            raise ProviderError(
+                message=f"Orders not supported for provider {self.provider!r}",
+                domain="trading",
+                provider=self.provider,
+            )
+
+        filters: dict[str, Any] = {
+            "status": status,
+            "after": after,
+            "until": until,
+            "direction": direction,
+            "nested": nested,
+            "symbols": symbols,
+            "side": side,
+            "asset_class": asset_class,
+            "before_order_id": before_order_id,
+            "after_order_id": after_order_id,
+        }
+
+        iter_fn = getattr(self.client, "iter_orders", None)
+        if cursor is not None:
+            if not getattr(self.client, "supports_order_cursors", False):
+                raise ValidationError(
+                    message=(
+                        f"Choosing the order history cursor is not supported "
+                        f"for provider {self.provider!r}."
+                    ),
+                    domain="trading",
+                    provider=self.provider,
+                )
+            filters["cursor"] = cursor
+        if window is not None:
+            if not getattr(self.client, "supports_order_windows", False):
+                raise ValidationError(
+                    message=(
+                        f"Windowed order history is not supported for provider "
+                        f"{self.provider!r}."
+                    ),
+                    domain="trading",
+                    provider=self.provider,
+                )
+            if after is None:
+                raise ValidationError(
+                    message="iter_orders(window=...) requires `after`.",
+                    domain="trading",
+                    provider=self.provider,
+                    field_errors=[
+                        {
+                            "loc": ["after"],
+                            "msg": "missing",
+                            "type": "value_error.missing",
+                        }
+                    ],
+                )
+            filters.update(window=window, max_concurrency=max_concurrency)
+
+        if iter_fn is None or not callable(iter_fn):
+            for order in await self.list_orders(limit=limit, **filters):
+                yield order
+            return
+
+        typed_iter_fn = cast(Callable[..., AsyncIterator[dict[str, Any]]], iter_fn)
+        async with aclosing(
+            self._stream(typed_iter_fn(**filters), self.order_mapper, limit)
+        ) as orders:
+            async for order in orders:
+                yield order
+
+    async def iter_assets(
+        self,
+        *,
+        limit: int | None = None,
+        status: str | None = None,
+        asset_class: str | None = None,
+        exchange: str | None = None,
+        attributes: list[str] | None = None,
+    ) -> AsyncIterator[Asset]:
+        """
+        Stream the provider's asset listing, stopping after `limit` assets.
+        Always reads from the provider, never from the asset catalog.
+        """
+        if self.asset_mapper is None:
+            raise ProviderError(
+                message=f"Assets not supported for provider {self.provider!r}",
+                domain="trading",
+                provider=self.provider,
+            )
+
+        filters = {
+            "status": status,
+            "asset_class": asset_class,
+            "exchange": exchange,
+            "attributes": attributes,
+        }
+
+        iter_fn = getattr(self.client, "iter_assets", None)
+        if iter_fn is None or not callable(iter_fn):
+            raw_list = await self.client.list_assets(**filters)
+            count = 0
+            for item in raw_list:
+                asset = self.asset_mapper(item)
+                if asset is None:
+                    continue
+                yield asset
+                count += 1
+                if limit and count >= limit:
+                    return
+            return
+
+        typed_iter_fn = cast(Callable[..., AsyncIterator[dict[str, Any]]], iter_fn)
+        async with aclosing(
+            self._stream(
+                typed_iter_fn(limit=limit, **filters), self.asset_mapper, limit
+            )
+        ) as assets:
+            async for asset in assets:
+                yield asset
+
     def _normalise_tool_filter(self, x: Iterable[str] | None) -> set[str]:
         if x is None:
             return set()
@@ -495,7 +953,7 @@ class TradingService(Sequence[Any]):
                 ],
             )
 
-        warnings.warn(msg, category=UserWarning, stacklevel=3)
+        warnings.warn(msg, category=UserWarning, stacklevel=4)
 
     # tools and bundling
     def tool_specs(
@@ -511,6 +969,24 @@ class TradingService(Sequence[Any]):
         inc = {self._canonicalise_tool_name(x) for x in inc}
         exc = {self._canonicalise_tool_name(x) for x in exc}
 
+        key = (
+            tuple(sorted(inc)),
+            tuple(sorted(exc)),
+            self.minimal,
+            tuple(self.fatal_tool_error_kinds),
+        )
+        cached = self._spec_cache.get(key)
+        if cached is not None:
+            return list(cached)
+
+        specs = self._filter_specs(self._all_provider_specs(), inc=inc, exc=exc)
+        self._spec_cache[key] = specs
+        return list(specs)
+
+    def _all_provider_specs(self) -> list[ToolSpec]:
+        if self._provider_specs is not None:
+            return self._provider_specs
+
         ts_self = cast("TradingService", self)
 
         if self.provider == "alpaca":
@@ -528,6 +1004,16 @@ class TradingService(Sequence[Any]):
                 provider=self.provider,
             )
 
+        self._provider_specs = specs
+        return specs
+
+    def _filter_specs(
+        self,
+        specs: list[ToolSpec],
+        *,
+        inc: set[str],
+        exc: set[str],
+    ) -> list[ToolSpec]:
         available = {t.name for t in specs}
 
         # validate names (warn or raise depending on strict/demo)
@@ -567,7 +1053,7 @@ class TradingService(Sequence[Any]):
                         },
                     ],
                 )
-            warnings.warn(msg, category=UserWarning, stacklevel=3)
+            warnings.warn(msg, category=UserWarning, stacklevel=4)
 
         return specs
 
@@ -599,14 +1085,46 @@ class TradingService(Sequence[Any]):
     def framework_tools(self) -> list[Any]:
         from opentools.core.frameworks import framework_tools as _fw_tools
 
-        return _fw_tools(self)
+        key = (self.framework, *self._config_signature())
+        cached = self._framework_tools_cache.get(key)
+        if cached is None:
+            cached = _fw_tools(self)
+            self._framework_tools_cache[key] = cached
+        return list(cached)
+
+    def _config_signature(self) -> tuple[Any, ...]:
+        return (
+            self.model,
+            tuple(self.include),
+            tuple(self.exclude),
+            self.minimal,
+            tuple(self.fatal_tool_error_kinds),
+        )
+
+    def _resolved_bundle(self) -> ToolBundle:
+        """
+        bundle() for the service's own configuration, memoized until
+        model/include/exclude/minimal/fatal kinds change.
+        """
+        sig = self._config_signature()
+        memo = self._default_bundle
+        if memo is not None and memo[0] == sig:
+            return memo[1]
+
+        bundle = self.bundle()
+        self._default_bundle = (sig, bundle)
+        return bundle
 
     @property
     def tools(self) -> list[Any]:
-        return self.bundle().tools
+        return self._resolved_bundle().tools
+
+    @property
+    def read_only_tools(self) -> frozenset[str]:
+        return self._resolved_bundle().read_only_tools
 
     async def call_tool(self, tool_name: str, tool_input: ToolInput) -> Any:
-        return await self.bundle().call(tool_name, tool_input)
+        return await self._resolved_bundle().call(tool_name, tool_input)
 
     # sequence, combining
     def _tool_list_for_iteration(self) -> list[Any]:
@@ -24,12 +24,29 @@ class MultiTradingService(Sequence[Any]):
     _bundle_cache: dict[
         tuple[ModelName, tuple[str, ...], tuple[str, ...]], ToolBundle
     ] = field(default_factory=dict, init=False, repr=False)
+    _default_bundle: tuple[tuple[Any, ...], ToolBundle] | None = field(
+        default=None, init=False, repr=False
+    )
+    _framework_tools_cache: dict[tuple[Any, ...], list[Any]] = field(
+        default_factory=dict, init=False, repr=False
+    )
 
     @property
     def provider(self) -> str:
         providers = {svc.provider for svc in self.services}
         return ",".join(sorted(providers))
 
+    # lifecycle
+    async def aclose(self) -> None:
+        for svc in self.services:
+            await svc.aclose()
+
+    async def __aenter__(self) -> "MultiTradingService":
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
     def _normalize_tool_filter(self, x: Iterable[str] | None) -> set[str]:
         # protect against include="get_account" -> {'g','e','t',...}
         if x is None:
@@ -163,14 +180,41 @@ class MultiTradingService(Sequence[Any]):
     def framework_tools(self) -> list[Any]:
         from opentools.core.frameworks import framework_tools as _fw_tools
 
-        return _fw_tools(self)
+        key = (self.framework, *self._config_signature())
+        cached = self._framework_tools_cache.get(key)
+        if cached is None:
+            cached = _fw_tools(self)
+            self._framework_tools_cache[key] = cached
+        return list(cached)
+
+    def _config_signature(self) -> tuple[Any, ...]:
+        return (
+            self.model,
+            tuple(self.include),
+            tuple(self.exclude),
+            tuple(svc._config_signature() for svc in self.services),
+        )
+
+    def _resolved_bundle(self) -> ToolBundle:
+        sig = self._config_signature()
+        memo = self._default_bundle
+        if memo is not None and memo[0] == sig:
+            return memo[1]
+
+        bundle = self.bundle()
+        self._default_bundle = (sig, bundle)
+        return bundle
 
     @property
     def tools(self) -> list[Any]:
-        return self.bundle().tools
+        return self._resolved_bundle().tools
+
+    @property
+    def read_only_tools(self) -> frozenset[str]:
+        return self._resolved_bundle().read_only_tools
 
     async def call_tool(self, tool_name: str, tool_input: ToolInput) -> Any:
-        return await self.bundle().call(tool_name, tool_input)
+        return await self._resolved_bundle().call(tool_name, tool_input)
 
     def _tool_list_for_iteration(self) -> list[Any]:
         if self.framework is not None:
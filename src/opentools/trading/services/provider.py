@@ -6,6 +6,8 @@ from typing import Any, Protocol
 class TradingProviderClient(Protocol):
     provider: str
 
+    async def aclose(self) -> None: ...
+
     # account
     async def get_account(self, account_uuid: str | None = None) -> dict: ...
 
@@ -20,6 +22,9 @@ class TradingProviderClient(Protocol):
     # positions
     async def list_positions(self) -> list[dict]: ...
     async def get_position(self, symbol_or_asset_id: str) -> dict: ...
+    async def get_positions(
+        self, symbols_or_asset_ids: list[str]
+    ) -> dict[str, dict]: ...
 
     # assets
     async def list_assets(
@@ -1,51 +1,142 @@
 from __future__ import annotations
 
-from typing import Any
+import types
+import typing
+from datetime import date, datetime
+from functools import partial
+from typing import Any, Callable
 
 from pydantic import BaseModel
 
 _INTERNAL_PREFIXES: tuple[str, ...] = ("_opentools_",)
 _DROP_KEYS = frozenset({"provider", "provider_fields"})
+_NO_DROP: frozenset[str] = frozenset()
 
+_SCALARS = (str, int, float, bool, datetime, date, type(None))
 
-def minimal(obj: Any, *, minimal: bool) -> Any:
-    seen: set[int] = set()
-
-    def _walk(x: Any) -> Any:
-        xid = id(x)
-        if xid in seen:
-            return "<recursion>"
-
-        if isinstance(x, BaseModel):
-            seen.add(xid)
-
-            model_out: dict[str, Any] = {}
-            for name in type(x).model_fields:
-                if minimal and name in _DROP_KEYS:
-                    continue
-                model_out[name] = _walk(getattr(x, name))
-
-            seen.remove(xid)
-            return model_out
+Serializer = Callable[[Any], Any]
 
-        if isinstance(x, dict):
-            dict_out: dict[str, Any] = {}
+# (model class, dropped field names) -> generated serializer
+_SERIALIZERS: dict[tuple[type, frozenset[str]], Serializer] = {}
 
-            for k, v in x.items():
-                if isinstance(k, str) and k.startswith(_INTERNAL_PREFIXES):
-                    continue
-                if minimal and k in _DROP_KEYS:
-                    continue
-                dict_out[k] = _walk(v)
 
-            return dict_out
-
-        if isinstance(x, list):
-            return [_walk(v) for v in x]
-
-        if isinstance(x, tuple):
-            return tuple(_walk(v) for v in x)
-
-        return x
-
-    return _walk(obj)
+def minimal(obj: Any, *, minimal: bool) -> Any:
+    return _walk(obj, _DROP_KEYS if minimal else _NO_DROP)
+
+
+def _walk(x: Any, drop: frozenset[str]) -> Any:
+    if isinstance(x, BaseModel):
+        return serializer_for(type(x), drop)(x)
+
+    if isinstance(x, dict):
+        return {
+            k: _walk(v, drop)
+            for k, v in x.items()
+            if not (
+                isinstance(k, str) and (k.startswith(_INTERNAL_PREFIXES) or k in drop)
+            )
+        }
+
+    if isinstance(x, list):
+        return [_walk(v, drop) for v in x]
+
+    if isinstance(x, tuple):
+        return tuple(_walk(v, drop) for v in x)
+
+    return x
+
+
+def _annotation_kind(annotation: Any) -> tuple[str, type | None]:
+    """
+    Classify a field annotation as ("scalar", None), ("model", cls),
+    ("models", cls) for list[cls], or ("any", None).
+    """
+    origin = typing.get_origin(annotation)
+
+    if origin is typing.Literal:
+        return "scalar", None
+
+    if origin in (typing.Union, types.UnionType):
+        kinds = {
+            _annotation_kind(a)
+            for a in typing.get_args(annotation)
+            if a is not type(None)
+        }
+        return kinds.pop() if len(kinds) == 1 else ("any", None)
+
+    if origin in (list, typing.List):
+        args = typing.get_args(annotation)
+        if (
+            len(args) == 1
+            and isinstance(args[0], type)
+            and issubclass(args[0], BaseModel)
+        ):
+            return "models", args[0]
+        return "any", None
+
+    if isinstance(annotation, type):
+        if issubclass(annotation, BaseModel):
+            return "model", annotation
+        if issubclass(annotation, _SCALARS):
+            return "scalar", None
+
+    return "any", None
+
+
+def _compile(cls: type[BaseModel], drop: frozenset[str]) -> Serializer:
+    walk = partial(_walk, drop=drop)
+    namespace: dict[str, Any] = {"_walk": walk}
+    entries: list[str] = []
+
+    for i, (name, info) in enumerate(cls.model_fields.items()):
+        if name in drop:
+            continue
+
+        value = f"d[{name!r}]"
+        kind, sub = _annotation_kind(info.annotation)
+
+        # provider_fields (dict[str, Any]) takes the generic walk, so
+        # _opentools_ keys are stripped at every depth of the raw payload
+        if kind == "scalar":
+            expr = value
+        elif kind == "model" and sub is not None and sub is not cls:
+            namespace[f"_c{i}"] = sub
+            namespace[f"_s{i}"] = serializer_for(sub, drop)
+            expr = f"(_s{i}({value}) if type({value}) is _c{i} else _walk({value}))"
+        elif kind == "models" and sub is not None and sub is not cls:
+            namespace[f"_c{i}"] = sub
+            namespace[f"_s{i}"] = serializer_for(sub, drop)
+            expr = (
+                f"([_s{i}(x) if type(x) is _c{i} else _walk(x) for x in {value}]"
+                f" if type({value}) is list else _walk({value}))"
+            )
+        else:
+            expr = f"_walk({value})"
+
+        entries.append(f"        {name!r}: {expr},")
+
+    source = "\n".join(
+        [
+            "def serialize(obj):",
+            "    d = obj.__dict__",
+            "    return {",
+            *entries,
+            "    }",
+        ]
+    )
+    exec(compile(source, f"<serializer {cls.__name__}>", "exec"), namespace)
+    return namespace["serialize"]
+
+
+def serializer_for(cls: type[BaseModel], drop: frozenset[str] = _NO_DROP) -> Serializer:
+    """
+    Return the cached serializer for `cls`: a generated function that reads
+    each field straight from the instance dict, passes scalars through,
+    calls nested models' serializers directly, and omits fields in `drop`.
+    """
+    key = (cls, drop)
+    fn = _SERIALIZERS.get(key)
+    if fn is None:
+        fn = _compile(cls, drop)
+        _SERIALIZERS[key] = fn
+    return fn
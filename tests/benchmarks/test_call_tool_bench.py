@@ -0,0 +1,65 @@
+from __future__ import annotations
+
+import asyncio
+import time
+from typing import Any
+
+import pytest
+
+from opentools.trading.providers.alpaca.mappers import (
+    account_from_alpaca,
+    clock_from_alpaca,
+    position_from_alpaca,
+)
+from opentools.trading.services import TradingService
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 2000
+
+
+class _StubClient:
+    provider = "alpaca"
+
+    async def get_account(self, account_uuid: str | None = None) -> dict[str, Any]:
+        return {"id": "acct", "status": "ACTIVE"}
+
+
+def _service() -> TradingService:
+    return TradingService(
+        client=_StubClient(),  # type: ignore[arg-type]
+        model="openai",
+        account_mapper=account_from_alpaca,
+        position_mapper=position_from_alpaca,
+        clock_mapper=clock_from_alpaca,
+    )
+
+
+async def _per_call_us(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        await fn()
+    return (time.perf_counter() - started) / ROUNDS * 1e6
+
+
+def test_call_tool_overhead():
+    service = _service()
+    name = next(n for n in service.bundle().dispatch if n.endswith("get_account"))
+
+    async def rebuild() -> None:
+        # the previous behaviour: provider specs rebuilt on every call
+        service._provider_specs = None
+        service._spec_cache.clear()
+        await service.bundle().call(name, {})
+
+    async def memoized() -> None:
+        await service.call_tool(name, {})
+
+    async def run() -> tuple[float, float]:
+        await memoized()
+        return await _per_call_us(rebuild), await _per_call_us(memoized)
+
+    before, after = asyncio.run(run())
+
+    print(f"\ncall_tool: rebuild {before:.1f}us/call, memoized {after:.1f}us/call")
+    assert after < before
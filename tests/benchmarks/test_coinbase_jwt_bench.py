@@ -0,0 +1,66 @@
+from __future__ import annotations
+
+import time
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from opentools.auth.coinbase_jwt import build_coinbase_jwt
+from opentools.auth.impl import CoinbaseAuth
+
+pytestmark = pytest.mark.benchmark
+
+ROUNDS = 300
+
+
+def _pem_secret() -> str:
+    key = ec.generate_private_key(ec.SECP256R1())
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+    # secrets usually arrive from env vars with escaped newlines
+    return pem.replace("\n", "\\n")
+
+
+def _per_call_us(fn) -> float:
+    started = time.perf_counter()
+    for _ in range(ROUNDS):
+        fn()
+    return (time.perf_counter() - started) / ROUNDS * 1e6
+
+
+def test_cached_private_key_jwt_build():
+    secret = _pem_secret()
+    auth = CoinbaseAuth(
+        api_key="organizations/x/apiKeys/y", api_secret=secret, host="api.coinbase.com"
+    )
+
+    def reparse() -> None:
+        build_coinbase_jwt(
+            key_name=auth.api_key,
+            key_secret=secret,
+            method="GET",
+            host=auth.host,
+            path="/api/v3/brokerage/accounts",
+        )
+
+    def cached() -> None:
+        build_coinbase_jwt(
+            key_name=auth.api_key,
+            private_key=auth.private_key,
+            method="GET",
+            host=auth.host,
+            path="/api/v3/brokerage/accounts",
+        )
+
+    cached()  # warm the key cache
+    before = _per_call_us(reparse)
+    after = _per_call_us(cached)
+
+    print(
+        f"\njwt build: reparse PEM {before:.1f}us/call, cached key {after:.1f}us/call"
+    )
+    assert after < before
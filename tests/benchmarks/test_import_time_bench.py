@@ -0,0 +1,46 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+
+import pytest
+
+pytestmark = pytest.mark.benchmark
+
+MODEL_SDKS = ("anthropic", "openai", "google.genai", "ollama")
+
+# generous: the point is to catch an eager SDK import (~1-3s), not jitter
+IMPORT_BUDGET_US = 1_000_000
+
+
+def _run(code: str) -> subprocess.CompletedProcess[str]:
+    env = {**os.environ, "PYTHONPATH": os.pathsep.join(p for p in sys.path if p)}
+    return subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+
+
+def test_import_opentools_does_not_load_model_sdks():
+    proc = _run(
+        f"import sys, opentools; print([m for m in {MODEL_SDKS!r} if m in sys.modules])"
+    )
+    assert proc.stdout.strip() == "[]"
+
+    # last line for the top-level package: "import time: self | cumulative | name"
+    cumulative_us = next(
+        int(line.split("|")[1])
+        for line in reversed(proc.stderr.splitlines())
+        if line.rstrip().endswith("| opentools")
+    )
+    print(f"\nimport opentools: {cumulative_us / 1000:.1f}ms cumulative")
+    assert cumulative_us < IMPORT_BUDGET_US
+
+
+def test_lazy_adapter_export_resolves():
+    proc = _run("import opentools; print(opentools.openai_chat.__name__)")
+    assert proc.stdout.strip() == "run_with_tools"
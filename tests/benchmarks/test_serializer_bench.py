@@ -0,0 +1,82 @@
+from __future__ import annotations
+
+import time
+from typing import Any
+
+import pytest
+from pydantic import BaseModel
+
+from opentools.trading.providers.alpaca.mappers import order_from_alpaca
+from opentools.trading.utils import _DROP_KEYS, _INTERNAL_PREFIXES, minimal
+
+from .test_mapper_bench import _raw_order
+
+pytestmark = pytest.mark.benchmark
+
+ORDERS = 10_000
+
+
+def _baseline_minimal(obj: Any, *, minimal: bool) -> Any:
+    # trading.utils.minimal as it was before compiled serializers, verbatim
+    seen: set[int] = set()
+
+    def _walk(x: Any) -> Any:
+        xid = id(x)
+        if xid in seen:
+            return "<recursion>"
+
+        if isinstance(x, BaseModel):
+            seen.add(xid)
+
+            model_out: dict[str, Any] = {}
+            for name in type(x).model_fields:
+                if minimal and name in _DROP_KEYS:
+                    continue
+                model_out[name] = _walk(getattr(x, name))
+
+            seen.remove(xid)
+            return model_out
+
+        if isinstance(x, dict):
+            dict_out: dict[str, Any] = {}
+
+            for k, v in x.items():
+                if isinstance(k, str) and k.startswith(_INTERNAL_PREFIXES):
+                    continue
+                if minimal and k in _DROP_KEYS:
+                    continue
+                dict_out[k] = _walk(v)
+
+            return dict_out
+
+        if isinstance(x, list):
+            return [_walk(v) for v in x]
+
+        if isinstance(x, tuple):
+            return tuple(_walk(v) for v in x)
+
+        return x
+
+    return _walk(obj)
+
+
+def _ms(fn, orders: list[Any], flag: bool) -> float:
+    started = time.perf_counter()
+    fn(orders, minimal=flag)
+    return (time.perf_counter() - started) * 1e3
+
+
+@pytest.mark.parametrize("flag", [False, True])
+def test_compiled_serializer_throughput(flag: bool):
+    orders = [order_from_alpaca(_raw_order(i)) for i in range(ORDERS)]
+
+    assert minimal(orders, minimal=flag) == _baseline_minimal(orders, minimal=flag)
+
+    before = min(_ms(_baseline_minimal, orders, flag) for _ in range(3))
+    after = min(_ms(minimal, orders, flag) for _ in range(3))
+
+    print(
+        f"\nminimal={flag} {ORDERS} orders: baseline {before:.1f}ms "
+        f"({ORDERS / before:.0f}/ms), compiled {after:.1f}ms ({ORDERS / after:.0f}/ms)"
+    )
+    assert after < before
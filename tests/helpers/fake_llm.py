@@ -0,0 +1,71 @@
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+from typing import Any, Callable, Sequence
+
+
+def tool_use(name: str, id: str, input: dict[str, Any] | None = None) -> Any:
+    return SimpleNamespace(type="tool_use", name=name, id=id, input=input or {})
+
+
+def text(value: str) -> Any:
+    return SimpleNamespace(type="text", text=value)
+
+
+class FakeService:
+    """
+    ToolRunner that answers every call with `result` and records the calls.
+    """
+
+    def __init__(
+        self,
+        result: Any = None,
+        *,
+        tools: list[Any] | None = None,
+        read_only_tools: frozenset[str] = frozenset(),
+        fatal_tool_error_kinds: tuple[str, ...] = ("auth", "config"),
+    ) -> None:
+        self.result = {"ok": True, "data": {}} if result is None else result
+        self.tools = [] if tools is None else tools
+        self.read_only_tools = read_only_tools
+        self.fatal_tool_error_kinds = fatal_tool_error_kinds
+        self.calls: list[tuple[str, dict]] = []
+
+    async def call_tool(self, name: str, tool_input: dict) -> Any:
+        self.calls.append((name, tool_input))
+        await asyncio.sleep(0)
+        return self.result
+
+
+class FakeMessages:
+    """
+    Anthropic `client.messages`: the n-th create() returns the n-th list of
+    content blocks in `replies` (the last one repeats), with usage(n) when
+    given. `requests` keeps every call's kwargs, `sent` a copy of the
+    message list as it was when sent.
+    """
+
+    def __init__(
+        self,
+        replies: Sequence[list[Any]],
+        *,
+        usage: Callable[[int], Any] | None = None,
+    ) -> None:
+        self.replies = replies
+        self.usage = usage
+        self.requests: list[dict[str, Any]] = []
+        self.sent: list[list[Any]] = []
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.requests.append(kwargs)
+        self.sent.append([dict(m) for m in kwargs["messages"]])
+        n = len(self.requests)
+        content = self.replies[min(n, len(self.replies)) - 1]
+        return SimpleNamespace(
+            content=content, usage=self.usage(n) if self.usage else None
+        )
+
+
+def anthropic_client(messages: FakeMessages) -> Any:
+    return SimpleNamespace(messages=messages)
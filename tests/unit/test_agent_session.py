@@ -0,0 +1,151 @@
+from __future__ import annotations
+
+import json
+from types import SimpleNamespace
+from typing import Any
+
+import pytest
+
+from opentools.adapters.models.openai.chat import run_with_tools
+from opentools.core.errors import ProviderError
+from opentools.core.session import AgentSession, HistoryPolicy
+from opentools.core.tools import ToolBundle, ToolSpec, tool_handler
+
+
+def _service(calls: list[str]) -> Any:
+    async def _list_positions() -> list[dict[str, Any]]:
+        calls.append("list_positions")
+        return [{"symbol": "BTC-USD", "qty": "0.5", "note": "x" * 400}]
+
+    spec = ToolSpec(
+        name="list_positions",
+        description="",
+        input_schema={"type": "object"},
+        handler=tool_handler(_list_positions),
+        read_only=True,
+    )
+    bundle = ToolBundle(tools=[{"type": "function"}], dispatch={spec.name: spec})
+
+    class _Service:
+        tools = bundle.tools
+        read_only_tools = bundle.read_only_tools
+
+        async def call_tool(self, name: str, tool_input: dict) -> Any:
+            return await bundle.call(name, tool_input)
+
+    return _Service()
+
+
+class _ToolCall:
+    def __init__(self, id: str, name: str) -> None:
+        self.id = id
+        self.function = SimpleNamespace(name=name, arguments="{}")
+
+    def model_dump(self) -> dict[str, Any]:
+        return {
+            "id": self.id,
+            "type": "function",
+            "function": {"name": self.function.name, "arguments": "{}"},
+        }
+
+
+class _Completions:
+    """
+    Every prompt gets one list_positions round, then a text reply.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[list[dict[str, Any]]] = []
+        self.fail = False
+
+    async def create(self, **kwargs: Any) -> Any:
+        if self.fail:
+            raise RuntimeError("boom")
+        messages = kwargs["messages"]
+        self.requests.append(json.loads(json.dumps(messages)))
+
+        if messages[-1]["role"] == "user":
+            message = SimpleNamespace(
+                content=None,
+                tool_calls=[_ToolCall(f"c{len(self.requests)}", "list_positions")],
+            )
+        else:
+            message = SimpleNamespace(content="reply", tool_calls=None)
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+
+
+def _session(completions: _Completions, calls: list[str], **kwargs: Any):
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    return AgentSession(run_with_tools, client, "m", _service(calls), **kwargs)
+
+
+async def test_history_and_memo_carry_across_turns():
+    completions = _Completions()
+    calls: list[str] = []
+    session = _session(completions, calls)
+
+    assert await session.ask("first") == "reply"
+    assert await session.ask("second") == "reply"
+
+    # the second prompt is sent after the whole first turn
+    second = completions.requests[2]
+    assert [m["role"] for m in second] == [
+        "user",
+        "assistant",
+        "tool",
+        "assistant",
+        "user",
+    ]
+    assert second[0]["content"] == "first"
+    assert second[3]["content"] == "reply"
+
+    # the read-only tool ran once; the second turn reused its result
+    assert calls == ["list_positions"]
+    assert session.memo is not None and session.memo.hits == 1
+    assert session.turns == 2
+    assert session.summary.rounds == 4
+    assert session.summary.memo_hits == 1
+
+
+async def test_old_tool_results_are_compacted_then_dropped():
+    completions = _Completions()
+    session = _session(
+        completions,
+        [],
+        # one turn is ~190 tokens, ~75 once its tool result is compacted
+        history=HistoryPolicy(max_tokens=300, keep_turns=1),
+        memo=None,
+    )
+
+    await session.ask("first")
+    await session.ask("second")
+    await session.ask("third")
+
+    # turn one's tool result was replaced before the third prompt went out
+    sent = completions.requests[4]
+    assert sent[0]["content"] == "first"
+    assert json.loads(sent[2]["content"])["_compacted"] is True
+    assert "BTC-USD" in sent[6]["content"]
+
+    await session.ask("fourth")
+
+    # compaction alone no longer fit the budget, so turn one was dropped
+    sent = completions.requests[6]
+    assert sent[0]["content"] == "second"
+    assert json.loads(sent[2]["content"])["_compacted"] is True
+    # the newest turn is kept intact
+    assert "BTC-USD" in sent[6]["content"]
+    assert session.turns == 3
+
+
+async def test_failed_turn_is_not_recorded():
+    completions = _Completions()
+    session = _session(completions, [])
+
+    await session.ask("first")
+    completions.fail = True
+    with pytest.raises(ProviderError):
+        await session.ask("second")
+
+    assert session.turns == 1
+    assert session.messages[-1] == {"role": "assistant", "content": "reply"}
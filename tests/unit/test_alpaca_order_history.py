@@ -0,0 +1,152 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import pytest
+import respx
+
+from opentools import trading
+from opentools.core.errors import ValidationError
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+
+_T0 = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _ts(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+# 1200 orders, two per second, so page edges land on shared timestamps
+_ORDERS = [
+    {
+        "id": f"o-{i:04d}",
+        "symbol": "AAPL",
+        "side": "buy",
+        "status": "filled",
+        "submitted_at": _ts(_T0 + timedelta(seconds=i // 2)),
+    }
+    for i in range(1200)
+]
+
+
+# like Alpaca, both `after` and `until` are exclusive
+def _parse(value: str) -> datetime:
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _orders_api(request: httpx.Request) -> httpx.Response:
+    params = request.url.params
+    rows = list(_ORDERS)
+    if "after" in params:
+        rows = [o for o in rows if _parse(o["submitted_at"]) > _parse(params["after"])]
+    if "until" in params:
+        rows = [o for o in rows if _parse(o["submitted_at"]) < _parse(params["until"])]
+    if params.get("direction", "desc") == "desc":
+        rows.reverse()
+    # both id cursors continue past that order in listing order
+    cursor_id = params.get("after_order_id") or params.get("before_order_id")
+    if cursor_id:
+        ids = [o["id"] for o in rows]
+        rows = rows[ids.index(cursor_id) + 1 :]
+    return httpx.Response(200, json=rows[: int(params.get("limit", 50))])
+
+
+def _service():
+    return trading.alpaca(
+        api_key="history-key", api_secret="secret", model="openai", rate_limit=None
+    )
+
+
+@respx.mock
+async def test_history_walks_past_the_500_cap():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/orders").mock(side_effect=_orders_api)
+
+    async with _service() as s:
+        ids = [o.id async for o in s.iter_orders(status="all")]
+
+    assert len(ids) == 1200
+    assert len(set(ids)) == 1200
+    assert ids[0] == "o-1199"
+    assert route.call_count == 3
+
+    async with _service() as s:
+        asc = [o.id async for o in s.iter_orders(direction="asc", limit=700)]
+
+    assert asc == [f"o-{i:04d}" for i in range(700)]
+
+
+@respx.mock
+async def test_windows_are_fetched_concurrently_in_order():
+    respx.get(f"{ALPACA_PAPER_URL}/v2/orders").mock(side_effect=_orders_api)
+
+    async with _service() as s:
+        ids = [
+            o.id
+            async for o in s.iter_orders(
+                direction="asc",
+                after=_ts(_T0 - timedelta(seconds=1)),
+                until=_ts(_T0 + timedelta(seconds=600)),
+                window=timedelta(seconds=60),
+                max_concurrency=4,
+            )
+        ]
+
+    assert ids == [o["id"] for o in _ORDERS]
+
+
+@respx.mock
+async def test_orders_on_a_window_boundary_are_kept():
+    respx.get(f"{ALPACA_PAPER_URL}/v2/orders").mock(side_effect=_orders_api)
+
+    # windows (T0, T0+5s) and (T0+5s, T0+10s); o-0010/o-0011 sit on T0+5s
+    async with _service() as s:
+        ids = [
+            o.id
+            async for o in s.iter_orders(
+                after=_ts(_T0),
+                until=_ts(_T0 + timedelta(seconds=10)),
+                window=timedelta(seconds=5),
+            )
+        ]
+
+    assert ids == [f"o-{i:04d}" for i in range(19, 1, -1)]
+
+
+@respx.mock
+async def test_history_can_walk_by_order_id():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/orders").mock(side_effect=_orders_api)
+
+    async with _service() as s:
+        ids = [o.id async for o in s.iter_orders(direction="asc", cursor="order_id")]
+
+    assert ids == [o["id"] for o in _ORDERS]
+    assert route.calls[1].request.url.params["after_order_id"] == "o-0499"
+
+
+@respx.mock
+async def test_a_window_streams_before_it_is_fully_fetched():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/orders").mock(side_effect=_orders_api)
+
+    # one window holding all three pages
+    async with _service() as s:
+        orders = s.iter_orders(
+            direction="asc",
+            after=_ts(_T0 - timedelta(seconds=1)),
+            until=_ts(_T0 + timedelta(seconds=600)),
+            window=timedelta(seconds=700),
+        )
+        first = await anext(orders)
+        await orders.aclose()
+
+    assert first.id == "o-0000"
+    assert route.call_count < 3
+
+
+async def test_order_history_extras_need_a_capable_provider():
+    s = trading.coinbase(bearer_token="extras-token", model="openai", rate_limit=None)
+
+    with pytest.raises(ValidationError):
+        await anext(s.iter_orders(cursor="order_id"))
+    with pytest.raises(ValidationError):
+        await anext(s.iter_orders(after=_ts(_T0), window=timedelta(hours=1)))
@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+from types import SimpleNamespace
+from typing import Any
+
+from opentools.adapters.models.anthropic.chat import run_with_tools
+from opentools.core.results import RunSummary
+from tests.helpers.fake_llm import (
+    FakeMessages,
+    FakeService,
+    anthropic_client,
+    text,
+    tool_use,
+)
+
+_TOOLS = [
+    {"name": "get_account", "description": "", "input_schema": {"type": "object"}},
+    {"name": "list_orders", "description": "", "input_schema": {"type": "object"}},
+]
+
+
+def _usage(n: int) -> Any:
+    return SimpleNamespace(
+        input_tokens=10,
+        output_tokens=5,
+        cache_creation_input_tokens=100 if n == 1 else 20,
+        cache_read_input_tokens=0 if n == 1 else 100,
+    )
+
+
+def _messages() -> FakeMessages:
+    # two get_account rounds, then an answer
+    return FakeMessages(
+        [
+            [tool_use("get_account", "t1")],
+            [tool_use("get_account", "t2")],
+            [text("done")],
+        ],
+        usage=_usage,
+    )
+
+
+def _breakpoints(messages: list[Any]) -> int:
+    return sum(
+        1
+        for m in messages
+        if isinstance(m.get("content"), list)
+        for b in m["content"]
+        if isinstance(b, dict) and "cache_control" in b
+    )
+
+
+async def test_tools_and_prefix_are_marked_cacheable():
+    messages = _messages()
+    summary = RunSummary()
+
+    await run_with_tools(
+        client=anthropic_client(messages),
+        model="m",
+        service=FakeService(tools=_TOOLS),
+        user_prompt="hi",
+        prompt_caching=True,
+        summary=summary,
+    )
+
+    requests = messages.requests
+    assert len(requests) == 3
+    for req in requests:
+        assert req["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+        assert "cache_control" not in req["tools"][0]
+        # one rolling breakpoint on the newest block
+        assert _breakpoints(req["messages"]) == 1
+        assert "cache_control" in req["messages"][-1]["content"][-1]
+
+    # the service's tool list is left untouched
+    assert all("cache_control" not in t for t in _TOOLS)
+
+    assert summary.cache_write_tokens == 140
+    assert summary.cache_read_tokens == 200
+    assert summary.input_tokens == 30
+
+
+async def test_caching_is_off_by_default():
+    messages = _messages()
+
+    await run_with_tools(
+        client=anthropic_client(messages),
+        model="m",
+        service=FakeService(tools=_TOOLS),
+        user_prompt="hi",
+    )
+
+    first = messages.requests[0]
+    assert first["tools"] is _TOOLS
+    assert first["messages"][0]["content"] == "hi"
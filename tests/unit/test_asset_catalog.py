@@ -0,0 +1,185 @@
+from __future__ import annotations
+
+import httpx
+import respx
+
+from opentools import trading
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+from opentools.trading.schemas import Asset
+from opentools.trading.services.catalog import AssetCatalog
+
+_ASSETS = [
+    {
+        "id": "a-aapl",
+        "symbol": "AAPL",
+        "name": "Apple Inc. Common Stock",
+        "exchange": "NASDAQ",
+        "class": "us_equity",
+        "asset_class": "us_equity",
+        "status": "active",
+        "tradable": True,
+        "fractionable": True,
+        "shortable": True,
+    },
+    {
+        "id": "a-aap",
+        "symbol": "AAP",
+        "name": "Advance Auto Parts Inc.",
+        "exchange": "NYSE",
+        "asset_class": "us_equity",
+        "status": "active",
+        "tradable": True,
+        "fractionable": False,
+        "shortable": True,
+    },
+    {
+        "id": "a-btc",
+        "symbol": "BTC/USD",
+        "name": "Bitcoin / US Dollar",
+        "exchange": "CRYPTO",
+        "asset_class": "crypto",
+        "status": "active",
+        "tradable": True,
+        "fractionable": True,
+        "shortable": False,
+    },
+    {
+        "id": "a-old",
+        "symbol": "OLDCO",
+        "name": "Delisted Co",
+        "exchange": "NYSE",
+        "asset_class": "us_equity",
+        "status": "inactive",
+        "tradable": False,
+        "fractionable": False,
+        "shortable": False,
+    },
+]
+
+
+def _service(asset_catalog: bool = True):
+    return trading.alpaca(
+        api_key="catalog-key",
+        api_secret="secret",
+        model="openai",
+        rate_limit=None,
+        asset_catalog=asset_catalog,
+    )
+
+
+@respx.mock
+async def test_lookups_are_answered_from_one_listing():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/assets").mock(
+        return_value=httpx.Response(200, json=_ASSETS)
+    )
+
+    async with _service() as s:
+        assert (await s.get_asset("aapl")).id == "a-aapl"
+        assert (await s.get_asset("a-btc")).symbol == "BTC/USD"
+        assert (await s.get_asset("BTC-USD")).id == "a-btc"
+
+        inactive = await s.list_assets(status="inactive", limit=None)
+        assert [a.symbol for a in inactive] == ["OLDCO"]
+
+        nyse = await s.list_assets(exchange="nyse", asset_class="us_equity")
+        assert [a.symbol for a in nyse] == ["AAP", "OLDCO"]
+
+        assert [a.symbol for a in await s.search_assets("AAP")] == ["AAP", "AAPL"]
+        assert [a.symbol for a in await s.search_assets("apple")] == ["AAPL"]
+        typo = await s.search_assets("APPL", fuzzy=True)
+        assert typo[0].symbol == "AAPL"
+        assert await s.search_assets("AAP", tradable=False) == []
+
+        out = await s.call_tool("alpaca_search_assets", {"query": "btc", "limit": 1})
+        assert [a["symbol"] for a in out["data"]] == ["BTC/USD"]
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_search_without_catalog_leaves_lookups_on_the_provider():
+    listing = respx.get(f"{ALPACA_PAPER_URL}/v2/assets").mock(
+        return_value=httpx.Response(200, json=_ASSETS)
+    )
+    lookup = respx.get(f"{ALPACA_PAPER_URL}/v2/assets/AAPL").mock(
+        return_value=httpx.Response(200, json=_ASSETS[0])
+    )
+
+    async with _service(asset_catalog=False) as s:
+        assert [a.symbol for a in await s.search_assets("AAP")] == ["AAP", "AAPL"]
+        assert (await s.get_asset("AAPL")).id == "a-aapl"
+        assert s.asset_catalog is None
+
+    assert listing.call_count == 1
+    assert lookup.call_count == 1
+
+
+def test_fuzzy_matches_fill_the_remaining_slots():
+    catalog = AssetCatalog()
+    catalog.apply(
+        Asset(provider="alpaca", symbol=symbol, tradable=True)
+        for symbol in ("MSFT", "MSFU", "MSFV", "MSTR")
+    )
+
+    # "MSFX" has no exact or prefix match; three close matches fit
+    found = catalog.search("MSFX", limit=3)
+    assert sorted(a.symbol for a in found) == ["MSFT", "MSFU", "MSFV"]
+
+    # the exact match takes one slot and is not offered again as a fuzzy one
+    found = catalog.search("MSFT", limit=2)
+    assert found[0].symbol == "MSFT"
+    assert len(found) == 2 and found[1].symbol != "MSFT"
+
+
+def test_apply_updates_indexes_incrementally():
+    catalog = AssetCatalog()
+    aapl = Asset(provider="alpaca", symbol="AAPL", exchange="NASDAQ", tradable=True)
+    msft = Asset(provider="alpaca", symbol="MSFT", exchange="NASDAQ", tradable=True)
+    catalog.apply([aapl, msft])
+    assert len(catalog.filter(exchange="NASDAQ")) == 2
+
+    halted = aapl.model_copy(update={"tradable": False})
+    catalog.apply([halted])
+
+    assert catalog.get("MSFT") is None
+    assert catalog.get("AAPL") is halted
+    assert catalog.filter(tradable=True) == []
+    assert catalog.filter(tradable=False) == [halted]
+    assert catalog.search("MS") == []
+
+
+async def test_failed_background_refresh_is_logged(caplog):
+    catalog = AssetCatalog(ttl_s=0.0)
+    aapl = Asset(provider="alpaca", symbol="AAPL", tradable=True)
+    await catalog.ensure(_loader([aapl]))
+
+    async def failing() -> list[Asset]:
+        raise RuntimeError("listing unavailable")
+
+    with caplog.at_level("WARNING", logger="opentools.trading.services.catalog"):
+        await catalog.ensure(failing)
+        assert catalog._loading is not None
+        await catalog._loading
+
+    assert "asset catalog refresh failed" in caplog.text
+    assert "listing unavailable" in caplog.text
+    # the previous snapshot is still served
+    assert catalog.get("AAPL") is aapl
+
+
+def test_fuzzy_search_scores_only_nearby_symbols():
+    catalog = AssetCatalog()
+    catalog.apply(
+        Asset(provider="alpaca", symbol=symbol, tradable=True)
+        for symbol in ("AAPL", "ABNB", "ZAPL", "MSFT")
+    )
+
+    assert catalog._fuzzy_candidates("APPL", None) == ["AAPL", "ABNB"]
+    assert [a.symbol for a in catalog.search("APPL")] == ["AAPL"]
+
+
+def _loader(assets: list[Asset]):
+    async def load() -> list[Asset]:
+        return assets
+
+    return load
@@ -0,0 +1,108 @@
+from __future__ import annotations
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import httpx
+import respx
+
+from opentools import trading
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+from opentools.trading.schemas import Clock
+from opentools.trading.services.clock import ClockCache
+
+
+def _iso(dt: datetime) -> str:
+    return dt.isoformat().replace("+00:00", "Z")
+
+
+@respx.mock
+async def test_clock_is_answered_locally_until_a_boundary():
+    now = datetime.now(timezone.utc)
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/clock").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "timestamp": _iso(now),
+                "is_open": True,
+                "next_open": _iso(now + timedelta(hours=20)),
+                "next_close": _iso(now + timedelta(hours=2)),
+            },
+        )
+    )
+
+    async with trading.alpaca(
+        api_key="clock-key",
+        api_secret="secret",
+        model="openai",
+        rate_limit=None,
+        clock_cache=True,
+    ) as s:
+        first = await s.get_clock()
+        for _ in range(4):
+            clock = await s.get_clock()
+
+    assert route.call_count == 1
+    assert clock.is_open is True
+    assert clock.timestamp is not None and clock.timestamp >= first.timestamp
+
+
+@respx.mock
+async def test_clock_refill_after_a_boundary_skips_the_response_cache():
+    now = datetime.now(timezone.utc)
+    responses = [
+        {
+            "timestamp": _iso(now),
+            "is_open": False,
+            "next_open": _iso(now + timedelta(seconds=0.2)),
+            "next_close": _iso(now + timedelta(hours=6)),
+        },
+        {
+            "timestamp": _iso(now + timedelta(seconds=0.3)),
+            "is_open": True,
+            "next_open": _iso(now + timedelta(hours=24)),
+            "next_close": _iso(now + timedelta(hours=6)),
+        },
+    ]
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/clock").mock(
+        side_effect=[httpx.Response(200, json=r) for r in responses]
+    )
+
+    async with trading.alpaca(
+        api_key="clock-boundary-key",
+        api_secret="secret",
+        model="openai",
+        rate_limit=None,
+        cache=True,
+        clock_cache=True,
+    ) as s:
+        assert (await s.get_clock()).is_open is False
+        await asyncio.sleep(0.3)
+        # the market opened: the pre-open response must not be replayed
+        assert (await s.get_clock()).is_open is True
+
+    assert route.call_count == 2
+
+
+def test_clock_cache_is_off_by_default():
+    s = trading.alpaca(api_key="k", api_secret="secret", model="openai")
+    assert s.clock_cache is None
+
+
+def test_boundary_and_max_age_force_refresh():
+    now = datetime.now(timezone.utc)
+    cache = ClockCache()
+    cache.store(
+        Clock(
+            is_open=False,
+            next_open=now + timedelta(minutes=5),
+            next_close=now + timedelta(hours=7),
+        )
+    )
+
+    assert cache.get(now) is not None
+    assert cache.get(now + timedelta(minutes=6)) is None
+
+    stale = ClockCache(max_age_s=-1.0)
+    stale.store(Clock(is_open=False, next_open=now + timedelta(hours=1)))
+    assert stale.get(now) is None
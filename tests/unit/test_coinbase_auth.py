@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+
+import jwt
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
+
+from opentools.auth.coinbase_jwt import SignedJWT
+from opentools.auth.impl import CoinbaseAuth
+from opentools.core.errors import AuthError
+
+ACCOUNTS = "/api/v3/brokerage/accounts"
+
+
+@pytest.fixture(scope="module")
+def key_pair():
+    key = ec.generate_private_key(ec.SECP256R1())
+    pem = key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.PKCS8,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
+    return pem, key.public_key()
+
+
+def _token(headers) -> str:
+    return headers["Authorization"].removeprefix("Bearer ")
+
+
+def _claims(token: str, public_key) -> dict:
+    return jwt.decode(token, key=public_key, algorithms=["ES256"])
+
+
+async def test_thread_signing_produces_valid_jwt(key_pair):
+    pem, public_key = key_pair
+    auth = CoinbaseAuth(api_key="k", api_secret=pem, host="h", signing="thread")
+
+    claims = _claims(
+        _token(await auth.headers(method="get", path=ACCOUNTS)), public_key
+    )
+
+    assert claims["uri"] == f"GET h{ACCOUNTS}"
+    assert claims["sub"] == "k"
+
+
+async def test_invalid_secret_is_auth_error():
+    auth = CoinbaseAuth(api_key="k", api_secret="nope", host="h", signing="thread")
+    with pytest.raises(AuthError):
+        await auth.headers(method="GET", path=ACCOUNTS)
+
+
+async def test_presigned_tokens_are_single_use(key_pair):
+    pem, public_key = key_pair
+    auth = CoinbaseAuth(
+        api_key="k", api_secret=pem, host="h", presign=(("GET", ACCOUNTS),)
+    )
+
+    first = _token(await auth.headers(method="GET", path=ACCOUNTS))
+    await asyncio.gather(*auth._tasks)
+    assert len(auth._presigned[("GET", ACCOUNTS)]) == auth.presign_depth
+
+    tokens = {first}
+    for _ in range(5):
+        tokens.add(_token(await auth.headers(method="GET", path=ACCOUNTS)))
+        await asyncio.gather(*auth._tasks)
+
+    assert len(tokens) == 6
+    for t in tokens:
+        assert _claims(t, public_key)["uri"] == f"GET h{ACCOUNTS}"
+
+
+async def test_presigned_tokens_near_expiry_are_discarded(key_pair):
+    pem, _ = key_pair
+    auth = CoinbaseAuth(
+        api_key="k", api_secret=pem, host="h", presign=(("GET", ACCOUNTS),)
+    )
+    stale = SignedJWT(token="stale", nbf=0, exp=1)
+    auth._presigned[("GET", ACCOUNTS)] = deque([stale])
+
+    token = _token(await auth.headers(method="GET", path=ACCOUNTS))
+
+    assert token != "stale"
+    await asyncio.gather(*auth._tasks)
+
+
+async def test_short_lived_presigned_tokens_are_still_used(key_pair):
+    pem, _ = key_pair
+    auth = CoinbaseAuth(
+        api_key="k",
+        api_secret=pem,
+        host="h",
+        expires_in=20,
+        presign=(("GET", ACCOUNTS),),
+    )
+
+    await auth.headers(method="GET", path=ACCOUNTS)
+    await asyncio.gather(*auth._tasks)
+    pooled = auth._presigned[("GET", ACCOUNTS)][0].token
+
+    assert _token(await auth.headers(method="GET", path=ACCOUNTS)) == pooled
+    await asyncio.gather(*auth._tasks)
+
+
+async def test_inline_signing_is_honoured_on_hot_paths(key_pair, monkeypatch):
+    pem, _ = key_pair
+    auth = CoinbaseAuth(
+        api_key="k", api_secret=pem, host="h", presign=(("GET", ACCOUNTS),)
+    )
+    off_loop: list[tuple[str, str]] = []
+    sign_off_loop = CoinbaseAuth._sign_off_loop
+
+    async def _recording(self, method, path):
+        off_loop.append((method, path))
+        return await sign_off_loop(self, method, path)
+
+    monkeypatch.setattr(CoinbaseAuth, "_sign_off_loop", _recording)
+
+    await auth.headers(method="GET", path=ACCOUNTS)
+    # the request itself was signed inline; only the refill leaves the loop
+    assert off_loop == []
+    await asyncio.gather(*auth._tasks)
+    assert off_loop == [("GET", ACCOUNTS)] * auth.presign_depth
+
+
+async def test_failed_refill_is_logged_and_can_be_retried(
+    key_pair, monkeypatch, caplog
+):
+    pem, _ = key_pair
+    auth = CoinbaseAuth(
+        api_key="k", api_secret=pem, host="h", presign=(("GET", ACCOUNTS),)
+    )
+
+    async def _failing(self, method, path):
+        raise RuntimeError("executor is gone")
+
+    monkeypatch.setattr(CoinbaseAuth, "_sign_off_loop", _failing)
+
+    with caplog.at_level("WARNING", logger="opentools.auth.impl"):
+        await auth.headers(method="GET", path=ACCOUNTS)
+        await asyncio.gather(*auth._tasks)
+
+    assert "presign refill failed for GET" in caplog.text
+    assert "executor is gone" in caplog.text
+    assert auth._refilling == {}
+
+    monkeypatch.undo()
+    await auth.headers(method="GET", path=ACCOUNTS)
+    await asyncio.gather(*auth._tasks)
+    assert len(auth._presigned[("GET", ACCOUNTS)]) == auth.presign_depth
+
+
+def test_refill_pending_on_a_closed_loop_is_rescheduled(key_pair):
+    pem, _ = key_pair
+    auth = CoinbaseAuth(
+        api_key="k", api_secret=pem, host="h", presign=(("GET", ACCOUNTS),)
+    )
+    key = ("GET", ACCOUNTS)
+
+    # the first loop closes before its refill ever runs
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(auth.headers(method="GET", path=ACCOUNTS))
+    for task in auth._tasks:
+        task.cancel()
+    auth._tasks.clear()
+    loop.close()
+    assert key in auth._refilling
+
+    async def _next_loop() -> None:
+        await auth.headers(method="GET", path=ACCOUNTS)
+        await asyncio.gather(*auth._tasks)
+
+    asyncio.run(_next_loop())
+    assert len(auth._presigned[key]) == auth.presign_depth
+    assert auth._refilling == {}
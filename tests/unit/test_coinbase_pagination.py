@@ -0,0 +1,169 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import pytest
+import respx
+
+from opentools import trading
+from opentools.core.pagination import cursor_page, paginate
+from opentools.trading.providers.coinbase._endpoints import (
+    ACCOUNTS_PATH,
+    COINBASE_LIVE_URL,
+    ORDERS_HISTORICAL_PATH,
+    PRODUCTS_PATH,
+)
+
+
+def _order(i: int) -> dict:
+    return {
+        "order_id": f"o-{i}",
+        "product_id": "BTC-USD",
+        "side": "BUY",
+        "status": "FILLED",
+    }
+
+
+def _orders_pages(request: httpx.Request) -> httpx.Response:
+    page = int(request.url.params.get("cursor") or 0)
+    return httpx.Response(
+        200,
+        json={
+            "orders": [_order(page * 2), _order(page * 2 + 1)],
+            "has_next": page < 2,
+            "cursor": str(page + 1),
+        },
+    )
+
+
+def _service(token: str):
+    return trading.coinbase(bearer_token=token, model="openai", rate_limit=None)
+
+
+@respx.mock
+async def test_iter_orders_follows_the_cursor():
+    route = respx.get(f"{COINBASE_LIVE_URL}{ORDERS_HISTORICAL_PATH}").mock(
+        side_effect=_orders_pages
+    )
+
+    async with _service("pages-token") as s:
+        orders = [o.id async for o in s.iter_orders()]
+
+    assert orders == [f"o-{i}" for i in range(6)]
+    assert route.call_count == 3
+
+
+@respx.mock
+async def test_iter_orders_stops_at_limit():
+    route = respx.get(f"{COINBASE_LIVE_URL}{ORDERS_HISTORICAL_PATH}").mock(
+        side_effect=_orders_pages
+    )
+
+    async with _service("limit-token") as s:
+        orders = [o.id async for o in s.iter_orders(limit=3)]
+
+    assert orders == ["o-0", "o-1", "o-2"]
+    # the second page was needed; a third is at most prefetched
+    assert 2 <= route.call_count <= 3
+
+
+@respx.mock
+async def test_iter_accounts_and_assets_walk_every_page():
+    respx.get(f"{COINBASE_LIVE_URL}{ACCOUNTS_PATH}").mock(
+        side_effect=[
+            httpx.Response(
+                200,
+                json={"accounts": [{"uuid": "a1"}], "has_next": True, "cursor": "c"},
+            ),
+            httpx.Response(200, json={"accounts": [{"uuid": "a2"}], "has_next": False}),
+        ]
+    )
+
+    def _products(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        size = int(request.url.params["limit"])
+        ids = [f"P{i}-USD" for i in range(offset, min(offset + size, 300))]
+        return httpx.Response(200, json={"products": [{"product_id": p} for p in ids]})
+
+    products = respx.get(f"{COINBASE_LIVE_URL}{PRODUCTS_PATH}").mock(
+        side_effect=_products
+    )
+
+    async with _service("walk-token") as s:
+        accounts = [a.id async for a in s.iter_accounts()]
+        assets = [a.symbol async for a in s.iter_assets()]
+
+    assert accounts == ["a1", "a2"]
+    assert len(assets) == 300
+    assert products.call_count == 2
+
+
+@respx.mock
+async def test_limited_asset_listing_fetches_one_right_sized_page():
+    def _products(request: httpx.Request) -> httpx.Response:
+        offset = int(request.url.params.get("offset", 0))
+        size = int(request.url.params["limit"])
+        ids = [f"P{i}-USD" for i in range(offset, offset + size)]
+        return httpx.Response(200, json={"products": [{"product_id": p} for p in ids]})
+
+    products = respx.get(f"{COINBASE_LIVE_URL}{PRODUCTS_PATH}").mock(
+        side_effect=_products
+    )
+
+    async with _service("sized-token") as s:
+        assets = await s.list_assets(limit=20)
+        assert len(assets) == 20
+        # no speculative second page
+        assert products.call_count == 1
+        assert products.calls.last.request.url.params["limit"] == "20"
+
+        streamed = [a.symbol async for a in s.iter_assets(limit=300)]
+        assert len(streamed) == 300
+
+    # more than one page is needed: two pages of 250
+    assert products.call_count == 3
+
+
+async def test_closing_early_cancels_the_prefetch():
+    started = asyncio.Event()
+    cancelled: list[Any] = []
+
+    async def fetch_page(token: Any) -> dict[str, Any]:
+        if token is None:
+            return {"orders": [{"i": 0}], "has_next": True, "cursor": "1"}
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.append(token)
+            raise
+        return {}
+
+    pages = paginate(fetch_page, cursor_page("orders"))
+    assert await anext(pages) == {"i": 0}
+    await started.wait()
+    await pages.aclose()
+
+    assert cancelled == ["1"]
+
+
+async def test_prefetch_cleanup_errors_are_not_swallowed():
+    started = asyncio.Event()
+
+    async def fetch_page(token: Any) -> dict[str, Any]:
+        if token is None:
+            return {"orders": [{"i": 0}], "has_next": True, "cursor": "1"}
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            raise RuntimeError("connection cleanup failed") from None
+        return {}
+
+    pages = paginate(fetch_page, cursor_page("orders"))
+    await anext(pages)
+    await started.wait()
+    with pytest.raises(RuntimeError, match="cleanup failed"):
+        await pages.aclose()
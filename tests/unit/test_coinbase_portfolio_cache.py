@@ -0,0 +1,117 @@
+from __future__ import annotations
+
+import httpx
+import respx
+
+from opentools import trading
+from opentools.trading.providers.coinbase._endpoints import (
+    COINBASE_LIVE_URL,
+    PORTFOLIOS_PATH,
+)
+
+
+def _portfolios(request: httpx.Request) -> httpx.Response:
+    if request.url.params.get("portfolio_type") == "DEFAULT":
+        return httpx.Response(200, json={"portfolios": [{"uuid": "pf-default"}]})
+    return httpx.Response(200, json={"portfolios": [{"uuid": "pf-undefined"}]})
+
+
+@respx.mock
+async def test_default_portfolio_uuid_is_resolved_once():
+    portfolios = respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}").mock(
+        side_effect=_portfolios
+    )
+    breakdown = respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}/pf-default").mock(
+        return_value=httpx.Response(
+            200, json={"breakdown": {"spot_positions": [{"asset": "BTC"}]}}
+        )
+    )
+
+    async with trading.coinbase(
+        bearer_token="pf-token", model="openai", rate_limit=None
+    ) as s:
+        await s.list_positions()
+        await s.list_positions()
+
+    # DEFAULT and UNDEFINED were queried together, once
+    assert portfolios.call_count == 2
+    assert breakdown.call_count == 2
+
+
+@respx.mock
+async def test_position_lookups_share_one_breakdown_fetch():
+    respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}").mock(side_effect=_portfolios)
+    breakdown = respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}/pf-default").mock(
+        return_value=httpx.Response(
+            200,
+            json={
+                "breakdown": {
+                    "spot_positions": [
+                        {"asset": "BTC", "product_id": "BTC-USD"},
+                        {"asset": "ETH", "product_id": "ETH-USD"},
+                    ]
+                }
+            },
+        )
+    )
+
+    async with trading.coinbase(
+        bearer_token="idx-token", model="openai", rate_limit=None
+    ) as s:
+        found = await s.get_positions(["btc/usd", "ETH-USD", "SOL-USD"])
+        single = await s.get_position("eth")
+
+    assert found["btc/usd"] is not None
+    assert found["ETH-USD"] is not None
+    assert found["SOL-USD"] is None
+    assert single is not None
+    assert breakdown.call_count == 1
+
+
+@respx.mock
+async def test_default_portfolio_survives_a_failed_undefined_lookup():
+    def _portfolios_undefined_fails(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("portfolio_type") == "DEFAULT":
+            return httpx.Response(200, json={"portfolios": [{"uuid": "pf-default"}]})
+        return httpx.Response(400, json={"message": "bad portfolio_type"})
+
+    respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}").mock(
+        side_effect=_portfolios_undefined_fails
+    )
+    breakdown = respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}/pf-default").mock(
+        return_value=httpx.Response(
+            200, json={"breakdown": {"spot_positions": [{"asset": "BTC"}]}}
+        )
+    )
+
+    async with trading.coinbase(
+        bearer_token="pf-fallback-token", model="openai", rate_limit=None, retry=None
+    ) as s:
+        positions = await s.list_positions()
+        transport = s.client.transport
+        assert transport.cached_portfolio_uuid(None) == "pf-default"
+
+    assert [p.symbol for p in positions] == ["BTC"]
+    assert breakdown.call_count == 1
+
+
+@respx.mock
+async def test_failed_default_lookup_falls_back_to_undefined():
+    def _portfolios_default_fails(request: httpx.Request) -> httpx.Response:
+        if request.url.params.get("portfolio_type") == "DEFAULT":
+            return httpx.Response(400, json={"message": "bad portfolio_type"})
+        return httpx.Response(200, json={"portfolios": [{"uuid": "pf-undefined"}]})
+
+    respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}").mock(
+        side_effect=_portfolios_default_fails
+    )
+    breakdown = respx.get(f"{COINBASE_LIVE_URL}{PORTFOLIOS_PATH}/pf-undefined").mock(
+        return_value=httpx.Response(200, json={"breakdown": {"spot_positions": []}})
+    )
+
+    async with trading.coinbase(
+        bearer_token="pf-fallback-2-token", model="openai", rate_limit=None, retry=None
+    ) as s:
+        assert await s.list_positions() == []
+
+    assert breakdown.call_count == 1
@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+from opentools import trading
+from opentools.core import frameworks
+
+
+def test_framework_tools_are_built_once_per_config(monkeypatch):
+    calls: list[object] = []
+
+    def fake_framework_tools(service):
+        calls.append(service)
+        return [spec.name for spec in service.tool_specs()]
+
+    monkeypatch.setattr(frameworks, "framework_tools", fake_framework_tools)
+
+    s = trading.alpaca(
+        api_key="fw-key", api_secret="secret", model="openai", framework="langgraph"
+    )
+    names = list(s)
+    assert len(s) == len(names)
+    assert s[0] == names[0]
+    assert len(calls) == 1
+
+    s.exclude = (names[0],)
+    assert names[0] not in list(s)
+    assert len(calls) == 2
+
+    multi = s + trading.coinbase(
+        bearer_token="fw-token", model="openai", framework="langgraph"
+    )
+    list(multi)
+    len(multi)
+    assert len(calls) == 3
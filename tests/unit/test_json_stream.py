@@ -0,0 +1,115 @@
+from __future__ import annotations
+
+import json
+import random
+
+import httpx
+import pytest
+import respx
+
+from opentools import trading
+from opentools.core.json_stream import JsonArrayStream
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+
+
+def _parse_in_chunks(text: str, size: int) -> list:
+    parser = JsonArrayStream()
+    out: list = []
+    for i in range(0, len(text), size):
+        out.extend(parser.feed(text[i : i + size]))
+    out.extend(parser.close())
+    return out
+
+
+def test_parser_handles_arbitrary_chunk_boundaries():
+    data = [{"symbol": f"S{i}", "n": i, "x": [1.5, None, "a,]"]} for i in range(50)]
+    data += [12345, "tail", True]
+    text = json.dumps(data, indent=random.choice([None, 2]))
+
+    for size in (1, 3, 7, 64, len(text)):
+        assert _parse_in_chunks(text, size) == data
+
+
+def test_parser_rejects_truncated_input():
+    parser = JsonArrayStream()
+    list(parser.feed('[{"a": 1}, {"b"'))
+    with pytest.raises(ValueError):
+        list(parser.close())
+
+
+@respx.mock
+async def test_list_assets_stops_reading_after_limit():
+    sent: list[int] = []
+
+    async def body():
+        yield b"["
+        for i in range(10_000):
+            sent.append(i)
+            sep = b"," if i else b""
+            yield sep + json.dumps({"id": f"id-{i}", "symbol": f"SYM{i}"}).encode()
+        yield b"]"
+
+    respx.get(f"{ALPACA_PAPER_URL}/v2/assets").mock(
+        return_value=httpx.Response(200, content=body())
+    )
+
+    async with trading.alpaca(
+        api_key="stream-key", api_secret="secret", model="openai", rate_limit=None
+    ) as s:
+        mapped: list[str] = []
+        mapper = s.asset_mapper
+        assert mapper is not None
+
+        def counting_mapper(item):
+            mapped.append(item["symbol"])
+            return mapper(item)
+
+        s.asset_mapper = counting_mapper
+        assets = await s.list_assets(limit=5)
+
+    assert [a.symbol for a in assets] == [f"SYM{i}" for i in range(5)]
+    assert len(sent) < 100
+    # each streamed item is mapped once
+    assert mapped == [f"SYM{i}" for i in range(5)]
+
+
+class _TrackedBody(httpx.AsyncByteStream):
+    def __init__(self, n: int) -> None:
+        self.n = n
+        self.closed = False
+
+    async def __aiter__(self):
+        yield b"["
+        for i in range(self.n):
+            sep = b"," if i else b""
+            yield sep + json.dumps({"id": f"id-{i}", "symbol": f"SYM{i}"}).encode()
+        yield b"]"
+
+    async def aclose(self) -> None:
+        self.closed = True
+
+
+@respx.mock
+async def test_response_is_closed_when_iteration_stops_early():
+    bodies: list[_TrackedBody] = []
+
+    def respond(request: httpx.Request) -> httpx.Response:
+        bodies.append(_TrackedBody(1_000))
+        return httpx.Response(200, stream=bodies[-1])
+
+    respx.get(f"{ALPACA_PAPER_URL}/v2/assets").mock(side_effect=respond)
+
+    async with trading.alpaca(
+        api_key="close-key", api_secret="secret", model="openai", rate_limit=None
+    ) as s:
+        await s.list_assets(limit=3)
+        # closed on the way out, not whenever the generator is finalised
+        assert bodies[-1].closed
+
+        assets = s.iter_assets()
+        async for _ in assets:
+            break
+        await assets.aclose()
+        assert bodies[-1].closed
+
+    assert len(bodies) == 2
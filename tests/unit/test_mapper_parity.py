@@ -0,0 +1,265 @@
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from datetime import datetime, timezone
+from typing import Any, Callable
+
+import pytest
+
+from opentools.trading.providers.alpaca import mappers as alpaca
+from opentools.trading.providers.coinbase import mappers as coinbase
+from opentools.trading.schemas import PortfolioHistoryPoint, set_strict_models
+
+_ALPACA_ORDER = {
+    "id": "order-1",
+    "client_order_id": "client-1",
+    "symbol": "AAPL",
+    "side": "buy",
+    "type": "limit",
+    "time_in_force": "day",
+    "status": "filled",
+    "qty": "1",
+    "filled_qty": "1",
+    "filled_avg_price": "187.12",
+    "limit_price": "187.50",
+    "submitted_at": "2024-05-01T14:30:00.123456Z",
+    "filled_at": "2024-05-01T14:30:01.654321Z",
+    "created_at": "2024-05-01T14:30:00.123456Z",
+    "updated_at": "2024-05-01T14:30:01.654321-04:00",
+    "asset_class": "us_equity",
+    "extended_hours": False,
+    "_opentools_seen": True,
+}
+
+_COINBASE_SPOT = {
+    "asset": "BTC",
+    "total_balance_crypto": 0.5,
+    "total_balance_fiat": 21000.5,
+    "average_entry_price": {"value": "40000", "currency": "USD"},
+    "unrealized_pnl": 1000,
+    "is_cash": False,
+}
+
+_COINBASE_PERP = {
+    "product_id": "BTC-PERP-INTX",
+    "position_side": "FUTURES_POSITION_SIDE_SHORT",
+    "net_size": "0.1",
+    "mark_price": {"userNativeCurrency": {"value": "42000", "currency": "USD"}},
+    "unrealized_pnl": {"rawCurrency": {"value": "-12.5", "currency": "USDC"}},
+    "vwap": {"userNativeCurrency": {"value": "41900", "currency": "USD"}},
+    "position_notional": {"userNativeCurrency": {"value": "4200", "currency": "USD"}},
+    "leverage": "2",
+}
+
+_COINBASE_FUTURE = {
+    "product_id": "BIT-31MAY24-CDE",
+    "side": "LONG",
+    "amount": "2",
+    "avg_entry_price": "60000",
+    "current_price": "61000",
+    "notional_value": "1220",
+    "unrealized_pnl": "20",
+    "expiry": "2024-05-31T16:00:00Z",
+}
+
+# (mapper, raw provider payload) for every public mapper
+_CASES: list[tuple[Callable[[dict[str, Any]], Any], dict[str, Any]]] = [
+    (
+        alpaca.account_from_alpaca,
+        {
+            "id": "acct-1",
+            "status": "ACTIVE",
+            "currency": "USD",
+            "cash": "1000",
+            "buying_power": "2000",
+            "equity": "1500",
+            "portfolio_value": "1500",
+            "created_at": "2023-01-02T03:04:05.678Z",
+            "pattern_day_trader": False,
+        },
+    ),
+    (
+        alpaca.position_from_alpaca,
+        {
+            "symbol": "AAPL",
+            "qty": "3",
+            "avg_entry_price": "150",
+            "current_price": "187",
+            "market_value": "561",
+            "unrealized_pl": "111",
+            "unrealized_plpc": "0.24",
+            "side": "long",
+            "exchange": "NASDAQ",
+        },
+    ),
+    (
+        alpaca.clock_from_alpaca,
+        {
+            "timestamp": "2024-05-01T10:30:00.123-04:00",
+            "is_open": True,
+            "next_open": "2024-05-02T09:30:00-04:00",
+            "next_close": "2024-05-01T16:00:00-04:00",
+        },
+    ),
+    (
+        alpaca.asset_from_alpaca,
+        {
+            "id": "asset-1",
+            "symbol": "AAPL",
+            "name": "Apple Inc.",
+            "exchange": "NASDAQ",
+            "asset_class": "us_equity",
+            "status": "active",
+            "tradable": True,
+            "marginable": True,
+            "shortable": True,
+            "easy_to_borrow": True,
+            "fractionable": True,
+            "maintenance_margin_requirement": 30,
+        },
+    ),
+    (alpaca.order_from_alpaca, _ALPACA_ORDER),
+    (
+        alpaca.portfolio_history_from_alpaca,
+        {
+            "timestamp": [1714560000, "2024-05-02T00:00:00Z", 1714732800],
+            "equity": [1000, "1010.5", None],
+            "profit_loss": [0, 10.5, None],
+            "profit_loss_pct": [0, 0.0105],
+            "timeframe": "1D",
+            "base_value": "1000",
+            "base_value_asof": "2024-05-01",
+        },
+    ),
+    (
+        coinbase.account_from_coinbase,
+        {
+            "uuid": "acct-1",
+            "name": "BTC Wallet",
+            "currency": "BTC",
+            "available_balance": {"value": "0.5", "currency": "BTC"},
+            "active": True,
+            "created_at": "2021-05-31T09:59:59.000Z",
+        },
+    ),
+    (
+        coinbase.order_from_coinbase,
+        {
+            "order_id": "ord-1",
+            "client_order_id": 42,
+            "product_id": "BTC-USD",
+            "side": "SELL",
+            "status": "FILLED",
+            "created_time": "2024-05-01T14:30:00.123Z",
+            "last_fill_time": "2024-05-01T15:30:00+01:00",
+            "order_type": "MARKET",
+            "time_in_force": "IMMEDIATE_OR_CANCEL",
+            "filled_size": 0.01,
+            "average_filled_price": "60000",
+            "fee": "1.2",
+        },
+    ),
+    (
+        coinbase.asset_from_coinbase,
+        {
+            "product_id": "BTC-USD",
+            "base_name": "Bitcoin",
+            "quote_name": "US Dollar",
+            "product_type": "SPOT",
+            "status": "online",
+            "trading_disabled": False,
+            "view_only": False,
+            "price": "60000",
+        },
+    ),
+    (
+        coinbase.portfolio_from_coinbase,
+        {"uuid": "pf-1", "name": "Default", "type": "DEFAULT", "deleted": False},
+    ),
+    (
+        coinbase.portfolio_breakdown_from_coinbase,
+        {
+            "portfolio": {"uuid": "pf-1", "name": "Default", "type": "DEFAULT"},
+            "portfolio_balances": {
+                "total_balance": {"value": "100", "currency": "USD"},
+                "total_crypto_balance": {"value": 80, "currency": "USD"},
+                "margin": "0",
+            },
+            "spot_positions": [_COINBASE_SPOT],
+            "perp_positions": [_COINBASE_PERP],
+            "futures_positions": [_COINBASE_FUTURE],
+        },
+    ),
+    (coinbase.position_from_coinbase, _COINBASE_SPOT),
+    (coinbase.spot_position_from_coinbase, _COINBASE_SPOT),
+    (coinbase.perp_position_from_coinbase, _COINBASE_PERP),
+    (coinbase.futures_position_from_coinbase, _COINBASE_FUTURE),
+    (coinbase.clock_from_coinbase, {"iso": "2024-05-01T00:00:00Z"}),
+]
+
+
+def _build(mapper: Callable[[dict[str, Any]], Any], raw: dict[str, Any], strict: bool):
+    previous = set_strict_models(strict)
+    try:
+        return mapper(raw)
+    finally:
+        set_strict_models(previous)
+
+
+@pytest.mark.parametrize(
+    ("mapper", "raw"), _CASES, ids=[mapper.__name__ for mapper, _ in _CASES]
+)
+def test_trusted_models_match_validated_models(mapper, raw):
+    trusted = _build(mapper, raw, strict=False)
+    validated = _build(mapper, raw, strict=True)
+
+    assert type(trusted) is type(validated)
+    assert trusted.model_dump() == validated.model_dump()
+
+
+@pytest.mark.parametrize("parse_dt", [alpaca._parse_dt, coinbase._parse_dt])
+def test_parse_dt_normalises_to_utc(parse_dt):
+    expected = datetime(2024, 5, 1, 14, 30, tzinfo=timezone.utc)
+
+    for raw in (
+        "2024-05-01T14:30:00Z",
+        "2024-05-01T14:30:00+00:00",
+        "2024-05-01T10:30:00-04:00",
+        # naive timestamps are taken as UTC
+        "2024-05-01T14:30:00",
+    ):
+        dt = parse_dt(raw)
+        assert dt == expected
+        assert dt.tzinfo is timezone.utc
+
+    assert parse_dt(None) is None
+    assert parse_dt("") is None
+
+
+def test_strict_models_env_catches_missing_required_fields():
+    # trusted() skips validation, so only strict mode notices the gap
+    assert PortfolioHistoryPoint.trusted(equity=1.0).equity == 1.0
+
+    code = (
+        "import pydantic\n"
+        "from opentools.trading.schemas import PortfolioHistoryPoint\n"
+        "try:\n"
+        "    PortfolioHistoryPoint.trusted(equity=1.0)\n"
+        "except pydantic.ValidationError as exc:\n"
+        "    print(exc.errors()[0]['loc'])\n"
+    )
+    env = {
+        **os.environ,
+        "PYTHONPATH": os.pathsep.join(p for p in sys.path if p),
+        "OPENTOOLS_STRICT_MODELS": "1",
+    }
+    proc = subprocess.run(
+        [sys.executable, "-c", code],
+        capture_output=True,
+        text=True,
+        env=env,
+        check=True,
+    )
+    assert proc.stdout.strip() == "('timestamp',)"
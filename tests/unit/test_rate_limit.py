@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+import time
+import warnings
+
+import pytest
+
+from opentools import trading
+from opentools.core.errors import RateLimitError
+from opentools.core.rate_limit import RateLimit, RateLimiter
+
+
+async def test_bucket_queues_until_tokens_refill():
+    limiter = RateLimiter(RateLimit(requests=20, per_s=1.0, burst=1))
+
+    started = time.monotonic()
+    await limiter.acquire()
+    await limiter.acquire()
+    await limiter.acquire()
+
+    assert time.monotonic() - started >= 0.09
+    assert limiter.throttled == 2
+
+
+async def test_bounded_wait_raises_rate_limit_error():
+    limiter = RateLimiter(
+        RateLimit(requests=1, per_s=10.0, burst=1, max_wait_s=0.5),
+        provider="alpaca",
+    )
+
+    await limiter.acquire()
+    with pytest.raises(RateLimitError) as exc_info:
+        await limiter.acquire()
+
+    assert exc_info.value.provider == "alpaca"
+    assert exc_info.value.retry_after_s is not None
+
+
+def test_429_halves_rate_and_honours_retry_after():
+    limiter = RateLimiter(RateLimit(requests=10, per_s=1.0, max_wait_s=0.1))
+
+    limiter.observe(status_code=429, retry_after_s=5.0)
+    assert limiter.current_rate == 5.0
+
+    with pytest.raises(RateLimitError):
+        limiter._reserve()
+
+    limiter._paused_until = 0.0
+    for _ in range(100):
+        limiter.observe(status_code=200, retry_after_s=None)
+    assert limiter.current_rate == 10.0
+
+
+def test_services_with_same_credentials_share_one_limiter():
+    def make(key: str):
+        return trading.alpaca(api_key=key, api_secret="secret", model="openai")
+
+    a, b, other = make("shared-key"), make("shared-key"), make("other-key")
+
+    limiter = a.client.transport.rate_limiter
+    assert limiter is not None
+    assert b.client.transport.rate_limiter is limiter
+    assert other.client.transport.rate_limiter is not limiter
+
+
+def test_conflicting_shared_limit_warns_and_keeps_the_first():
+    def make(limit: RateLimit):
+        return trading.alpaca(
+            api_key="conflict-key",
+            api_secret="secret",
+            model="openai",
+            rate_limit=limit,
+        )
+
+    first = make(RateLimit(requests=5))
+    limiter = first.client.transport.rate_limiter
+
+    with pytest.warns(UserWarning, match="already exists"):
+        second = make(RateLimit(requests=50))
+    assert second.client.transport.rate_limiter is limiter
+    assert limiter is not None and limiter.limit == RateLimit(requests=5)
+
+    # the same configuration again is silent
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        make(RateLimit(requests=5))
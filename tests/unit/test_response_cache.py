@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from opentools import trading
+from opentools.core.cache import ResponseCache
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+
+
+def _service(cache: ResponseCache | bool = True):
+    return trading.alpaca(
+        api_key="cache-key",
+        api_secret="secret",
+        model="openai",
+        rate_limit=None,
+        cache=cache,
+    )
+
+
+@respx.mock
+async def test_repeated_reads_cost_one_request():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(200, json={"id": "acct", "buying_power": "100"})
+    )
+
+    async with _service() as s:
+        for _ in range(5):
+            acct = await s.get_account()
+
+    assert acct.id == "acct"
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_invalidate_forces_refetch():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(200, json={"id": "acct"})
+    )
+
+    async with _service() as s:
+        await s.get_account()
+        assert s.invalidate_cache("get_account") == 1
+        await s.get_account()
+
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_stale_value_is_served_while_revalidating():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        side_effect=[
+            httpx.Response(200, json={"id": "old"}),
+            httpx.Response(200, json={"id": "new"}),
+        ]
+    )
+
+    cache = ResponseCache({"get_account": 0.0}, stale_s=60.0)
+    async with _service(cache) as s:
+        assert (await s.get_account()).id == "old"
+        # expired but within the stale window: served immediately
+        assert (await s.get_account()).id == "old"
+
+        # the background refresh stores with a long TTL from here on
+        cache.ttls["get_account"] = 60.0
+        while cache._refreshing:
+            await asyncio.sleep(0.01)
+
+        assert (await s.get_account()).id == "new"
+
+    assert route.call_count == 2
+    assert cache.stale_hits == 1
+
+
+async def test_failed_refresh_is_logged_and_stale_entry_expires(caplog):
+    cache = ResponseCache({"ep": 0.0}, stale_s=0.05)
+    calls = 0
+
+    async def fetch():
+        nonlocal calls
+        calls += 1
+        if calls > 1:
+            raise RuntimeError("upstream down")
+        return "old"
+
+    assert await cache.get_or_fetch((1,), endpoint="ep", fetch=fetch) == "old"
+
+    with caplog.at_level("WARNING", logger="opentools.core.cache"):
+        # within the stale window: served while the refresh fails
+        assert await cache.get_or_fetch((1,), endpoint="ep", fetch=fetch) == "old"
+        while cache._refreshing:
+            await asyncio.sleep(0.01)
+    assert "background refresh of ('ep', 1) failed" in caplog.text
+    assert "upstream down" in caplog.text
+
+    await asyncio.sleep(0.06)
+    # past stale_until the entry is evicted, not served
+    with pytest.raises(RuntimeError):
+        await cache.get_or_fetch((1,), endpoint="ep", fetch=fetch)
+    assert len(cache) == 0
+    assert cache.size_bytes == 0
+
+
+def test_lru_and_memory_bounds():
+    cache = ResponseCache({"ep": 60.0}, max_entries=2)
+
+    async def fill() -> None:
+        for i in range(3):
+            await cache.get_or_fetch((i,), endpoint="ep", fetch=_const(i))
+
+    asyncio.run(fill())
+    assert len(cache) == 2
+    assert ("ep", 0) not in cache._entries
+
+    tiny = ResponseCache({"ep": 60.0}, max_bytes=4)
+    asyncio.run(tiny.get_or_fetch((1,), endpoint="ep", fetch=_const("x" * 100)))
+    assert len(tiny) == 0
+
+
+def _const(value):
+    async def fetch():
+        return value
+
+    return fetch
@@ -0,0 +1,99 @@
+from __future__ import annotations
+
+import json
+
+from opentools.adapters.models.anthropic.chat import run_with_tools
+from opentools.core.results import ResultEncoder, ResultLimit, RunSummary
+from tests.helpers.fake_llm import (
+    FakeMessages,
+    FakeService,
+    anthropic_client,
+    text,
+    tool_use,
+)
+
+_ORDERS = {
+    "ok": True,
+    "data": [{"id": f"o-{i}", "symbol": "AAPL", "qty": "1"} for i in range(50)],
+}
+
+
+def test_compact_output_is_smaller_and_equivalent():
+    summary = RunSummary()
+    for backend in ("json", "orjson"):
+        text = ResultEncoder(backend=backend).encode(_ORDERS, summary=summary)
+        assert json.loads(text) == _ORDERS
+        assert "\n" not in text
+
+    assert summary.result_bytes < summary.baseline_bytes
+    assert summary.tokens_saved_estimate > 0
+
+
+def test_per_tool_limits_truncate_with_a_marker():
+    encoder = ResultEncoder(
+        limits={
+            "list_orders": ResultLimit(max_items=5),
+            "list_assets": ResultLimit(max_bytes=400),
+        }
+    )
+    summary = RunSummary()
+
+    by_count = json.loads(
+        encoder.encode(_ORDERS, tool_name="list_orders", summary=summary)
+    )
+    assert len(by_count["data"]) == 6
+    assert by_count["data"][-1] == {"_truncated": True, "omitted": 45}
+
+    text = encoder.encode(_ORDERS, tool_name="list_assets", summary=summary)
+    assert len(text.encode()) <= 400
+    assert json.loads(text)["data"][-1]["_truncated"] is True
+
+    untouched = json.loads(encoder.encode(_ORDERS, tool_name="get_account"))
+    assert untouched == _ORDERS
+    assert summary.truncated_results == 2
+
+
+async def test_adapter_uses_encoder_and_fills_summary():
+    messages = FakeMessages([[tool_use("list_orders", "t1")], [text("done")]])
+    summary = RunSummary()
+
+    reply = await run_with_tools(
+        client=anthropic_client(messages),
+        model="m",
+        service=FakeService(_ORDERS, fatal_tool_error_kinds=("auth",)),
+        user_prompt="orders?",
+        encoder=ResultEncoder(limits={"list_orders": ResultLimit(max_items=2)}),
+        summary=summary,
+    )
+
+    assert reply == "done"
+    assert summary.rounds == 2
+    assert summary.tool_calls == 1
+    assert summary.truncated_results == 1
+
+    tool_result = messages.sent[1][-1]["content"][0]["content"]
+    assert json.loads(tool_result)["data"][-1] == {"_truncated": True, "omitted": 48}
+
+
+def test_structured_results_count_truncations_but_not_bytes():
+    encoder = ResultEncoder(limits={"list_orders": ResultLimit(max_items=5)})
+    summary = RunSummary()
+
+    jsonable = encoder.to_jsonable(_ORDERS, tool_name="list_orders", summary=summary)
+
+    assert len(jsonable["data"]) == 6
+    assert summary.truncated_results == 1
+    # the provider serialises these itself: no size to compare against
+    assert summary.result_bytes == 0
+    assert summary.bytes_saved == 0
+
+
+def test_baseline_is_measured_when_read():
+    summary = RunSummary()
+    ResultEncoder().encode(_ORDERS, summary=summary)
+    assert summary._unmeasured == [_ORDERS]
+
+    expected = len(json.dumps(_ORDERS, indent=2).encode())
+    assert summary.baseline_bytes == expected
+    assert summary._unmeasured == []
+    assert summary.baseline_bytes == expected
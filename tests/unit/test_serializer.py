@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from opentools.trading.schemas import Order, PortfolioHistory, PortfolioHistoryPoint
+from opentools.trading.utils import minimal
+
+_PROVIDER_FIELDS = {
+    "_opentools_seen": True,
+    "extra": {"_opentools_x": 1, "provider": 2},
+    "legs": [{"_opentools_y": 1, "id": "leg-1"}],
+}
+
+
+def test_internal_keys_are_stripped_at_every_depth_of_provider_fields():
+    order = Order(provider="alpaca", id="o-1", provider_fields=_PROVIDER_FIELDS)
+
+    full = minimal(order, minimal=False)
+    assert full["provider_fields"] == {
+        "extra": {"provider": 2},
+        "legs": [{"id": "leg-1"}],
+    }
+    assert order.canonical_view() == full
+
+    # dropping `provider` also drops it from the raw payload
+    assert order.canonical_view(include_provider=False)["provider_fields"] == {
+        "extra": {},
+        "legs": [{"id": "leg-1"}],
+    }
+
+    slim = minimal(order, minimal=True)
+    assert "provider" not in slim and "provider_fields" not in slim
+    assert slim["id"] == "o-1"
+
+
+def test_nested_models_are_serialized():
+    history = PortfolioHistory(
+        points=[
+            PortfolioHistoryPoint(
+                timestamp=datetime(2024, 5, 1, tzinfo=timezone.utc), equity=1.0
+            )
+        ],
+        provider_fields={"raw": [{"_opentools_seen": True, "x": 1}]},
+    )
+
+    out = minimal([history], minimal=False)[0]
+    assert out["points"][0]["equity"] == 1.0
+    assert out["provider_fields"] == {"raw": [{"x": 1}]}
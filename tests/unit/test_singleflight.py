@@ -0,0 +1,74 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import respx
+
+from opentools import trading
+from opentools.core.singleflight import SingleFlight
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+
+
+async def _slow_account(request: httpx.Request) -> httpx.Response:
+    await asyncio.sleep(0.05)
+    return httpx.Response(200, json={"id": "acct", "status": "ACTIVE"})
+
+
+@respx.mock
+async def test_concurrent_identical_gets_share_one_round_trip():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(side_effect=_slow_account)
+
+    group = SingleFlight()
+    services = [
+        trading.alpaca(api_key="sf", api_secret="secret", model="openai")
+        for _ in range(2)
+    ]
+    for s in services:
+        s.client.transport.singleflight = group
+
+    results = await asyncio.gather(*(s.get_account() for s in services * 3))
+
+    assert route.call_count == 1
+    assert group.hits == 5
+    assert {a.id for a in results} == {"acct"}
+
+    await asyncio.gather(*(s.aclose() for s in services))
+
+
+@respx.mock
+async def test_different_credentials_are_not_coalesced():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(side_effect=_slow_account)
+
+    group = SingleFlight()
+    services = [
+        trading.alpaca(api_key=key, api_secret="secret", model="openai")
+        for key in ("sf-a", "sf-b")
+    ]
+    for s in services:
+        s.client.transport.singleflight = group
+
+    await asyncio.gather(*(s.get_account() for s in services))
+
+    assert route.call_count == 2
+    assert group.hits == 0
+
+    await asyncio.gather(*(s.aclose() for s in services))
+
+
+async def test_shared_results_are_copied_per_caller():
+    group = SingleFlight()
+    payload = {"positions": [{"symbol": "BTC-USD"}]}
+
+    async def fetch():
+        await asyncio.sleep(0.01)
+        return payload
+
+    first, second = await asyncio.gather(group.do("k", fetch), group.do("k", fetch))
+    first["positions"].append({"symbol": "ETH-USD"})
+
+    assert second == {"positions": [{"symbol": "BTC-USD"}]}
+    assert payload == {"positions": [{"symbol": "BTC-USD"}]}
+
+    # an unshared call is not copied
+    assert await group.do("k", fetch) is payload
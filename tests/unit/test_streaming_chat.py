@@ -0,0 +1,227 @@
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+from typing import Any
+
+from opentools.adapters.models.anthropic.chat import (
+    stream_with_tools as anthropic_stream,
+)
+from opentools.adapters.models.ollama.chat import run_with_tools as ollama_run
+from opentools.adapters.models.ollama.chat import stream_with_tools as ollama_stream
+from opentools.adapters.models.openai.chat import stream_with_tools as openai_stream
+from opentools.core.results import RunSummary
+
+
+class _Service:
+    tools: list[Any] = []
+
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+
+    async def call_tool(self, name: str, tool_input: dict) -> Any:
+        self.log.append(f"call:{name}")
+        return {"ok": True, "data": {"tool": name, "input": tool_input}}
+
+
+async def _drip(items: list[Any], log: list[str]):
+    for item in items:
+        # give already-dispatched tool calls a chance to start
+        for _ in range(3):
+            await asyncio.sleep(0)
+        yield item
+    log.append("stream_end")
+
+
+def _oa_chunk(content=None, tool_calls=None, finish=None) -> Any:
+    delta = SimpleNamespace(content=content, tool_calls=tool_calls)
+    return SimpleNamespace(choices=[SimpleNamespace(delta=delta, finish_reason=finish)])
+
+
+def _oa_tc(index: int, id=None, name=None, args=None) -> Any:
+    return SimpleNamespace(
+        index=index, id=id, function=SimpleNamespace(name=name, arguments=args)
+    )
+
+
+class _OpenAICompletions:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+        self.requests: list[dict[str, Any]] = []
+
+    async def create(self, **kwargs: Any) -> Any:
+        self.requests.append(kwargs)
+        if len(self.requests) == 1:
+            chunks = [
+                _oa_chunk(content="Checking"),
+                _oa_chunk(tool_calls=[_oa_tc(0, "c1", "get_account", '{"x":')]),
+                _oa_chunk(tool_calls=[_oa_tc(0, args=" 1}")]),
+                _oa_chunk(tool_calls=[_oa_tc(1, "c2", "list_orders", "{}")]),
+                _oa_chunk(content=None),
+                _oa_chunk(content=None),
+                _oa_chunk(finish="tool_calls"),
+            ]
+        else:
+            chunks = [
+                _oa_chunk(content="All "),
+                _oa_chunk(content="good", finish="stop"),
+            ]
+        return _drip(chunks, self.log)
+
+
+async def test_openai_stream_yields_text_and_dispatches_tools_early():
+    log: list[str] = []
+    completions = _OpenAICompletions(log)
+    client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    summary = RunSummary()
+
+    deltas = [
+        d
+        async for d in openai_stream(
+            client=client,  # type: ignore[arg-type]
+            model="m",
+            service=_Service(log),
+            user_prompt="hi",
+            summary=summary,
+        )
+    ]
+
+    assert "".join(deltas) == "CheckingAll good"
+    # the first call started while the response was still streaming
+    assert log.index("call:get_account") < log.index("stream_end")
+    assert summary.tool_calls == 2
+
+    history = completions.requests[1]["messages"]
+    assert history[1]["tool_calls"][0]["function"]["arguments"] == '{"x": 1}'
+    first_result = json.loads(history[2]["content"])
+    assert first_result["data"] == {"tool": "get_account", "input": {"x": 1}}
+    assert history[3]["tool_call_id"] == "c2"
+
+
+class _AnthropicStream:
+    def __init__(self, events: list[Any], final: Any, log: list[str]) -> None:
+        self._events = events
+        self._final = final
+        self._log = log
+
+    async def __aenter__(self) -> "_AnthropicStream":
+        return self
+
+    async def __aexit__(self, *exc: Any) -> None:
+        return None
+
+    def __aiter__(self):
+        return _drip(self._events, self._log)
+
+    async def get_final_message(self) -> Any:
+        return self._final
+
+
+class _AnthropicMessages:
+    def __init__(self, log: list[str]) -> None:
+        self.log = log
+        self.calls = 0
+
+    def stream(self, **kwargs: Any) -> _AnthropicStream:
+        self.calls += 1
+        if self.calls == 1:
+            tool = SimpleNamespace(
+                type="tool_use", name="get_account", id="t1", input={"a": 1}
+            )
+            events = [
+                SimpleNamespace(type="text", text="Let me look"),
+                SimpleNamespace(type="content_block_stop", content_block=tool),
+                SimpleNamespace(type="message_delta"),
+                SimpleNamespace(type="message_stop"),
+            ]
+            final = SimpleNamespace(
+                content=[tool], usage=SimpleNamespace(input_tokens=7)
+            )
+        else:
+            text = SimpleNamespace(type="text", text="done")
+            events = [SimpleNamespace(type="text", text="done")]
+            final = SimpleNamespace(content=[text], usage=None)
+        return _AnthropicStream(events, final, self.log)
+
+
+async def test_anthropic_stream_dispatches_on_block_stop():
+    log: list[str] = []
+    client = SimpleNamespace(messages=_AnthropicMessages(log))
+    summary = RunSummary()
+
+    deltas = [
+        d
+        async for d in anthropic_stream(
+            client=client,  # type: ignore[arg-type]
+            model="m",
+            service=_Service(log),
+            user_prompt="hi",
+            summary=summary,
+        )
+    ]
+
+    assert deltas == ["Let me look", "done"]
+    assert log.index("call:get_account") < log.index("stream_end")
+    assert summary.rounds == 2
+    assert summary.input_tokens == 7
+
+
+class _OllamaClient:
+    """
+    First reply calls get_account with unparseable arguments and list_orders
+    with valid ones; the second answers.
+    """
+
+    def __init__(self) -> None:
+        self.requests: list[dict[str, Any]] = []
+
+    def _message(self) -> Any:
+        if len(self.requests) == 1:
+            calls = [
+                {"function": {"name": "get_account", "arguments": '{"x": '}},
+                {"function": {"name": "list_orders", "arguments": '{"limit": 2}'}},
+            ]
+            return SimpleNamespace(role="assistant", content="", tool_calls=calls)
+        return SimpleNamespace(role="assistant", content="done", tool_calls=None)
+
+    async def chat(self, **kwargs: Any) -> Any:
+        self.requests.append({**kwargs, "messages": list(kwargs["messages"])})
+        message = self._message()
+        if kwargs["stream"]:
+            return _drip([SimpleNamespace(message=message)], [])
+        return SimpleNamespace(message=message)
+
+
+async def test_ollama_invalid_tool_args_are_reported_not_dispatched():
+    for stream in (False, True):
+        log: list[str] = []
+        client = _OllamaClient()
+        if stream:
+            parts = [
+                t
+                async for t in ollama_stream(
+                    client=client,  # type: ignore[arg-type]
+                    model="m",
+                    service=_Service(log),
+                    user_prompt="hi",
+                )
+            ]
+            assert "".join(parts) == "done"
+        else:
+            reply = await ollama_run(
+                client=client,  # type: ignore[arg-type]
+                model="m",
+                service=_Service(log),
+                user_prompt="hi",
+            )
+            assert reply == "done"
+
+        # only the call with valid arguments reached the service
+        assert log == ["call:list_orders"]
+
+        tool_msgs = [m for m in client.requests[1]["messages"] if m["role"] == "tool"]
+        bad, good = (json.loads(m["content"]) for m in tool_msgs)
+        assert bad["error"]["kind"] == "validation"
+        assert bad["error"]["message"] == "Invalid JSON in tool arguments."
+        assert good["data"] == {"tool": "list_orders", "input": {"limit": 2}}
@@ -0,0 +1,73 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import pytest
+
+from opentools.core.errors import ProviderError
+from opentools.core.tool_runner import run_tool_calls
+
+FATAL = ("auth", "config")
+
+
+def _ok(value: Any, delay: float = 0.0, log: list[Any] | None = None):
+    async def call() -> Any:
+        await asyncio.sleep(delay)
+        if log is not None:
+            log.append(value)
+        return {"ok": True, "data": value}
+
+    return call
+
+
+def _fatal(message: str, delay: float = 0.0):
+    async def call() -> Any:
+        await asyncio.sleep(delay)
+        return {"ok": False, "error": {"kind": "auth", "message": message}}
+
+    return call
+
+
+async def test_results_keep_call_order_and_run_concurrently():
+    finished: list[Any] = []
+    results = await run_tool_calls(
+        [
+            _ok("slow", 0.1, finished),
+            _ok("fast", 0.0, finished),
+            _ok("mid", 0.05, finished),
+        ],
+        fatal_kinds=FATAL,
+    )
+
+    assert [r["data"] for r in results] == ["slow", "fast", "mid"]
+    # run one after another, "slow" would finish first
+    assert finished == ["fast", "mid", "slow"]
+
+
+async def test_lowest_index_fatal_wins_and_later_calls_are_cancelled():
+    finished: list[Any] = []
+
+    with pytest.raises(ProviderError) as exc_info:
+        await run_tool_calls(
+            [
+                _ok("a", 0.0, finished),
+                _fatal("first", 0.05),
+                _fatal("second", 0.0),
+                _ok("late", 0.2, finished),
+            ],
+            fatal_kinds=FATAL,
+        )
+
+    assert exc_info.value.message == "first"
+    assert finished == ["a"]
+
+
+async def test_concurrency_cap_of_one_is_sequential():
+    order: list[Any] = []
+    await run_tool_calls(
+        [_ok(1, 0.02, order), _ok(2, 0.0, order)],
+        fatal_kinds=FATAL,
+        max_concurrency=1,
+    )
+    assert order == [1, 2]
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+from opentools.adapters.models.anthropic.chat import run_with_tools
+from opentools.core.memo import MemoizedRunner, ToolMemo
+from opentools.core.results import RunSummary
+from tests.helpers.fake_llm import (
+    FakeMessages,
+    FakeService,
+    anthropic_client,
+    text,
+    tool_use,
+)
+
+
+_OK = {"ok": True, "data": [{"symbol": "BTC-USD"}]}
+_ERROR = {"ok": False, "error": {"kind": "transient", "message": "x"}}
+
+
+def _service() -> FakeService:
+    return FakeService(_OK, read_only_tools=frozenset({"coinbase_list_positions"}))
+
+
+async def _run(service: FakeService, **kwargs: Any) -> RunSummary:
+    # coinbase_list_positions in two rounds, args in a different key order
+    # the second time, then an answer
+    args = {"currency": "USD", "portfolio_type": "DEFAULT"}
+    messages = FakeMessages(
+        [
+            [tool_use("coinbase_list_positions", "t1", args)],
+            [tool_use("coinbase_list_positions", "t2", dict(reversed(args.items())))],
+            [text("done")],
+        ]
+    )
+    summary = RunSummary()
+    await run_with_tools(
+        client=anthropic_client(messages),
+        model="m",
+        service=service,
+        user_prompt="hi",
+        summary=summary,
+        **kwargs,
+    )
+    return summary
+
+
+async def test_repeated_read_only_call_is_memoized_within_a_run():
+    service = _service()
+    summary = await _run(service, tool_memo=True)
+
+    assert len(service.calls) == 1
+    assert summary.memo_hits == 1
+    assert summary.tool_calls == 2
+
+
+async def test_memo_is_off_by_default_and_respects_ttl():
+    service = _service()
+    summary = await _run(service)
+    assert len(service.calls) == 2
+    assert summary.memo_hits == 0
+
+    service = _service()
+    summary = await _run(service, tool_memo=ToolMemo(ttl_s=0))
+    assert len(service.calls) == 2
+    assert summary.memo_hits == 0
+
+
+async def test_only_read_only_successes_are_memoized():
+    service = _service()
+    runner = MemoizedRunner(service, ToolMemo())
+
+    await runner.call_tool("coinbase_place_order", {"qty": 1})
+    await runner.call_tool("coinbase_place_order", {"qty": 1})
+    assert len(service.calls) == 2
+
+    service.result = _ERROR
+    await runner.call_tool("coinbase_list_positions", {})
+    service.result = _OK
+    await runner.call_tool("coinbase_list_positions", {})
+    await runner.call_tool("coinbase_list_positions", {})
+    assert len(service.calls) == 4
+    assert runner.memo.hits == 1
+
+
+async def test_concurrent_identical_calls_share_one_request():
+    service = _service()
+    summary = RunSummary()
+    runner = MemoizedRunner(service, ToolMemo(), summary=summary)
+
+    results = await asyncio.gather(
+        *(runner.call_tool("coinbase_list_positions", {}) for _ in range(3))
+    )
+
+    assert len(service.calls) == 1
+    assert results[0] is results[1] is results[2]
+    assert summary.memo_hits == 2
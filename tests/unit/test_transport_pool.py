@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import respx
+
+from opentools import trading
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+
+
+def _service():
+    return trading.alpaca(api_key="key", api_secret="secret", model="openai")
+
+
+@respx.mock
+async def test_pool_is_reused_across_requests():
+    respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(200, json={"id": "acct"})
+    )
+
+    async with _service() as s:
+        await s.get_account()
+        client = s.client.transport._client
+        await s.get_account()
+
+        assert client is not None
+        assert s.client.transport._client is client
+
+    assert client.is_closed
+
+
+@respx.mock
+async def test_pool_is_shared_by_base_url_and_closed_by_last_user():
+    respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(200, json={"id": "acct"})
+    )
+
+    a = _service()
+    b = _service()
+    await a.get_account()
+    await b.get_account()
+
+    pooled = a.client.transport._client
+    assert pooled is b.client.transport._client
+
+    await a.aclose()
+    assert not pooled.is_closed
+
+    await b.aclose()
+    assert pooled.is_closed
+
+
+@pytest.mark.parametrize("share_pool", [False, True])
+def test_pool_from_a_previous_loop_is_closed(share_pool: bool):
+    service = trading.alpaca(
+        api_key="loop-key",
+        api_secret="secret",
+        model="openai",
+        share_pool=share_pool,
+        rate_limit=None,
+    )
+    transport = service.client.transport
+
+    async def _request() -> httpx.AsyncClient:
+        with respx.mock:
+            respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+                return_value=httpx.Response(200, json={"id": "acct"})
+            )
+            await service.get_account()
+        client = transport._client
+        assert client is not None
+        return client
+
+    first = asyncio.run(_request())
+    assert not first.is_closed
+
+    async def _next_loop() -> httpx.AsyncClient:
+        client = await _request()
+        await asyncio.gather(*transport._closing)
+        return client
+
+    second = asyncio.run(_next_loop())
+    assert second is not first
+    assert first.is_closed
+
+    asyncio.run(service.aclose())
+    assert second.is_closed
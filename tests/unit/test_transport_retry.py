@@ -0,0 +1,127 @@
+from __future__ import annotations
+
+import time
+
+import httpx
+import pytest
+import respx
+
+from opentools import trading
+from opentools.core.errors import RateLimitError, TransientError
+from opentools.core.rate_limit import RateLimit
+from opentools.core.retry import RetryPolicy
+from opentools.trading.providers.alpaca._endpoints import ALPACA_PAPER_URL
+
+FAST = RetryPolicy(max_attempts=3, base_delay_s=0.0, jitter=False)
+
+
+def _service(retry: RetryPolicy | None = FAST):
+    return trading.alpaca(
+        api_key="key",
+        api_secret="secret",
+        model="openai",
+        retry=retry,
+        rate_limit=None,
+    )
+
+
+@respx.mock
+async def test_transient_get_is_retried():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        side_effect=[
+            httpx.Response(503, text="unavailable"),
+            httpx.Response(200, json={"id": "acct"}),
+        ]
+    )
+
+    async with _service() as s:
+        acct = await s.get_account()
+
+    assert acct.id == "acct"
+    assert route.call_count == 2
+
+
+@respx.mock
+async def test_factories_do_not_retry_by_default():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(503, text="unavailable")
+    )
+
+    async with trading.alpaca(
+        api_key="key", api_secret="secret", model="openai", rate_limit=None
+    ) as s:
+        assert s.client.transport.retry is None
+        with pytest.raises(TransientError):
+            await s.get_account()
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_gives_up_after_max_attempts():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(500, text="boom")
+    )
+
+    async with _service() as s:
+        with pytest.raises(TransientError):
+            await s.get_account()
+
+    assert route.call_count == FAST.max_attempts
+
+
+@respx.mock
+async def test_retry_after_beyond_deadline_is_not_waited_for():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(429, headers={"retry-after": "60"})
+    )
+
+    policy = RetryPolicy(max_attempts=5, base_delay_s=0.0, deadline_s=1.0)
+    async with _service(policy) as s:
+        with pytest.raises(RateLimitError) as exc_info:
+            await s.get_account()
+
+    assert exc_info.value.retry_after_s == 60.0
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_non_idempotent_methods_are_not_retried():
+    route = respx.post(f"{ALPACA_PAPER_URL}/v2/orders").mock(
+        return_value=httpx.Response(503)
+    )
+
+    async with _service() as s:
+        with pytest.raises(TransientError):
+            await s.client.transport.post_json("/v2/orders", json_body={})
+
+    assert route.call_count == 1
+
+
+@respx.mock
+async def test_client_side_throttle_is_not_retried_past_max_wait():
+    route = respx.get(f"{ALPACA_PAPER_URL}/v2/account").mock(
+        return_value=httpx.Response(200, json={"id": "acct"})
+    )
+
+    # the second request would queue ~2s for a token, well over max_wait_s
+    limit = RateLimit(requests=1, per_s=2.0, burst=1, max_wait_s=0.2)
+    service = trading.alpaca(
+        api_key="throttle-key",
+        api_secret="secret",
+        model="openai",
+        retry=RetryPolicy(max_attempts=5, base_delay_s=0.0, jitter=False),
+        rate_limit=limit,
+    )
+
+    async with service as s:
+        await s.get_account()
+
+        started = time.monotonic()
+        with pytest.raises(RateLimitError) as exc_info:
+            await s.get_account()
+        elapsed = time.monotonic() - started
+
+    assert exc_info.value.client_side
+    assert elapsed < limit.max_wait_s
+    assert route.call_count == 1